@@ -0,0 +1,102 @@
+"""
+Benchmark full versus streaming database extraction.
+
+Builds a large table in a local SQLite file (or any database reachable
+through a SQLAlchemy URL) and compares extract_from_database with
+extract_from_database_chunks in rows per second and peak traced memory.
+
+Usage:
+    python benchmarks/bench_extract_database.py --rows 2000000
+    python benchmarks/bench_extract_database.py --url postgresql://...
+"""
+
+import argparse
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Tuple
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+
+from fragua_sets.functions.extraction import (
+    extract_from_database,
+    extract_from_database_chunks,
+)
+
+TABLE_NAME = "bench_events"
+
+
+def populate(engine: Engine, rows: int) -> None:
+    """Create the benchmark table with `rows` synthetic rows."""
+    rng = np.random.default_rng(42)
+    batch = 250_000
+
+    for start in range(0, rows, batch):
+        size = min(batch, rows - start)
+        frame = pd.DataFrame(
+            {
+                "id": np.arange(start, start + size),
+                "amount": rng.random(size) * 1000,
+                "quantity": rng.integers(0, 100, size),
+                "city": rng.choice(["montevideo", "salto", "paysandu"], size),
+            }
+        )
+        frame.to_sql(
+            TABLE_NAME,
+            engine,
+            if_exists="replace" if start == 0 else "append",
+            index=False,
+        )
+
+
+def measure(run: Callable[[], int]) -> Tuple[int, float, int]:
+    """Run a benchmark and return rows read, seconds and peak bytes."""
+    tracemalloc.start()
+    started = time.perf_counter()
+    rows = run()
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return rows, elapsed, peak
+
+
+def main() -> None:
+    """Parse arguments, build the table and print the comparison."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--chunksize", type=int, default=50_000)
+    parser.add_argument("--url", default=None, help="SQLAlchemy database URL")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        url = args.url or f"sqlite:///{Path(tmp) / 'bench.db'}"
+        engine = create_engine(url)
+        populate(engine, args.rows)
+        query = f"SELECT * FROM {TABLE_NAME}"
+
+        def full() -> int:
+            return len(extract_from_database(engine, query))
+
+        def streamed() -> int:
+            chunks = extract_from_database_chunks(
+                engine, query, chunksize=args.chunksize
+            )
+            return sum(len(chunk) for chunk in chunks)
+
+        print(f"{'mode':<10}{'rows':>12}{'seconds':>10}{'rows/s':>14}{'peak MiB':>10}")
+        for name, run in (("full", full), ("streamed", streamed)):
+            rows, elapsed, peak = measure(run)
+            print(
+                f"{name:<10}{rows:>12,}{elapsed:>10.2f}"
+                f"{rows / elapsed:>14,.0f}{peak / 2**20:>10.1f}"
+            )
+
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Benchmark the import time of fragua_sets and check it stays lazy.
+
+Each statement runs in a fresh interpreter --repeat times; the best wall
+time is reported next to that of a bare interpreter, so the difference is
+the cost of the import itself. The first statement must not execute any of
+the heavy dependencies (pandas, numpy, SQLAlchemy, requests); the others
+show the cost paid on first use of FRAGUA_SETS and of pandas, next to
+that of importing pandas directly.
+
+The exit status is 1 if a heavy dependency was executed by the import or
+its cost exceeds --max-ms.
+
+Usage:
+    python benchmarks/bench_import.py
+    python benchmarks/bench_import.py --repeat 10 --max-ms 150
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+from typing import List, Tuple
+
+HEAVY_MODULES = ["pandas", "numpy", "sqlalchemy", "requests", "pyarrow"]
+
+STATEMENTS = [
+    "import fragua_sets",
+    "from fragua_sets import FRAGUA_SETS",
+    "from fragua_sets.functions.transformation import pd; pd.DataFrame()",
+    "import pandas",
+]
+
+# Prints the heavy modules that were actually executed; modules bound through
+# lazy_import are only imported on their first attribute access
+EXECUTED_PROBE = """
+import json, sys
+heavy = {modules!r}
+print(json.dumps([name for name in heavy if name in sys.modules]))
+"""
+
+
+def run(statement: str) -> float:
+    """Return the wall time of running a statement in a fresh interpreter."""
+    started = time.perf_counter()
+    subprocess.run([sys.executable, "-c", statement], check=True)
+    return time.perf_counter() - started
+
+
+def best_of(statement: str, repeat: int) -> float:
+    """Return the best wall time of a statement over several interpreters."""
+    return min(run(statement) for _ in range(repeat))
+
+
+def executed_modules(statement: str) -> List[str]:
+    """Return the heavy modules executed by a statement."""
+    probe = statement + "\n" + EXECUTED_PROBE.format(modules=HEAVY_MODULES)
+    output = subprocess.run(
+        [sys.executable, "-c", probe], check=True, capture_output=True, text=True
+    ).stdout
+    return list(json.loads(output.strip().splitlines()[-1]))
+
+
+def measure(repeat: int) -> Tuple[float, List[Tuple[str, float, List[str]]]]:
+    """Return the bare interpreter time and, per statement, its extra cost."""
+    bare = best_of("pass", repeat)
+    results = [
+        (statement, best_of(statement, repeat) - bare, executed_modules(statement))
+        for statement in STATEMENTS
+    ]
+    return bare, results
+
+
+def main() -> int:
+    """Run the import benchmark and check the lazy import budget."""
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--max-ms", type=float, default=200.0)
+    args = parser.parse_args()
+
+    bare, results = measure(args.repeat)
+    print(f"bare interpreter: {bare * 1000:.1f} ms")
+    print(f"{'statement':<76}{'ms':>8}  executed")
+    for statement, seconds, executed in results:
+        print(f"{statement:<76}{seconds * 1000:>8.1f}  {', '.join(executed) or '-'}")
+
+    statement, seconds, executed = results[0]
+    failures = []
+    if executed:
+        failures.append(f"'{statement}' executed {', '.join(executed)}")
+    if seconds * 1000 > args.max_ms:
+        failures.append(
+            f"'{statement}' took {seconds * 1000:.1f} ms > {args.max_ms} ms"
+        )
+
+    for failure in failures:
+        print(f"FAIL {failure}")
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,84 @@
+"""
+Benchmark database load strategies.
+
+Loads the same synthetic DataFrame into a fresh local SQLite file (or any
+database reachable through a SQLAlchemy URL) with load_to_database and
+each bulk_load_to_database strategy, and prints rows per second.
+
+Usage:
+    python benchmarks/bench_load_database.py --rows 1000000
+    python benchmarks/bench_load_database.py --url postgresql://... --strategies copy
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import create_engine
+
+from fragua_sets.functions.loading import bulk_load_to_database, load_to_database
+
+
+def build_frame(rows: int) -> pd.DataFrame:
+    """Build a synthetic frame mixing numeric and string columns."""
+    rng = np.random.default_rng(42)
+    return pd.DataFrame(
+        {
+            "id": np.arange(rows),
+            "amount": rng.random(rows) * 1000,
+            "quantity": rng.integers(0, 100, rows),
+            "city": rng.choice(["montevideo", "salto", "paysandu"], rows),
+        }
+    )
+
+
+def main() -> None:
+    """Parse arguments, run every strategy and print the comparison."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=500_000)
+    parser.add_argument("--url", default=None, help="SQLAlchemy database URL")
+    parser.add_argument(
+        "--strategies",
+        nargs="+",
+        default=["default", "executemany", "multi"],
+        help="'default' (load_to_database), 'executemany', 'multi' or 'copy'",
+    )
+    args = parser.parse_args()
+    frame = build_frame(args.rows)
+    results: List[str] = []
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for strategy in args.strategies:
+            url = args.url or f"sqlite:///{Path(tmp) / f'{strategy}.db'}"
+            engine = create_engine(url)
+
+            if strategy == "default":
+                started = time.perf_counter()
+                load_to_database(frame, engine, "bench_load", if_exists="replace")
+                seconds = time.perf_counter() - started
+            else:
+                report = bulk_load_to_database(
+                    frame,
+                    engine,
+                    "bench_load",
+                    if_exists="replace",
+                    strategy=strategy,
+                )
+                seconds = report["seconds"]
+
+            engine.dispose()
+            results.append(
+                f"{strategy:<12}{args.rows:>12,}{seconds:>10.2f}"
+                f"{args.rows / seconds:>14,.0f}"
+            )
+
+    print(f"{'strategy':<12}{'rows':>12}{'seconds':>10}{'rows/s':>14}")
+    print("\n".join(results))
+
+
+if __name__ == "__main__":
+    main()
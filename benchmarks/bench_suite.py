@@ -0,0 +1,256 @@
+"""
+Benchmark every function registered in FRAGUA_SETS and check for regressions.
+
+Each extraction, transformation and loading function runs on a synthetic
+frame at every requested size (see suite_cases.py for the cases and local
+fixtures). For each function and size the suite records the best wall time
+over --repeat runs after a warm-up, the throughput in rows per second and, unless
+--no-memory is given, the peak traced memory of one extra run.
+
+Results can be saved as a baseline and later runs compared against it; a
+function regresses when its time or peak memory grows by more than the
+given threshold. The exit status is 1 on regressions and 2 when a
+registered function has no benchmark case.
+
+Every run also times a fixed pandas workload (sort, group-by, CSV round
+trip) and stores each timing as a multiple of it ("relative"). Baselines
+are compared on these ratios, so a baseline saved on one machine is
+usable on another; ratios still shift somewhat with CPU, disk and
+library versions, so save a baseline on the comparing machine for tight
+thresholds. Results missing from the baseline are listed.
+
+benchmarks/baseline.json is a reference baseline at 10^4 and 10^5 rows.
+Regenerate it whenever cases are added or changed:
+
+    python benchmarks/bench_suite.py --save-baseline benchmarks/baseline.json
+
+Usage:
+    python benchmarks/bench_suite.py --rows 10000 100000 --save-baseline base.json
+    python benchmarks/bench_suite.py --rows 10000 100000 --baseline base.json
+    python benchmarks/bench_suite.py --rows 1000000 --only extract_from_csv
+"""
+
+import argparse
+import io
+import json
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from fragua_sets.sets import FRAGUA_SETS
+from suite_cases import BENCHMARKED_SETS, CASES, Fixture, Runner, build_frame
+
+Result = Dict[str, Any]
+
+
+def registered_functions() -> List[str]:
+    """Return the names of the functions in the benchmarked FRAGUA_SETS sets."""
+    return [
+        name
+        for fragua_set in FRAGUA_SETS
+        if fragua_set.name in BENCHMARKED_SETS
+        for name in fragua_set.list()
+    ]
+
+
+def run_once(runner: Runner) -> None:
+    """Run a case, draining chunk streams so all the work happens."""
+    result = runner()
+    if isinstance(result, Iterator):
+        for _ in result:
+            pass
+
+
+def calibrate(repeat: int) -> float:
+    """Return the best time of a fixed reference workload on this machine."""
+    frame = build_frame(100_000)
+
+    def workload() -> None:
+        frame.sort_values(["City", "Unit Price"])
+        frame.groupby("City")[["Unit Price", "Quantity"]].sum()
+        pd.read_csv(io.StringIO(frame.to_csv(index=False)))
+
+    seconds, _ = measure(workload, max(repeat, 3), memory=False)
+    return seconds
+
+
+def measure(runner: Runner, repeat: int, memory: bool) -> Tuple[float, Optional[int]]:
+    """Return the best wall time and the peak traced bytes of a case."""
+    # Warm-up run, which also builds the fixture inputs outside the timings
+    run_once(runner)
+
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run_once(runner)
+        timings.append(time.perf_counter() - started)
+
+    peak = None
+    if memory:
+        tracemalloc.start()
+        run_once(runner)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    return min(timings), peak
+
+
+def run_suite(
+    args: argparse.Namespace, names: List[str], calibration: float
+) -> Dict[str, Result]:
+    """Run the selected cases at every size and print one line per result."""
+    results: Dict[str, Result] = {}
+
+    with tempfile.TemporaryDirectory(prefix="fragua-bench-") as tmp:
+        for rows in args.rows:
+            frame = build_frame(rows, args.numeric_columns, args.string_columns)
+            fixture = Fixture(frame, Path(tmp) / str(rows))
+            try:
+                for name in names:
+                    case = CASES[name]
+                    if case.max_rows is not None and rows > case.max_rows:
+                        continue
+
+                    runner = case.prepare(fixture)
+                    seconds, peak = measure(runner, args.repeat, not args.no_memory)
+                    result = {
+                        "function": name,
+                        "rows": rows,
+                        "seconds": seconds,
+                        "relative": seconds / calibration,
+                        "rows_per_second": rows / seconds if seconds else None,
+                        "peak_bytes": peak,
+                    }
+                    results[f"{name}@{rows}"] = result
+                    print(format_result(result), flush=True)
+            finally:
+                fixture.close()
+
+    return results
+
+
+def format_result(result: Result) -> str:
+    """Format one result as a table row."""
+    peak = result["peak_bytes"]
+    peak_mib = f"{peak / 2**20:>10.1f}" if peak is not None else f"{'-':>10}"
+    return (
+        f"{result['function']:<42}{result['rows']:>10}"
+        f"{result['seconds']:>10.3f}{result['rows_per_second'] or 0:>14,.0f}{peak_mib}"
+    )
+
+
+def compare(
+    results: Dict[str, Result],
+    baseline: Dict[str, Result],
+    time_threshold: float,
+    memory_threshold: float,
+) -> List[str]:
+    """Return a description of every result that regressed against the baseline."""
+    regressions = []
+
+    for key, result in results.items():
+        base = baseline.get(key)
+        if base is None:
+            continue
+
+        # Compare machine-independent ratios when both runs have them
+        metric = "relative" if base.get("relative") else "seconds"
+        time_ratio = result[metric] / base[metric] if base[metric] else 1.0
+        if time_ratio > 1 + time_threshold:
+            regressions.append(
+                f"{key}: {metric} time {base[metric]:.3g} -> {result[metric]:.3g} "
+                f"(+{time_ratio - 1:.0%})"
+            )
+
+        if result["peak_bytes"] and base.get("peak_bytes"):
+            memory_ratio = result["peak_bytes"] / base["peak_bytes"]
+            if memory_ratio > 1 + memory_threshold:
+                regressions.append(
+                    f"{key}: peak memory {base['peak_bytes'] / 2**20:.1f} MiB -> "
+                    f"{result['peak_bytes'] / 2**20:.1f} MiB (+{memory_ratio - 1:.0%})"
+                )
+
+    return regressions
+
+
+def environment() -> Dict[str, str]:
+    """Describe the interpreter and library versions of a run."""
+    return {
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+    }
+
+
+def main() -> int:
+    """Parse arguments, run the suite and compare or save the results."""
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--numeric-columns", type=int, default=4)
+    parser.add_argument("--string-columns", type=int, default=2)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--only", nargs="+", help="run only these functions")
+    parser.add_argument("--no-memory", action="store_true")
+    parser.add_argument("--output", type=Path, help="write the results as JSON")
+    parser.add_argument("--baseline", type=Path, help="compare against this file")
+    parser.add_argument("--save-baseline", type=Path, help="save results as baseline")
+    parser.add_argument("--time-threshold", type=float, default=0.25)
+    parser.add_argument("--memory-threshold", type=float, default=0.25)
+    args = parser.parse_args()
+
+    registered = registered_functions()
+    missing = [name for name in registered if name not in CASES]
+    names = [name for name in registered if name in CASES]
+    if args.only:
+        names = [name for name in names if name in args.only]
+
+    calibration = calibrate(args.repeat)
+    print(f"pandas {pd.__version__}, numpy {np.__version__}")
+    print(f"calibration workload: {calibration:.3f}s")
+    print(f"{'function':<42}{'rows':>10}{'seconds':>10}{'rows/s':>14}{'peak MiB':>10}")
+    results = run_suite(args, names, calibration)
+    report = {
+        "environment": environment(),
+        "calibration_seconds": calibration,
+        "results": results,
+    }
+
+    for path in (args.output, args.save_baseline):
+        if path is not None:
+            path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+    status = 0
+    if args.baseline is not None:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))["results"]
+        regressions = compare(
+            results, baseline, args.time_threshold, args.memory_threshold
+        )
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        print(f"{len(regressions)} regression(s) against {args.baseline}")
+
+        unmatched = [key for key in results if key not in baseline]
+        if unmatched:
+            print(f"Not in the baseline, regenerate it: {', '.join(unmatched)}")
+        status = 1 if regressions else 0
+
+    if missing and not args.only:
+        print(f"No benchmark case for: {', '.join(missing)}")
+        status = status or 2
+
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,107 @@
+"""
+Benchmark a chain of transformations with and without copy elimination.
+
+Runs the same ten-step chain on a wide synthetic frame twice: calling each
+transformation directly (every step copies defensively) and through
+apply_transformations (one copy at the entry). Prints wall time and peak
+traced memory for both.
+
+Usage:
+    python benchmarks/bench_transformation_chain.py --rows 200000 --columns 200
+"""
+
+import argparse
+import time
+import tracemalloc
+from typing import Callable, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from fragua_sets.functions.transformation import (
+    TransformationStep,
+    apply_transformations,
+    capitalize_string_columns,
+    cast_column_to_numeric,
+    create_sum_column,
+    fill_missing_values,
+    fill_nulls_with_value,
+    normalize_column_names,
+    parse_datetime_column,
+    strip_string_columns,
+    strip_whitespace,
+)
+
+
+def build_frame(rows: int, columns: int) -> pd.DataFrame:
+    """Build a wide frame of numeric columns plus a few string columns."""
+    rng = np.random.default_rng(42)
+    data = {f"Value {i}": rng.random(rows) for i in range(columns)}
+    data["City"] = rng.choice([" montevideo ", "SALTO", "paysandu "], rows)
+    data["Status"] = rng.choice(["open", "closed", None], rows)
+    data["Created"] = pd.date_range("2024-01-01", periods=rows, freq="min").astype(str)
+    return pd.DataFrame(data)
+
+
+def chain() -> List[TransformationStep]:
+    """Return the ten-step benchmark chain."""
+    return [
+        normalize_column_names,
+        strip_whitespace,
+        strip_string_columns,
+        capitalize_string_columns,
+        (fill_nulls_with_value, {"column": "status", "value": "unknown"}),
+        (parse_datetime_column, {"column": "created"}),
+        (cast_column_to_numeric, {"column": "value_0"}),
+        (create_sum_column, {"col_a": "value_0", "col_b": "value_1", "new_col": "s"}),
+        (create_sum_column, {"col_a": "value_2", "col_b": "value_3", "new_col": "t"}),
+        fill_missing_values,
+    ]
+
+
+def run_direct(df: pd.DataFrame) -> pd.DataFrame:
+    """Call every step directly, as a pipeline of independent steps does."""
+    result = df
+    for step in chain():
+        func, kwargs = step if isinstance(step, tuple) else (step, {})
+        result = func(result, **kwargs)
+    return result
+
+
+def run_owned(df: pd.DataFrame) -> pd.DataFrame:
+    """Run the chain through apply_transformations."""
+    result = apply_transformations(df, chain())
+    assert isinstance(result, pd.DataFrame)
+    return result
+
+
+def measure(
+    run: Callable[[pd.DataFrame], pd.DataFrame], df: pd.DataFrame
+) -> Tuple[float, int]:
+    """Return seconds and peak traced bytes of one run."""
+    tracemalloc.start()
+    started = time.perf_counter()
+    run(df)
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main() -> None:
+    """Parse arguments, run both modes and print the comparison."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--columns", type=int, default=200)
+    args = parser.parse_args()
+    df = build_frame(args.rows, args.columns)
+
+    print(f"pandas {pd.__version__}")
+    print(f"{'mode':<8}{'seconds':>10}{'peak MiB':>10}")
+    for name, run in (("direct", run_direct), ("owned", run_owned)):
+        elapsed, peak = measure(run, df)
+        print(f"{name:<8}{elapsed:>10.2f}{peak / 2**20:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
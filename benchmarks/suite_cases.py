@@ -0,0 +1,450 @@
+"""
+Synthetic data, local fixtures and per-function cases for bench_suite.py.
+
+Every function registered in FRAGUA_SETS (extraction, transformation and
+loading sets) has an entry in CASES. A case receives a Fixture and returns
+a zero-argument callable that runs the function once; building the inputs
+(files, SQLite tables, stub server payloads) happens before timing starts.
+
+All I/O is local: files under a temporary directory, a SQLite database and
+a threaded stub HTTP server on 127.0.0.1.
+"""
+
+import threading
+from functools import cached_property
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable, Dict, NamedTuple, Optional
+from urllib.parse import parse_qs, urlparse
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+
+from fragua_sets.functions import extraction as ext
+from fragua_sets.functions import loading as load
+from fragua_sets.functions import transformation as tr
+from fragua_sets.utils.state import WatermarkStore
+
+PAGE_SIZE = 1_000
+API_PARTS = 8
+
+# FRAGUA_SETS sets whose functions must all have a case
+BENCHMARKED_SETS = ("extraction", "transformation", "loading")
+
+
+def build_frame(
+    rows: int,
+    numeric_columns: int = 4,
+    string_columns: int = 2,
+    seed: int = 42,
+) -> pd.DataFrame:
+    """
+    Build a synthetic frame with a configurable numeric/string mix.
+
+    The fixed columns are the ones the transformation cases refer to;
+    `numeric_columns` float and `string_columns` high-cardinality string
+    columns are appended to control width.
+    """
+    rng = np.random.default_rng(seed)
+    price = rng.random(rows) * 100
+    price[rng.random(rows) < 0.05] = np.nan
+
+    data: Dict[str, Any] = {
+        "id": np.arange(rows),
+        "Unit Price": price,
+        "Quantity": rng.integers(1, 50, rows),
+        "City": rng.choice([" montevideo ", "SALTO", "paysandu ", "Rivera"], rows),
+        "Status": rng.choice(["open", "closed", None], rows),
+        "Created": pd.date_range("2024-01-01", periods=rows, freq="s").astype(str),
+    }
+    for i in range(numeric_columns):
+        data[f"num_{i}"] = rng.random(rows)
+    for i in range(string_columns):
+        data[f"text_{i}"] = [f"value-{value}" for value in rng.integers(0, rows, rows)]
+
+    return pd.DataFrame(data)
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Serve precomputed JSON payloads of the benchmark frame."""
+
+    server: "StubServer"
+
+    def log_message(self, *args: Any) -> None:
+        """Silence request logging."""
+
+    def do_GET(self) -> None:
+        """Serve the whole frame, one page or one part of it."""
+        url = urlparse(self.path)
+        query = {key: values[0] for key, values in parse_qs(url.query).items()}
+
+        if url.path == "/records":
+            if self.headers.get("If-None-Match") == '"records"':
+                self.send_response(304)
+                self.end_headers()
+                return
+            self._send_json(self.server.records, {"ETag": '"records"'})
+        elif url.path == "/page":
+            page = int(query.get("page", 1)) - 1
+            pages = self.server.pages
+            self._send_json(pages[page] if page < len(pages) else _encode(None))
+        elif url.path.startswith("/part/"):
+            self._send_json(self.server.parts[int(url.path.rsplit("/", 1)[1])])
+        else:
+            self.send_error(404)
+
+    def do_POST(self) -> None:
+        """Accept and discard a payload."""
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self._send_json(b"{}")
+
+    def _send_json(self, body: bytes, headers: Optional[Dict[str, str]] = None) -> None:
+        """Write a JSON response."""
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class StubServer(ThreadingHTTPServer):
+    """Threaded stub HTTP server holding the encoded payloads."""
+
+    daemon_threads = True
+
+    def __init__(self, frame: pd.DataFrame) -> None:
+        super().__init__(("127.0.0.1", 0), StubHandler)
+        self.records = _encode(frame)
+        self.pages = [
+            _encode(frame.iloc[start : start + PAGE_SIZE])
+            for start in range(0, len(frame), PAGE_SIZE)
+        ]
+        self.parts = [
+            _encode(frame.iloc[positions])
+            for positions in np.array_split(np.arange(len(frame)), API_PARTS)
+        ]
+
+    @property
+    def url(self) -> str:
+        """Base URL of the server."""
+        return f"http://127.0.0.1:{self.server_port}"
+
+
+def _encode(frame: Optional[pd.DataFrame]) -> bytes:
+    """Encode a frame as {"data": [records...]}."""
+    records = "[]" if frame is None else frame.to_json(orient="records")
+    return f'{{"data": {records}}}'.encode("utf-8")
+
+
+class Fixture:
+    """Inputs of every case for one frame size, built on first use."""
+
+    def __init__(self, frame: pd.DataFrame, workdir: Path) -> None:
+        self.frame = frame
+        self.workdir = workdir
+        self.workdir.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def rows(self) -> int:
+        """Number of rows of the benchmark frame."""
+        return len(self.frame)
+
+    @cached_property
+    def csv_path(self) -> str:
+        """CSV copy of the frame."""
+        path = self.workdir / "frame.csv"
+        self.frame.to_csv(path, index=False)
+        return str(path)
+
+    @cached_property
+    def csv_shards(self) -> str:
+        """Glob pattern of the frame split over eight CSV files."""
+        directory = self.workdir / "shards"
+        directory.mkdir(exist_ok=True)
+        size = -(-len(self.frame) // 8)
+        for number, start in enumerate(range(0, len(self.frame), size)):
+            shard = self.frame.iloc[start : start + size]
+            shard.to_csv(directory / f"part-{number:02d}.csv", index=False)
+        return str(directory / "part-*.csv")
+
+    @cached_property
+    def excel_path(self) -> str:
+        """Excel copy of the frame, split over two sheets."""
+        path = self.workdir / "frame.xlsx"
+        half = len(self.frame) // 2
+        with pd.ExcelWriter(path) as writer:
+            self.frame.iloc[:half].to_excel(writer, sheet_name="first", index=False)
+            self.frame.iloc[half:].to_excel(writer, sheet_name="second", index=False)
+        return str(path)
+
+    @cached_property
+    def parquet_path(self) -> str:
+        """Parquet copy of the frame."""
+        path = self.workdir / "frame.parquet"
+        self.frame.to_parquet(path, index=False)
+        return str(path)
+
+    @cached_property
+    def feather_path(self) -> str:
+        """Feather copy of the frame."""
+        path = self.workdir / "frame.feather"
+        self.frame.to_feather(path)
+        return str(path)
+
+    @cached_property
+    def json_frame(self) -> pd.DataFrame:
+        """Frame without missing values, which plain JSON cannot encode."""
+        return self.frame.fillna({"Unit Price": 0.0, "Status": "unknown"})
+
+    @cached_property
+    def engine(self) -> Engine:
+        """SQLite database holding the frame in table 'frame'."""
+        engine = create_engine(f"sqlite:///{self.workdir / 'frame.sqlite'}")
+        self.frame.to_sql("frame", engine, index=False, if_exists="replace")
+        return engine
+
+    @cached_property
+    def server(self) -> StubServer:
+        """Running stub HTTP server serving the frame."""
+        server = StubServer(self.frame)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        return server
+
+    @cached_property
+    def store(self) -> WatermarkStore:
+        """Watermark store for the incremental extractions."""
+        return WatermarkStore(self.workdir / "state.json")
+
+    def close(self) -> None:
+        """Stop the server and dispose of the engine, if created."""
+        if "server" in self.__dict__:
+            self.server.shutdown()
+            self.server.server_close()
+        if "engine" in self.__dict__:
+            self.engine.dispose()
+
+
+Runner = Callable[[], Any]
+
+
+class Case(NamedTuple):
+    """Benchmark case: builds a runner from a fixture."""
+
+    prepare: Callable[[Fixture], Runner]
+    max_rows: Optional[int] = None
+
+
+def _full_csv_incremental(fx: Fixture) -> Runner:
+    """Read the whole CSV as a first incremental run."""
+
+    def run() -> pd.DataFrame:
+        fx.store.delete("bench-csv")
+        return ext.extract_from_csv_incremental(
+            fx.csv_path, store=fx.store, key="bench-csv"
+        )
+
+    return run
+
+
+def _full_database_incremental(fx: Fixture) -> Runner:
+    """Read the whole table as a first incremental run."""
+
+    def run() -> pd.DataFrame:
+        fx.store.delete("bench-db")
+        return ext.extract_from_database_incremental(
+            fx.engine,
+            "SELECT * FROM frame",
+            watermark_column="id",
+            store=fx.store,
+            key="bench-db",
+        )
+
+    return run
+
+
+def _transform(func: Callable[..., Any], **kwargs: Any) -> Case:
+    """Case applying a transformation to the benchmark frame."""
+    return Case(lambda fx: lambda: func(fx.frame, **kwargs))
+
+
+def _output(fx: Fixture, name: str) -> Dict[str, str]:
+    """Filename and subdir arguments writing into the fixture directory."""
+    return {"filename": name, "subdir": str(fx.workdir / "output")}
+
+
+EXTRACTION_CASES: Dict[str, Case] = {
+    "extract_from_excel": Case(
+        lambda fx: lambda: ext.extract_from_excel(fx.excel_path), max_rows=100_000
+    ),
+    "extract_from_excel_chunks": Case(
+        lambda fx: lambda: ext.extract_from_excel_chunks(fx.excel_path),
+        max_rows=100_000,
+    ),
+    "extract_from_excel_sheets": Case(
+        lambda fx: lambda: ext.extract_from_excel_sheets(fx.excel_path),
+        max_rows=100_000,
+    ),
+    "extract_from_csv": Case(lambda fx: lambda: ext.extract_from_csv(fx.csv_path)),
+    "extract_from_csv_files": Case(
+        lambda fx: lambda: ext.extract_from_csv_files(
+            fx.csv_shards, source_column="file"
+        )
+    ),
+    "extract_from_csv_chunks": Case(
+        lambda fx: lambda: ext.extract_from_csv_chunks(fx.csv_path)
+    ),
+    "extract_from_csv_incremental": Case(_full_csv_incremental),
+    "extract_from_parquet": Case(
+        lambda fx: lambda: ext.extract_from_parquet(fx.parquet_path)
+    ),
+    "extract_from_feather": Case(
+        lambda fx: lambda: ext.extract_from_feather(fx.feather_path)
+    ),
+    "extract_from_api": Case(
+        lambda fx: lambda: ext.extract_from_api(
+            f"{fx.server.url}/records", json_path="data"
+        ),
+        max_rows=1_000_000,
+    ),
+    "extract_from_api_paginated": Case(
+        lambda fx: lambda: ext.extract_from_api_paginated(
+            f"{fx.server.url}/page", json_path="data", page_size=PAGE_SIZE
+        ),
+        max_rows=1_000_000,
+    ),
+    "extract_from_api_many": Case(
+        lambda fx: lambda: ext.extract_from_api_many(
+            [f"{fx.server.url}/part/{i}" for i in range(API_PARTS)],
+            json_path="data",
+        ),
+        max_rows=1_000_000,
+    ),
+    "extract_from_database": Case(
+        lambda fx: lambda: ext.extract_from_database(fx.engine, "SELECT * FROM frame")
+    ),
+    "extract_from_database_chunks": Case(
+        lambda fx: lambda: ext.extract_from_database_chunks(
+            fx.engine, "SELECT * FROM frame"
+        )
+    ),
+    "extract_from_database_incremental": Case(_full_database_incremental),
+    "extract_from_database_partitioned": Case(
+        lambda fx: lambda: ext.extract_from_database_partitioned(
+            fx.engine, "SELECT * FROM frame", partition_column="id"
+        )
+    ),
+    "extract_from_database_partitioned_chunks": Case(
+        lambda fx: lambda: ext.extract_from_database_partitioned_chunks(
+            fx.engine, "SELECT * FROM frame", partition_column="id"
+        )
+    ),
+}
+
+TRANSFORMATION_CASES: Dict[str, Case] = {
+    "strip_whitespace": _transform(tr.strip_whitespace),
+    "fill_missing_values": _transform(tr.fill_missing_values),
+    "add_total_price_derived_column": _transform(
+        tr.add_total_price_derived_column, col_a="Unit Price", col_b="Quantity"
+    ),
+    "capitalize_string_columns": _transform(tr.capitalize_string_columns),
+    "drop_nulls_in_columns": _transform(tr.drop_nulls_in_columns, columns=["Status"]),
+    "normalize_column_names": _transform(tr.normalize_column_names),
+    "parse_datetime_column": _transform(tr.parse_datetime_column, column="Created"),
+    "filter_by_min_value": _transform(
+        tr.filter_by_min_value, column="Unit Price", min_value=50
+    ),
+    "create_sum_column": _transform(
+        tr.create_sum_column, col_a="Unit Price", col_b="Quantity", new_col="sum"
+    ),
+    "cast_column_to_numeric": _transform(tr.cast_column_to_numeric, column="Quantity"),
+    "select_columns": _transform(
+        tr.select_columns, columns=["id", "Unit Price", "City"]
+    ),
+    "rename_columns": _transform(tr.rename_columns, mapping={"City": "city"}),
+    "fill_nulls_with_value": _transform(
+        tr.fill_nulls_with_value, column="Status", value="unknown"
+    ),
+    "strip_string_columns": _transform(tr.strip_string_columns),
+    "normalize_string_columns": _transform(
+        tr.normalize_string_columns, case="capitalize"
+    ),
+    "optimize_memory": _transform(tr.optimize_memory),
+    "sort_by_column": _transform(tr.sort_by_column, column="Unit Price"),
+    "apply_transformations": _transform(
+        tr.apply_transformations,
+        steps=[
+            tr.normalize_column_names,
+            tr.strip_string_columns,
+            (tr.fill_nulls_with_value, {"column": "status", "value": "unknown"}),
+            tr.fill_missing_values,
+        ],
+    ),
+    "apply_transformations_parallel": _transform(
+        tr.apply_transformations_parallel,
+        steps=[
+            tr.strip_whitespace,
+            (tr.filter_by_min_value, {"column": "Unit Price", "min_value": 10}),
+            (tr.drop_nulls_in_columns, {"columns": ["Status"]}),
+            (tr.cast_column_to_numeric, {"column": "Quantity"}),
+            (
+                tr.create_sum_column,
+                {"col_a": "Unit Price", "col_b": "Quantity", "new_col": "sum"},
+            ),
+            tr.fill_missing_values,
+            (tr.sort_by_column, {"column": "Unit Price"}),
+        ],
+        max_workers=2,
+    ),
+}
+
+LOADING_CASES: Dict[str, Case] = {
+    "load_to_api": Case(
+        lambda fx: lambda: load.load_to_api(fx.json_frame, f"{fx.server.url}/ingest"),
+        max_rows=1_000_000,
+    ),
+    "load_to_api_batched": Case(
+        lambda fx: lambda: load.load_to_api_batched(
+            fx.frame, f"{fx.server.url}/ingest", batch_size=10_000
+        ),
+        max_rows=1_000_000,
+    ),
+    "load_to_csv": Case(
+        lambda fx: lambda: load.load_to_csv(fx.frame, **_output(fx, "frame.csv"))
+    ),
+    "load_to_database": Case(
+        lambda fx: lambda: load.load_to_database(
+            fx.frame, fx.engine, "loaded", if_exists="replace"
+        )
+    ),
+    "bulk_load_to_database": Case(
+        lambda fx: lambda: load.bulk_load_to_database(
+            fx.frame, fx.engine, "bulk_loaded", if_exists="replace"
+        )
+    ),
+    "load_to_excel": Case(
+        lambda fx: lambda: load.load_to_excel(
+            fx.frame, **_output(fx, "frame.xlsx"), constant_memory=True
+        ),
+        max_rows=100_000,
+    ),
+    "load_to_parquet": Case(
+        lambda fx: lambda: load.load_to_parquet(
+            fx.frame, **_output(fx, "frame.parquet")
+        )
+    ),
+    "load_to_feather": Case(
+        lambda fx: lambda: load.load_to_feather(
+            fx.frame, **_output(fx, "frame.feather")
+        )
+    ),
+}
+
+CASES: Dict[str, Case] = {
+    **EXTRACTION_CASES,
+    **TRANSFORMATION_CASES,
+    **LOADING_CASES,
+}
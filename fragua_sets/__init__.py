@@ -1,5 +1,38 @@
 """Fragua sets module."""
 
-from .sets import *
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from .utils import *
-from .functions import *
+from .utils.enums import __all__ as _enums_all
+
+if TYPE_CHECKING:
+    from .functions import (
+        EXTRACTION_FUNCTIONS,
+        LOADING_FUNCTIONS,
+        TRANSFORMATION_FUNCTIONS,
+        UTILITY_FUNCTIONS,
+    )
+    from .sets import FRAGUA_SETS
+
+# Attributes resolved on first access, so importing the package does not
+# import pandas, numpy, SQLAlchemy or requests
+_LAZY_ATTRIBUTES = {
+    "FRAGUA_SETS": ".sets",
+    "EXTRACTION_FUNCTIONS": ".functions",
+    "TRANSFORMATION_FUNCTIONS": ".functions",
+    "LOADING_FUNCTIONS": ".functions",
+    "UTILITY_FUNCTIONS": ".functions",
+}
+
+__all__ = [*_enums_all, *_LAZY_ATTRIBUTES]
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve the sets and function lists on first access."""
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+    globals()[name] = value
+    return value
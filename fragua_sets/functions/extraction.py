@@ -1,55 +1,518 @@
 """Extraction type functions."""
 
-from typing import Callable, Dict, List, Optional, Union, Any, cast
+from __future__ import annotations
 
-import requests
-from sqlalchemy.engine import Engine
+import asyncio
+import hashlib
+import importlib.util
+import json
+import os
+from collections import deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
+from datetime import date
+from functools import partial
+from io import BytesIO
+from itertools import islice
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+    cast,
+)
 
-import pandas as pd
+from fragua_sets.utils.cache import ExtractionCache
+from fragua_sets.utils.chunks import FrameChunks, Frames
+from fragua_sets.utils.files import PathSource, ReadTarget, expand_paths
+from fragua_sets.utils.http import AsyncHttpClient, create_session, run_coroutine
+from fragua_sets.utils.lazy import lazy_import
+from fragua_sets.utils.optional import import_optional
+from fragua_sets.utils.sql import quote_identifier, render_literal, subquery
+from fragua_sets.utils.state import WatermarkStore, resolve_store
 
-# pylint: disable=too-many-arguments
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+    import requests
+    from sqlalchemy.engine import Connection, Engine
+else:
+    np = lazy_import("numpy")
+    pd = lazy_import("pandas")
+    requests = lazy_import("requests")
+
+# pylint: disable=too-many-arguments,too-many-lines
+
+PartitionBound = Union[int, float, str, date]
+PaginationStrategy = Literal["page", "offset", "cursor", "link"]
+PageResult = Tuple["requests.Response", Any, int, "pd.DataFrame"]
+ColumnFilter = Tuple[str, str, Any]
+ColumnFilters = Union[List[ColumnFilter], List[List[ColumnFilter]]]
+StateStore = Union[str, "os.PathLike[str]", WatermarkStore]
 
 
 def extract_from_csv(
-    path: str,
+    path: PathSource,
     *,
     sep: str = ",",
     encoding: Optional[str] = None,
+    max_workers: Optional[int] = None,
+    source_column: Optional[str] = None,
+    columns: Optional[List[str]] = None,
+    filters: Optional[ColumnFilters] = None,
     **kwargs: Any,
 ) -> pd.DataFrame:
     """
-    Extract data from a CSV file into a pandas DataFrame.
+    Extract data from one or more CSV files into a pandas DataFrame.
 
-    This function is a thin wrapper around pandas.read_csv and is intended
-    to be used as an extraction primitive within Fragua pipelines.
+    A single file is a thin wrapper around pandas.read_csv. A glob
+    pattern or a list of paths reads every file, parsing them in worker
+    processes when there are several, and concatenates them in a
+    deterministic order: sorted glob matches, in the order of the list.
 
     Parameters
     ----------
     path:
-        Path to the CSV file.
+        Path to the CSV file, URL, open file or buffer, glob pattern
+        (e.g. 'shards/*.csv') or list of them. An existing file or a URL
+        is read as is, even if its name contains glob characters.
     sep:
         Column separator used in the CSV file.
     encoding:
         Optional file encoding (e.g. 'utf-8', 'latin-1').
+    max_workers:
+        Maximum number of worker processes for several files. Defaults
+        to one per file, up to the number of CPUs; 1 reads serially.
+    source_column:
+        Optional column added to each row with the path of its file.
+    columns:
+        Optional list of columns to return, in that order. Other columns
+        are not parsed.
+    filters:
+        Optional predicates such as [('amount', '>=', 100)], with the
+        semantics of extract_from_parquet plus a ('col', 'not null',
+        None) predicate. Files are then read in chunks that are filtered
+        as they are parsed, so discarded rows are never held together.
     **kwargs:
-        Additional keyword arguments forwarded to pandas.read_csv.
+        Additional keyword arguments forwarded to pandas.read_csv. They
+        must be picklable when files are read in worker processes.
 
     Returns
     -------
     pd.DataFrame
         DataFrame containing the extracted data.
     """
-    # Read CSV file using pandas
-    df = pd.read_csv(
+    paths = expand_paths(path)
+    read: Callable[[ReadTarget], pd.DataFrame] = partial(
+        _read_csv_file,
+        sep=sep,
+        encoding=encoding,
+        source_column=source_column,
+        columns=columns,
+        filters=filters,
+        **kwargs,
+    )
+
+    # Read a single file in-process, as before
+    if len(paths) == 1:
+        return read(paths[0])
+
+    workers = max_workers or min(len(paths), os.cpu_count() or 1)
+    if workers <= 1:
+        frames = [read(file_path) for file_path in paths]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            frames = list(executor.map(read, paths))
+
+    if not frames:
+        return pd.DataFrame()
+
+    return pd.concat(frames, ignore_index=True)
+
+
+def extract_from_csv_files(
+    path: PathSource,
+    *,
+    sep: str = ",",
+    encoding: Optional[str] = None,
+    max_workers: Optional[int] = None,
+    source_column: Optional[str] = None,
+    columns: Optional[List[str]] = None,
+    filters: Optional[ColumnFilters] = None,
+    **kwargs: Any,
+) -> FrameChunks:
+    """
+    Extract several CSV files as a stream of one DataFrame per file.
+
+    Files are parsed in worker processes and yielded as they complete,
+    so the first ones can be transformed or loaded while the rest are
+    still being read. At most two files per worker are read ahead of
+    the consumer, keeping memory bounded with hundreds of files.
+
+    Parameters
+    ----------
+    path:
+        Path to a CSV file, URL, open file, glob pattern (e.g.
+        'shards/*.csv') or list of them, as in extract_from_csv.
+    sep:
+        Column separator used in the CSV files.
+    encoding:
+        Optional file encoding (e.g. 'utf-8', 'latin-1').
+    max_workers:
+        Maximum number of worker processes. Defaults to one per file,
+        up to the number of CPUs.
+    source_column:
+        Optional column added to each row with the path of its file.
+        Since files arrive in completion order, use it to tell them
+        apart.
+    columns:
+        Optional list of columns to return, as in extract_from_csv.
+    filters:
+        Optional row predicates, as in extract_from_csv.
+    **kwargs:
+        Additional picklable keyword arguments forwarded to
+        pandas.read_csv.
+
+    Returns
+    -------
+    Iterator[pd.DataFrame]
+        Iterator yielding one DataFrame per file, in completion order.
+    """
+    paths = expand_paths(path)
+    read: Callable[[ReadTarget], pd.DataFrame] = partial(
+        _read_csv_file,
+        sep=sep,
+        encoding=encoding,
+        source_column=source_column,
+        columns=columns,
+        filters=filters,
+        **kwargs,
+    )
+    workers = max_workers or min(len(paths), os.cpu_count() or 1)
+
+    return _stream_files(read, paths, max(workers, 1))
+
+
+def _stream_files(
+    read: Callable[[ReadTarget], pd.DataFrame],
+    paths: List[ReadTarget],
+    max_workers: int,
+) -> FrameChunks:
+    """Yield file frames in completion order from a process pool."""
+    executor = ProcessPoolExecutor(max_workers=max_workers)
+    try:
+        pending: Set["Future[pd.DataFrame]"] = set()
+        for file_path in paths:
+            # Bound the files read ahead of the consumer
+            if len(pending) >= max_workers * 2:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+            pending.add(executor.submit(read, file_path))
+
+        for future in as_completed(pending):
+            yield future.result()
+    finally:
+        # Drop pending files if the consumer stops early
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _read_csv_file(
+    path: ReadTarget,
+    *,
+    source_column: Optional[str],
+    columns: Optional[List[str]],
+    filters: Optional[ColumnFilters],
+    **kwargs: Any,
+) -> pd.DataFrame:
+    """Read one CSV file, tagging its rows; may run in a worker process."""
+    if columns is not None:
+        kwargs["usecols"] = _columns_to_read(columns, filters)
+
+    if filters:
+        # Filter chunk by chunk so discarded rows are never held together
+        with pd.read_csv(path, chunksize=_FILTER_CHUNKSIZE, **kwargs) as reader:
+            chunks = [chunk[_filter_mask(chunk, filters)] for chunk in reader]
+        # Filtered chunks keep the parsed header; the source is not read
+        # again, since a buffer cannot be rewound
+        df = (
+            pd.concat(chunks)
+            if chunks
+            else pd.DataFrame(columns=columns or kwargs.get("names"))
+        )
+    else:
+        df = cast(pd.DataFrame, pd.read_csv(path, **kwargs))
+
+    if columns is not None:
+        df = df[columns]
+
+    if source_column is not None:
+        # Open files are tagged with their name, if they have one
+        df[source_column] = (
+            path if isinstance(path, str) else str(getattr(path, "name", path))
+        )
+
+    return df
+
+
+# Rows parsed at a time when CSV rows are filtered while reading
+_FILTER_CHUNKSIZE = 100_000
+
+_FILTER_OPERATORS: Dict[str, Callable[[pd.Series, Any], pd.Series]] = {
+    "=": lambda values, value: values == value,
+    "==": lambda values, value: values == value,
+    "!=": lambda values, value: (values != value) & values.notna(),
+    "<": lambda values, value: values < value,
+    "<=": lambda values, value: values <= value,
+    ">": lambda values, value: values > value,
+    ">=": lambda values, value: values >= value,
+    "in": lambda values, value: values.isin(value),
+    "not in": lambda values, value: ~values.isin(value) & values.notna(),
+    "not null": lambda values, _: values.notna(),
+}
+
+
+def _filter_groups(filters: Optional[ColumnFilters]) -> List[List[ColumnFilter]]:
+    """Return predicates as a list of AND groups combined with OR."""
+    if not filters:
+        return []
+
+    if isinstance(filters[0], list):
+        return filters
+
+    return [filters]
+
+
+def _filter_mask(df: pd.DataFrame, filters: ColumnFilters) -> pd.Series:
+    """
+    Evaluate Parquet-style predicates on a frame.
+
+    Null values never match, except through 'not null'. A list of
+    predicates is combined with AND; a list of such lists with OR.
+    """
+    mask = pd.Series(False, index=df.index)
+
+    for group in _filter_groups(filters):
+        matches = pd.Series(True, index=df.index)
+        for column, operator, value in group:
+            if operator not in _FILTER_OPERATORS:
+                raise ValueError(f"Unsupported filter operator: {operator!r}")
+            matches &= _FILTER_OPERATORS[operator](df[column], value).fillna(False)
+        mask |= matches
+
+    return mask
+
+
+def _columns_to_read(
+    columns: List[str],
+    filters: Optional[ColumnFilters],
+) -> List[str]:
+    """Return the requested columns plus those the filters need."""
+    needed = dict.fromkeys(columns)
+    for group in _filter_groups(filters):
+        needed.update(dict.fromkeys(column for column, _, _ in group))
+
+    return list(needed)
+
+
+def extract_from_csv_chunks(
+    path: str,
+    *,
+    chunksize: int = 100_000,
+    sep: str = ",",
+    encoding: Optional[str] = None,
+    columns: Optional[List[str]] = None,
+    filters: Optional[ColumnFilters] = None,
+    **kwargs: Any,
+) -> FrameChunks:
+    """
+    Extract data from a CSV file as a stream of DataFrame chunks.
+
+    Unlike extract_from_csv, the file is never fully materialized:
+    at most one chunk of `chunksize` rows is held in memory at a time.
+    The returned iterator can be passed directly to row-local
+    transformations and to the CSV and database loaders.
+
+    Parameters
+    ----------
+    path:
+        Path to the CSV file.
+    chunksize:
+        Maximum number of rows per chunk.
+    sep:
+        Column separator used in the CSV file.
+    encoding:
+        Optional file encoding (e.g. 'utf-8', 'latin-1').
+    columns:
+        Optional list of columns to return, as in extract_from_csv.
+    filters:
+        Optional row predicates, as in extract_from_csv. Each chunk is
+        filtered, so chunks may hold fewer than `chunksize` rows.
+    **kwargs:
+        Additional keyword arguments forwarded to pandas.read_csv.
+
+    Returns
+    -------
+    Iterator[pd.DataFrame]
+        Iterator yielding DataFrame chunks in file order.
+    """
+    if columns is not None:
+        kwargs["usecols"] = _columns_to_read(columns, filters)
+
+    # Open the chunked reader eagerly so bad paths or options fail here
+    reader = pd.read_csv(
         path,
         sep=sep,
         encoding=encoding,
+        chunksize=chunksize,
         **kwargs,
     )
 
+    if columns is None and not filters:
+        return _stream_reader(reader)
+
+    return _select_chunks(_stream_reader(reader), columns, filters)
+
+
+def _select_chunks(
+    chunks: FrameChunks,
+    columns: Optional[List[str]],
+    filters: Optional[ColumnFilters],
+) -> FrameChunks:
+    """Filter the rows and select the columns of each chunk."""
+    for chunk in chunks:
+        if filters:
+            chunk = chunk[_filter_mask(chunk, filters)]
+        yield chunk if columns is None else chunk[columns]
+
+
+def extract_from_csv_incremental(
+    path: str,
+    *,
+    store: StateStore,
+    key: Optional[str] = None,
+    sep: str = ",",
+    encoding: Optional[str] = None,
+    **kwargs: Any,
+) -> pd.DataFrame:
+    """
+    Extract only the rows appended to a CSV file since the previous run.
+
+    The watermark of an append-only file is the byte offset up to which
+    it has been read, together with the file's inode and size. Each run
+    seeks to the saved offset and parses only the new bytes (prefixed
+    with the header line), then saves the new offset. If the inode
+    changed or the file shrank, the file was replaced or truncated and
+    is read again from the start.
+
+    Only complete lines are consumed: a partially written last row is
+    left for the next run. The state is saved as soon as the delta has
+    been read.
+
+    Parameters
+    ----------
+    path:
+        Path to the CSV file.
+    store:
+        WatermarkStore or path of its JSON state file.
+    key:
+        Source identifier in the store. Defaults to the absolute path.
+    sep:
+        Column separator used in the CSV file.
+    encoding:
+        Optional file encoding (e.g. 'utf-8', 'latin-1').
+    **kwargs:
+        Additional keyword arguments forwarded to pandas.read_csv.
+        Pass header=None for files without a header line.
+
+    Returns
+    -------
+    pd.DataFrame
+        DataFrame containing the rows added since the previous run. With
+        no new rows it is empty, with the header columns (or `names`).
+    """
+    state = resolve_store(store)
+    source = key or f"csv:{os.path.abspath(path)}"
+    previous = state.get(source) or {}
+
+    stat = os.stat(path)
+    offset = int(previous.get("offset", 0))
+
+    # Start over if the file was replaced or truncated
+    if previous.get("inode") != stat.st_ino or stat.st_size < previous.get("size", 0):
+        offset = 0
+
+    content, offset = _read_appended(
+        path,
+        offset=offset,
+        size=stat.st_size,
+        with_header=kwargs.get("header", "infer") is not None,
+    )
+
+    # Without a header line, a run with no new rows has no bytes to parse
+    if content.strip():
+        df = pd.read_csv(
+            BytesIO(content),
+            sep=sep,
+            encoding=encoding,
+            **kwargs,
+        )
+    else:
+        df = pd.DataFrame(columns=kwargs.get("names"))
+
+    state.set(
+        source,
+        {"offset": offset, "inode": stat.st_ino, "size": stat.st_size},
+    )
+
     return cast(pd.DataFrame, df)
 
 
+def _read_appended(
+    path: str,
+    *,
+    offset: int,
+    size: int,
+    with_header: bool,
+) -> Tuple[bytes, int]:
+    """Read the complete lines after an offset, prefixed with the header line."""
+    with open(path, "rb") as file:
+        header = file.readline() if with_header else b""
+        start = max(offset, len(header))
+        file.seek(start)
+        data = file.read(size - start)
+
+    # Consume complete lines only
+    end = data.rfind(b"\n") + 1
+
+    return header + data[:end], start + end
+
+
+def _stream_reader(reader: Iterator[pd.DataFrame]) -> FrameChunks:
+    """Yield chunks from a pandas chunked reader and close it when done."""
+    try:
+        yield from reader
+    finally:
+        close = getattr(reader, "close", None)
+        if close is not None:
+            close()
+
+
 def extract_from_excel(
     path: str,
     *,
@@ -86,6 +549,248 @@ def extract_from_excel(
     return df
 
 
+def extract_from_excel_chunks(
+    path: str,
+    *,
+    sheet_name: Union[str, int] = 0,
+    chunksize: int = 50_000,
+    header: bool = True,
+) -> FrameChunks:
+    """
+    Extract an Excel sheet as a stream of DataFrame chunks.
+
+    The workbook is opened with openpyxl in read-only mode, which
+    parses the sheet's rows lazily instead of building the whole
+    workbook in memory. Blank rows are skipped, as in pandas.read_excel.
+    Column dtypes are inferred per chunk.
+
+    Parameters
+    ----------
+    path:
+        Path to the Excel file (.xlsx / .xlsm).
+    sheet_name:
+        Name or zero-based position of the sheet to read.
+    chunksize:
+        Maximum number of rows per chunk.
+    header:
+        Whether the first row holds the column names.
+
+    Returns
+    -------
+    Iterator[pd.DataFrame]
+        Iterator yielding DataFrame chunks in sheet order.
+
+    Raises
+    ------
+    ValueError
+        If chunksize is not a positive integer.
+    """
+    if chunksize < 1:
+        raise ValueError(f"chunksize must be a positive integer, got {chunksize}")
+
+    openpyxl = import_optional("openpyxl", "excel")
+
+    # Open the workbook eagerly so bad paths or sheet names fail here
+    workbook = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    try:
+        if isinstance(sheet_name, int):
+            sheet = workbook.worksheets[sheet_name]
+        else:
+            sheet = workbook[sheet_name]
+    except (IndexError, KeyError):
+        workbook.close()
+        raise
+
+    return _stream_sheet(workbook, sheet, chunksize=chunksize, header=header)
+
+
+def _stream_sheet(
+    workbook: Any,
+    sheet: Any,
+    *,
+    chunksize: int,
+    header: bool,
+) -> FrameChunks:
+    """Yield DataFrame chunks from a read-only worksheet and close the workbook."""
+    try:
+        # Files without a dimension record (e.g. from write-only workbooks)
+        # would otherwise be read with the dimensions of their first row
+        sheet.reset_dimensions()
+        rows = (
+            row
+            for row in sheet.iter_rows(values_only=True)
+            if any(value is not None for value in row)
+        )
+        columns = list(next(rows, ())) if header else None
+
+        # Rows may still be ragged: empty trailing cells are not stored
+        if columns is not None:
+            width = len(columns)
+            rows = (row[:width] + (None,) * (width - len(row)) for row in rows)
+
+        while batch := list(islice(rows, chunksize)):
+            yield pd.DataFrame.from_records(batch, columns=columns)
+    finally:
+        workbook.close()
+
+
+def extract_from_excel_sheets(
+    path: str,
+    *,
+    sheet_names: Optional[Sequence[Union[str, int]]] = None,
+    max_workers: Optional[int] = None,
+    sheet_column: Optional[str] = "sheet",
+    **kwargs: Any,
+) -> pd.DataFrame:
+    """
+    Extract several Excel sheets in parallel into a single DataFrame.
+
+    Each sheet is parsed with pandas.read_excel in its own worker
+    process, since Excel parsing is CPU-bound. The python-calamine
+    engine is used when it is installed and no engine is given.
+
+    Parameters
+    ----------
+    path:
+        Path to the Excel file.
+    sheet_names:
+        Names or zero-based positions of the sheets to read. If None,
+        every sheet is read.
+    max_workers:
+        Maximum number of worker processes. Defaults to one per sheet,
+        up to the number of CPUs.
+    sheet_column:
+        Optional column added to each row with its sheet name.
+    **kwargs:
+        Additional keyword arguments forwarded to pandas.read_excel.
+
+    Returns
+    -------
+    pd.DataFrame
+        Sheets concatenated in the requested order.
+    """
+    if sheet_names is None:
+        with pd.ExcelFile(path) as workbook:
+            sheet_names = list(workbook.sheet_names)
+
+    if "engine" not in kwargs and importlib.util.find_spec("python_calamine"):
+        kwargs["engine"] = "calamine"
+
+    workers = max_workers or min(len(sheet_names), os.cpu_count() or 1)
+
+    with ProcessPoolExecutor(max_workers=max(workers, 1)) as executor:
+        frames = list(
+            executor.map(
+                partial(_read_excel_sheet, path, **kwargs),
+                sheet_names,
+            )
+        )
+
+    if sheet_column is not None:
+        frames = [
+            frame.assign(**{sheet_column: name})
+            for frame, name in zip(frames, sheet_names)
+        ]
+
+    if not frames:
+        return pd.DataFrame()
+
+    return pd.concat(frames, ignore_index=True)
+
+
+def _read_excel_sheet(
+    path: str,
+    sheet_name: Union[str, int],
+    **kwargs: Any,
+) -> pd.DataFrame:
+    """Read one Excel sheet; runs in a worker process."""
+    return pd.read_excel(path, sheet_name=sheet_name, **kwargs)
+
+
+def extract_from_parquet(
+    path: str,
+    *,
+    columns: Optional[List[str]] = None,
+    filters: Optional[ColumnFilters] = None,
+    **kwargs: Any,
+) -> pd.DataFrame:
+    """
+    Extract data from a Parquet file or dataset into a pandas DataFrame.
+
+    Only the requested columns are read, and `filters` are pushed down to
+    the reader: row groups whose statistics cannot match are skipped and
+    the remaining rows are filtered before conversion to pandas.
+
+    Parameters
+    ----------
+    path:
+        Path to a Parquet file or a directory of Parquet files.
+    columns:
+        Optional list of columns to read. If None, all columns are read.
+    filters:
+        Optional predicates such as [('amount', '>=', 100)], combined with
+        AND; a list of such lists is combined with OR.
+    **kwargs:
+        Additional keyword arguments forwarded to pandas.read_parquet.
+
+    Returns
+    -------
+    pd.DataFrame
+        DataFrame containing the extracted data.
+    """
+    import_optional("pyarrow", "parquet")
+
+    # Read Parquet with projection and predicate pushdown
+    df = pd.read_parquet(
+        path,
+        engine="pyarrow",
+        columns=columns,
+        filters=filters,
+        **kwargs,
+    )
+
+    return df
+
+
+def extract_from_feather(
+    path: str,
+    *,
+    columns: Optional[List[str]] = None,
+    filters: Optional[ColumnFilters] = None,
+) -> pd.DataFrame:
+    """
+    Extract data from an Arrow IPC (Feather v2) file into a pandas DataFrame.
+
+    The file is memory-mapped, only the requested columns are read and
+    `filters` are applied on Arrow data before conversion to pandas.
+
+    Parameters
+    ----------
+    path:
+        Path to the Feather / Arrow IPC file.
+    columns:
+        Optional list of columns to read. If None, all columns are read.
+    filters:
+        Optional predicates such as [('amount', '>=', 100)], combined with
+        AND; a list of such lists is combined with OR.
+
+    Returns
+    -------
+    pd.DataFrame
+        DataFrame containing the extracted data.
+    """
+    dataset = import_optional("pyarrow.dataset", "parquet")
+    parquet = import_optional("pyarrow.parquet", "parquet")
+
+    # Scan the IPC file with projection and filter applied by Arrow
+    table = dataset.dataset(path, format="feather").to_table(
+        columns=columns,
+        filter=parquet.filters_to_expression(filters) if filters else None,
+    )
+
+    return cast(pd.DataFrame, table.to_pandas())
+
+
 def extract_from_api(
     url: str,
     *,
@@ -94,6 +799,7 @@ def extract_from_api(
     params: Optional[Dict[str, Any]] = None,
     json_path: Optional[str] = None,
     timeout: int = 30,
+    cache: Optional[ExtractionCache] = None,
 ) -> pd.DataFrame:
     """
     Extract data from an HTTP API endpoint into a pandas DataFrame.
@@ -101,6 +807,13 @@ def extract_from_api(
     This function performs an HTTP request and assumes the response
     body contains JSON data that can be normalized into tabular form.
 
+    If a cache is given, the normalized DataFrame is stored together
+    with the response's ETag / Last-Modified validators. Later calls
+    send them as If-None-Match / If-Modified-Since, and a
+    304 Not Modified response is served from the cache without
+    downloading or parsing the payload again; it also restarts the
+    entry's time to live and updates any validators it carries.
+
     Parameters
     ----------
     url:
@@ -116,21 +829,51 @@ def extract_from_api(
         If None, the full JSON response is used.
     timeout:
         Request timeout in seconds.
+    cache:
+        Optional ExtractionCache used as the response store. Its
+        max_bytes and ttl bound the stored responses.
 
     Returns
     -------
     pd.DataFrame
         DataFrame containing the extracted data.
     """
+    key = None
+    request_headers = dict(headers or {})
+
+    # Revalidate a stored response instead of downloading it again
+    if cache is not None:
+        key = _response_key(method, url, headers, params, json_path)
+        request_headers.update(_conditional_headers(cache.metadata(key) or {}))
+
     # Perform HTTP request
     response = requests.request(
         method=method,
         url=url,
-        headers=headers,
+        headers=request_headers,
         params=params,
         timeout=timeout,
     )
 
+    if cache is not None and key is not None and response.status_code == 304:
+        cached_df = cache.get(key)
+        if cached_df is not None:
+            # The server confirmed the entry: restart its time to live
+            cache.refresh(key, metadata=_response_validators(response))
+            return cached_df
+
+        # Entry evicted since the lookup, which also dropped its
+        # validators: fetch and store the full response
+        return extract_from_api(
+            url,
+            method=method,
+            headers=headers,
+            params=params,
+            json_path=json_path,
+            timeout=timeout,
+            cache=cache,
+        )
+
     # Raise exception for non-success status codes
     response.raise_for_status()
 
@@ -144,20 +887,519 @@ def extract_from_api(
     # Normalize JSON data into a DataFrame
     df = pd.json_normalize(data)
 
+    validators = _response_validators(response)
+    if cache is not None and key is not None and validators:
+        cache.put(key, df, metadata=validators)
+
     return df
 
 
-def extract_from_database(
-    engine: Engine,
-    query: str,
-    *,
-    params: Optional[Dict[str, Any]] = None,
-) -> pd.DataFrame:
-    """
-    Extract data from a relational database into a pandas DataFrame.
+def _response_key(
+    method: str,
+    url: str,
+    headers: Optional[Dict[str, str]],
+    params: Optional[Dict[str, Any]],
+    json_path: Optional[str],
+) -> str:
+    """Build the response store key of an API request."""
+    parts = [
+        method.upper(),
+        url,
+        json.dumps(headers or {}, sort_keys=True),
+        json.dumps(params or {}, sort_keys=True, default=str),
+        json_path or "",
+    ]
+    return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
 
-    This function executes a SQL query using a SQLAlchemy engine
-    and returns the result as a DataFrame.
+
+def _response_validators(response: requests.Response) -> Dict[str, str]:
+    """Return the ETag / Last-Modified validators of a response."""
+    return {
+        name: response.headers[name]
+        for name in ("ETag", "Last-Modified")
+        if name in response.headers
+    }
+
+
+def _conditional_headers(validators: Dict[str, str]) -> Dict[str, str]:
+    """Map stored response validators to conditional request headers."""
+    conditional = {}
+    if "ETag" in validators:
+        conditional["If-None-Match"] = validators["ETag"]
+    if "Last-Modified" in validators:
+        conditional["If-Modified-Since"] = validators["Last-Modified"]
+
+    return conditional
+
+
+def extract_from_api_paginated(  # pylint: disable=too-many-locals
+    url: str,
+    *,
+    pagination: PaginationStrategy = "page",
+    method: str = "GET",
+    headers: Optional[Dict[str, str]] = None,
+    params: Optional[Dict[str, Any]] = None,
+    json_path: Optional[str] = None,
+    page_size: int = 100,
+    size_param: str = "limit",
+    page_param: str = "page",
+    start_page: int = 1,
+    offset_param: str = "offset",
+    cursor_param: str = "cursor",
+    cursor_path: str = "next_cursor",
+    total_path: Optional[str] = None,
+    has_more_path: Optional[str] = None,
+    max_pages: Optional[int] = None,
+    max_workers: int = 4,
+    timeout: int = 30,
+    session: Optional[requests.Session] = None,
+) -> pd.DataFrame:
+    """
+    Extract every page of a paginated HTTP API into a pandas DataFrame.
+
+    All pages are requested over one keep-alive session. Each page is
+    normalized as soon as it arrives, and the per-page frames are
+    concatenated once at the end.
+
+    Supported pagination strategies:
+
+    - 'page': `page_param` is incremented from `start_page`.
+    - 'offset': `offset_param` is incremented by `page_size`.
+    - 'cursor': the next cursor is read from `cursor_path` in the
+      response body and sent as `cursor_param`.
+    - 'link': the next URL is read from the `Link: <...>; rel="next"`
+      response header.
+
+    Page and offset pages are independent, so up to `max_workers` of
+    them are fetched concurrently. Extraction stops at the first empty
+    page, when `has_more_path` reads false, once `total_path` records
+    have been read, or when a page repeats the previous one (a server
+    ignoring the page parameter). A page shorter than `page_size` does
+    not end the data, since servers may cap the page size. Cursor and
+    link pagination are inherently sequential.
+
+    Parameters
+    ----------
+    url:
+        API endpoint URL.
+    pagination:
+        Pagination strategy: 'page', 'offset', 'cursor' or 'link'.
+    method:
+        HTTP method to use (e.g. 'GET', 'POST').
+    headers:
+        Optional HTTP headers.
+    params:
+        Optional query parameters sent with every page request.
+    json_path:
+        Optional key to extract the list of records from each response.
+        If None, the full JSON response is used.
+    page_size:
+        Number of records requested per page, sent as `size_param`
+        for 'page' and 'offset' pagination.
+    size_param:
+        Query parameter carrying the page size.
+    page_param:
+        Query parameter carrying the page number.
+    start_page:
+        Number of the first page.
+    offset_param:
+        Query parameter carrying the record offset.
+    cursor_param:
+        Query parameter carrying the cursor.
+    cursor_path:
+        Dot-separated path to the next cursor in the response body.
+    total_path:
+        Optional dot-separated path to the total number of records in
+        the response body, for 'page' and 'offset' pagination.
+    has_more_path:
+        Optional dot-separated path to a flag in the response body that
+        is false on the last page, for 'page' and 'offset' pagination.
+    max_pages:
+        Optional maximum number of pages to fetch.
+    max_workers:
+        Maximum number of concurrent page requests.
+    timeout:
+        Request timeout in seconds.
+    session:
+        Optional session to reuse. If None, a pooled session is created
+        and closed when extraction finishes.
+
+    Returns
+    -------
+    pd.DataFrame
+        DataFrame containing the records of every page.
+
+    Raises
+    ------
+    ValueError
+        If the pagination strategy is not supported.
+    """
+    if pagination not in ("page", "offset", "cursor", "link"):
+        raise ValueError(f"Unsupported pagination strategy: {pagination}")
+
+    http = session if session is not None else create_session(pool_maxsize=max_workers)
+    fetch: Callable[..., PageResult] = partial(
+        _fetch_page,
+        session=http,
+        method=method,
+        headers=headers,
+        json_path=json_path,
+        timeout=timeout,
+    )
+    base_params = dict(params or {})
+
+    try:
+        if pagination in ("page", "offset"):
+
+            def page_params(index: int) -> Dict[str, Any]:
+                if pagination == "page":
+                    position = {page_param: start_page + index}
+                else:
+                    position = {offset_param: index * page_size}
+                return {**base_params, **position, size_param: page_size}
+
+            frames = _fetch_indexed_pages(
+                partial(fetch, url=url),
+                page_params,
+                total_path=total_path,
+                has_more_path=has_more_path,
+                max_pages=max_pages,
+                max_workers=max_workers,
+            )
+        else:
+            frames = _fetch_linked_pages(
+                partial(fetch, url=url),
+                base_params,
+                pagination=pagination,
+                cursor_param=cursor_param,
+                cursor_path=cursor_path,
+                max_pages=max_pages,
+            )
+    finally:
+        if session is None:
+            http.close()
+
+    if not frames:
+        return pd.DataFrame()
+
+    return pd.concat(frames, ignore_index=True)
+
+
+async def extract_from_api_async(
+    url: str,
+    *,
+    method: str = "GET",
+    headers: Optional[Dict[str, str]] = None,
+    params: Optional[Dict[str, Any]] = None,
+    json_path: Optional[str] = None,
+    timeout: int = 30,
+    client: Optional[AsyncHttpClient] = None,
+) -> pd.DataFrame:
+    """
+    Extract data from an HTTP API endpoint asynchronously.
+
+    This is the asyncio counterpart of extract_from_api. Passing a shared
+    AsyncHttpClient lets many calls run concurrently on one event loop
+    under a common concurrency limit, per-host rate limit and retry
+    policy. Requires the optional `aiohttp` dependency.
+
+    Parameters
+    ----------
+    url:
+        API endpoint URL.
+    method:
+        HTTP method to use (e.g. 'GET', 'POST').
+    headers:
+        Optional HTTP headers.
+    params:
+        Optional query parameters.
+    json_path:
+        Optional key to extract a nested list from the JSON response.
+        If None, the full JSON response is used.
+    timeout:
+        Request timeout in seconds, used when no client is given.
+    client:
+        Optional open AsyncHttpClient. If None, a client is created
+        for this request only.
+
+    Returns
+    -------
+    pd.DataFrame
+        DataFrame containing the extracted data.
+    """
+    if client is None:
+        async with AsyncHttpClient(timeout=timeout) as own_client:
+            return await extract_from_api_async(
+                url,
+                method=method,
+                headers=headers,
+                params=params,
+                json_path=json_path,
+                client=own_client,
+            )
+
+    # Perform HTTP request, retrying throttled and failed attempts
+    body = await client.request(method, url, headers=headers, params=params)
+
+    # Parse JSON response
+    data = json.loads(body)
+
+    # Extract nested data if a json_path is provided
+    if json_path is not None:
+        data = data.get(json_path, [])
+
+    # Normalize JSON data into a DataFrame
+    return pd.json_normalize(data)
+
+
+def extract_from_api_many(
+    urls: Sequence[str],
+    *,
+    method: str = "GET",
+    headers: Optional[Dict[str, str]] = None,
+    params: Optional[Dict[str, Any]] = None,
+    json_path: Optional[str] = None,
+    max_concurrency: int = 100,
+    rate_limit: Optional[float] = None,
+    retries: int = 3,
+    backoff: float = 0.5,
+    timeout: int = 30,
+    source_column: Optional[str] = None,
+) -> pd.DataFrame:
+    """
+    Extract data from many API endpoints concurrently into one DataFrame.
+
+    All requests run on a single asyncio event loop (no thread per
+    request), e.g. one endpoint per customer ID. Results are concatenated
+    in the order of `urls`. Requires the optional `aiohttp` dependency.
+    Called from a running event loop (Jupyter, async applications), the
+    requests run on a separate loop in a worker thread; async code can
+    instead await extract_from_api_async with a shared client.
+
+    Parameters
+    ----------
+    urls:
+        API endpoint URLs to fetch.
+    method:
+        HTTP method to use (e.g. 'GET', 'POST').
+    headers:
+        Optional HTTP headers sent with every request.
+    params:
+        Optional query parameters sent with every request.
+    json_path:
+        Optional key to extract a nested list from each JSON response.
+    max_concurrency:
+        Maximum number of requests in flight at once.
+    rate_limit:
+        Optional maximum number of requests per second per host.
+    retries:
+        Number of retries for 429 and 5xx responses.
+    backoff:
+        Base retry delay in seconds, doubled on every retry.
+    timeout:
+        Request timeout in seconds.
+    source_column:
+        Optional column name to tag each row with its source URL.
+
+    Returns
+    -------
+    pd.DataFrame
+        DataFrame containing the data of every endpoint.
+    """
+
+    async def extract_all() -> List[pd.DataFrame]:
+        async with AsyncHttpClient(
+            max_concurrency=max_concurrency,
+            rate_limit=rate_limit,
+            retries=retries,
+            backoff=backoff,
+            timeout=timeout,
+            headers=headers,
+        ) as client:
+            return await asyncio.gather(
+                *(
+                    extract_from_api_async(
+                        url,
+                        method=method,
+                        params=params,
+                        json_path=json_path,
+                        client=client,
+                    )
+                    for url in urls
+                )
+            )
+
+    frames = run_coroutine(extract_all())
+
+    if source_column is not None:
+        frames = [
+            frame.assign(**{source_column: url}) for frame, url in zip(frames, urls)
+        ]
+
+    if not frames:
+        return pd.DataFrame()
+
+    return pd.concat(frames, ignore_index=True)
+
+
+def _fetch_page(
+    *,
+    session: requests.Session,
+    method: str,
+    url: str,
+    headers: Optional[Dict[str, str]],
+    params: Optional[Dict[str, Any]],
+    json_path: Optional[str],
+    timeout: int,
+) -> PageResult:
+    """Fetch one page and return the response, body, record count and frame."""
+    response = session.request(
+        method=method,
+        url=url,
+        headers=headers,
+        params=params,
+        timeout=timeout,
+    )
+    response.raise_for_status()
+
+    body = response.json()
+    records = body.get(json_path, []) if json_path is not None else body
+    count = len(records) if isinstance(records, list) else 1
+
+    # Normalize each page on arrival instead of once at the end
+    return response, body, count, pd.json_normalize(records)
+
+
+def _fetch_indexed_pages(  # pylint: disable=too-many-locals
+    fetch: Callable[..., PageResult],
+    page_params: Callable[[int], Dict[str, Any]],
+    *,
+    total_path: Optional[str],
+    has_more_path: Optional[str],
+    max_pages: Optional[int],
+    max_workers: int,
+) -> List[pd.DataFrame]:
+    """Fetch numbered pages with a sliding window of concurrent requests."""
+    frames: List[pd.DataFrame] = []
+    pending: Deque["Future[PageResult]"] = deque()
+    next_index = 0
+    records = 0
+    previous: Optional[pd.DataFrame] = None
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+
+        def submit_next() -> None:
+            nonlocal next_index
+            if max_pages is None or next_index < max_pages:
+                pending.append(executor.submit(fetch, params=page_params(next_index)))
+                next_index += 1
+
+        for _ in range(max_workers):
+            submit_next()
+
+        # Consume pages in order until one marks the end of the data
+        while pending:
+            _, body, count, frame = pending.popleft().result()
+
+            # A server ignoring the page parameter repeats the same page
+            if not count or (previous is not None and frame.equals(previous)):
+                last = True
+            else:
+                frames.append(frame)
+                records += count
+                previous = frame
+                last = _is_last_page(body, records, total_path, has_more_path)
+
+            if last:
+                for future in pending:
+                    future.cancel()
+                break
+
+            submit_next()
+
+    return frames
+
+
+def _is_last_page(
+    body: Any,
+    records: int,
+    total_path: Optional[str],
+    has_more_path: Optional[str],
+) -> bool:
+    """Whether a page's body signals that no records follow it."""
+    if has_more_path is not None:
+        has_more = _get_json_path(body, has_more_path)
+        if has_more is not None and not has_more:
+            return True
+
+    if total_path is not None:
+        total = _get_json_path(body, total_path)
+        if total is not None and records >= int(total):
+            return True
+
+    return False
+
+
+def _fetch_linked_pages(
+    fetch: Callable[..., PageResult],
+    params: Dict[str, Any],
+    *,
+    pagination: PaginationStrategy,
+    cursor_param: str,
+    cursor_path: str,
+    max_pages: Optional[int],
+) -> List[pd.DataFrame]:
+    """Fetch cursor or Link-header pages sequentially."""
+    frames: List[pd.DataFrame] = []
+    page_params: Optional[Dict[str, Any]] = params
+    next_url: Optional[str] = None
+    fetched = 0
+
+    while max_pages is None or fetched < max_pages:
+        if next_url is None:
+            response, body, count, frame = fetch(params=page_params)
+        else:
+            response, body, count, frame = fetch(params=page_params, url=next_url)
+        fetched += 1
+        if count:
+            frames.append(frame)
+
+        if pagination == "cursor":
+            cursor = _get_json_path(body, cursor_path)
+            if cursor in (None, ""):
+                break
+            page_params = {**params, cursor_param: cursor}
+        else:
+            # The next link already carries its query string
+            next_url = response.links.get("next", {}).get("url")
+            if not next_url:
+                break
+            page_params = None
+
+    return frames
+
+
+def _get_json_path(data: Any, path: str) -> Any:
+    """Read a dot-separated key path from parsed JSON, or None if missing."""
+    for key in path.split("."):
+        if not isinstance(data, dict):
+            return None
+        data = data.get(key)
+
+    return data
+
+
+def extract_from_database(
+    engine: Engine,
+    query: str,
+    *,
+    params: Optional[Dict[str, Any]] = None,
+) -> pd.DataFrame:
+    """
+    Extract data from a relational database into a pandas DataFrame.
+
+    This function executes a SQL query using a SQLAlchemy engine
+    and returns the result as a DataFrame.
 
     Parameters
     ----------
@@ -183,9 +1425,428 @@ def extract_from_database(
     return df
 
 
-EXTRACTION_FUNCTIONS: List[Callable[..., pd.DataFrame]] = [
+def extract_from_database_incremental(
+    engine: Engine,
+    query: str,
+    *,
+    watermark_column: str,
+    store: StateStore,
+    key: Optional[str] = None,
+    params: Optional[Dict[str, Any]] = None,
+    initial_watermark: Optional[PartitionBound] = None,
+) -> pd.DataFrame:
+    """
+    Extract only the rows added to a SQL source since the previous run.
+
+    The watermark of the source is the maximum value of
+    `watermark_column` seen so far. Each run wraps the query with a
+    `watermark_column > <watermark>` filter, so only the delta is read
+    from the database, and saves the new maximum afterwards.
+
+    The column must grow monotonically as rows are added (e.g. an
+    auto-increment id or an insertion timestamp). Rows committed later
+    with a value not greater than the saved watermark are not picked up.
+
+    Parameters
+    ----------
+    engine:
+        SQLAlchemy Engine instance connected to the target database.
+    query:
+        SQL query to execute. It is used as a subquery.
+    watermark_column:
+        Column of the query result holding the watermark.
+    store:
+        WatermarkStore or path of its JSON state file.
+    key:
+        Source identifier in the store. Defaults to a hash of the
+        database URL, query and watermark column.
+    params:
+        Optional query parameters.
+    initial_watermark:
+        Watermark used when the store has none yet. If None, the first
+        run reads the whole source.
+
+    Returns
+    -------
+    pd.DataFrame
+        DataFrame containing the rows added since the previous run.
+
+    Raises
+    ------
+    KeyError
+        If the query result has no `watermark_column`.
+    """
+    state = resolve_store(store)
+    source = key or _source_key(
+        "database",
+        engine.url.render_as_string(hide_password=True),
+        query,
+        watermark_column,
+    )
+    watermark = state.get(source, initial_watermark)
+
+    # Push the watermark filter down to the database
+    incremental = f"SELECT * FROM {subquery(query, 'fragua_incremental')}"
+    if watermark is not None:
+        column = quote_identifier(engine, watermark_column)
+        incremental += f" WHERE {column} > {render_literal(engine, watermark)}"
+
+    df = extract_from_database(engine, incremental, params=params)
+
+    if watermark_column not in df.columns:
+        raise KeyError(f"Column '{watermark_column}' does not exist in query result")
+
+    latest = df[watermark_column].max()
+    if not pd.isna(latest):
+        state.set(source, latest)
+
+    return df
+
+
+def _source_key(kind: str, *parts: str) -> str:
+    """Build a stable store key for a source from its defining parts."""
+    digest = hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+    return f"{kind}:{digest[:16]}"
+
+
+def extract_from_database_chunks(
+    engine: Engine,
+    query: str,
+    *,
+    params: Optional[Dict[str, Any]] = None,
+    chunksize: int = 10_000,
+) -> FrameChunks:
+    """
+    Extract the result of a SQL query as a stream of DataFrame batches.
+
+    The query runs on a server-side cursor (SQLAlchemy `stream_results`
+    with `yield_per`), so rows are fetched from the database in batches
+    of `chunksize` instead of being buffered by the driver. Memory use
+    stays bounded by one batch regardless of the result set size.
+
+    The connection is taken from the pool when the first batch is
+    requested and held until the stream is exhausted or closed, so a
+    stream that is never iterated holds no connection. A query without
+    rows yields one empty DataFrame with the result columns.
+
+    Parameters
+    ----------
+    engine:
+        SQLAlchemy Engine instance connected to the target database.
+    query:
+        SQL query to execute, using the driver's parameter style
+        (same as extract_from_database).
+    params:
+        Optional query parameters.
+    chunksize:
+        Number of rows per yielded DataFrame.
+
+    Returns
+    -------
+    Iterator[pd.DataFrame]
+        Iterator yielding DataFrame batches in result order.
+
+    Raises
+    ------
+    ValueError
+        If chunksize is not a positive integer.
+    """
+    if chunksize < 1:
+        raise ValueError(f"chunksize must be a positive integer, got {chunksize}")
+
+    return _stream_query(engine, query, params, chunksize)
+
+
+def _stream_query(
+    engine: Engine,
+    query: str,
+    params: Optional[Dict[str, Any]],
+    chunksize: int,
+) -> FrameChunks:
+    """Yield DataFrame batches from a streaming connection and close it."""
+    # Connect on first use, so a stream that is never iterated holds nothing
+    with engine.connect().execution_options(
+        stream_results=True,
+        yield_per=chunksize,
+    ) as connection:
+        result = connection.exec_driver_sql(query, params or {})
+        columns = list(result.keys())
+
+        empty = True
+        for rows in result.partitions(chunksize):
+            empty = False
+            yield pd.DataFrame.from_records(rows, columns=columns, coerce_float=True)
+
+        # An empty result still carries its columns downstream
+        if empty:
+            yield pd.DataFrame(columns=columns)
+
+
+def extract_from_database_partitioned(
+    engine: Engine,
+    query: str,
+    *,
+    partition_column: str,
+    partitions: int = 4,
+    lower_bound: Optional[PartitionBound] = None,
+    upper_bound: Optional[PartitionBound] = None,
+    params: Optional[Dict[str, Any]] = None,
+    max_workers: Optional[int] = None,
+) -> pd.DataFrame:
+    """
+    Extract a SQL query result by running range partitions concurrently.
+
+    The value range of `partition_column` is split into `partitions`
+    contiguous ranges and one bounded query per range is issued on a
+    thread pool that shares the engine's connection pool. Results are
+    concatenated in partition order, so the output is deterministic.
+
+    The first partition is open below (and includes NULLs) and the last
+    one is open above, so every row of the query is returned exactly once
+    even if explicit bounds do not cover the whole column range.
+
+    Parameters
+    ----------
+    engine:
+        SQLAlchemy Engine instance connected to the target database.
+    query:
+        SQL query to partition. It is wrapped as a subquery.
+    partition_column:
+        Numeric or date/datetime column used to split the query.
+    partitions:
+        Number of range partitions.
+    lower_bound:
+        Optional lower bound of the range. Queried with MIN if None.
+    upper_bound:
+        Optional upper bound of the range. Queried with MAX if None.
+    params:
+        Optional query parameters, passed to every partition query.
+    max_workers:
+        Maximum number of concurrent queries. Defaults to `partitions`.
+        It should not exceed the engine's pool size plus overflow.
+
+    Returns
+    -------
+    pd.DataFrame
+        DataFrame containing the extracted data, in partition order.
+    """
+    queries = _partition_queries(
+        engine,
+        query,
+        partition_column=partition_column,
+        partitions=partitions,
+        lower_bound=lower_bound,
+        upper_bound=upper_bound,
+        params=params,
+    )
+
+    # Run bounded queries concurrently and keep results in partition order
+    with ThreadPoolExecutor(max_workers=max_workers or len(queries)) as executor:
+        futures = [
+            executor.submit(extract_from_database, engine, sql, params=params)
+            for sql in queries
+        ]
+        frames = [future.result() for future in futures]
+
+    # Empty partitions have no values to type their columns; leave them out
+    # unless every partition is empty
+    frames = [frame for frame in frames if not frame.empty] or frames[:1]
+
+    return pd.concat(frames, ignore_index=True)
+
+
+def extract_from_database_partitioned_chunks(
+    engine: Engine,
+    query: str,
+    *,
+    partition_column: str,
+    partitions: int = 4,
+    lower_bound: Optional[PartitionBound] = None,
+    upper_bound: Optional[PartitionBound] = None,
+    params: Optional[Dict[str, Any]] = None,
+    max_workers: Optional[int] = None,
+) -> FrameChunks:
+    """
+    Extract a SQL query result by range partitions, yielding each as it finishes.
+
+    This is the streaming counterpart of extract_from_database_partitioned:
+    partitions are queried concurrently in the same way, but each
+    partition DataFrame is yielded as soon as its query completes, in
+    completion order, instead of being concatenated.
+
+    Parameters
+    ----------
+    engine:
+        SQLAlchemy Engine instance connected to the target database.
+    query:
+        SQL query to partition. It is wrapped as a subquery.
+    partition_column:
+        Numeric or date/datetime column used to split the query.
+    partitions:
+        Number of range partitions.
+    lower_bound:
+        Optional lower bound of the range. Queried with MIN if None.
+    upper_bound:
+        Optional upper bound of the range. Queried with MAX if None.
+    params:
+        Optional query parameters, passed to every partition query.
+    max_workers:
+        Maximum number of concurrent queries. Defaults to `partitions`.
+
+    Returns
+    -------
+    Iterator[pd.DataFrame]
+        Iterator yielding one DataFrame per partition as it completes.
+    """
+    queries = _partition_queries(
+        engine,
+        query,
+        partition_column=partition_column,
+        partitions=partitions,
+        lower_bound=lower_bound,
+        upper_bound=upper_bound,
+        params=params,
+    )
+
+    return _stream_partitions(engine, queries, params, max_workers or len(queries))
+
+
+def _stream_partitions(
+    engine: Engine,
+    queries: List[str],
+    params: Optional[Dict[str, Any]],
+    max_workers: int,
+) -> FrameChunks:
+    """Yield non-empty partition results in completion order."""
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        futures = [
+            executor.submit(extract_from_database, engine, sql, params=params)
+            for sql in queries
+        ]
+        yielded = False
+        empty: Optional[pd.DataFrame] = None
+        for future in as_completed(futures):
+            frame = future.result()
+            if frame.empty:
+                empty = frame
+            else:
+                yielded = True
+                yield frame
+
+        # Empty partitions only carry columns; keep one if nothing else came
+        if not yielded and empty is not None:
+            yield empty
+    finally:
+        # Drop pending partitions if the consumer stops early
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _partition_queries(
+    engine: Engine,
+    query: str,
+    *,
+    partition_column: str,
+    partitions: int,
+    lower_bound: Optional[PartitionBound],
+    upper_bound: Optional[PartitionBound],
+    params: Optional[Dict[str, Any]],
+) -> List[str]:
+    """Build one bounded SQL query per range partition."""
+    if partitions < 1:
+        raise ValueError(f"partitions must be a positive integer, got {partitions}")
+
+    column = quote_identifier(engine, partition_column)
+    source = subquery(query, "fragua_partition")
+    base = f"SELECT * FROM {source}"
+
+    # Query missing bounds from the data itself
+    if lower_bound is None or upper_bound is None:
+        bounds = extract_from_database(
+            engine,
+            f"SELECT MIN({column}) AS lower_bound, MAX({column}) AS upper_bound "
+            f"FROM {source}",
+            params=params,
+        )
+        if lower_bound is None:
+            lower_bound = bounds["lower_bound"].iloc[0]
+        if upper_bound is None:
+            upper_bound = bounds["upper_bound"].iloc[0]
+
+    # Empty source: a single unbounded query returns the (empty) result
+    if pd.isna(lower_bound) or pd.isna(upper_bound):
+        return [base]
+
+    edges = [
+        render_literal(engine, edge)
+        for edge in _partition_edges(lower_bound, upper_bound, partitions)
+    ]
+
+    # Interior edges split the range; the outer partitions stay open
+    if not edges:
+        return [base]
+
+    queries = [f"{base} WHERE {column} < {edges[0]} OR {column} IS NULL"]
+    queries += [
+        f"{base} WHERE {column} >= {low} AND {column} < {high}"
+        for low, high in zip(edges, edges[1:])
+    ]
+    queries.append(f"{base} WHERE {column} >= {edges[-1]}")
+
+    return queries
+
+
+def _partition_edges(
+    lower_bound: PartitionBound,
+    upper_bound: PartitionBound,
+    partitions: int,
+) -> List[Any]:
+    """Compute the interior split points of a range, in ascending order."""
+    if isinstance(lower_bound, (int, float, np.number)) and isinstance(
+        upper_bound, (int, float, np.number)
+    ):
+        if isinstance(lower_bound, (int, np.integer)) and isinstance(
+            upper_bound, (int, np.integer)
+        ):
+            low, high = int(lower_bound), int(upper_bound)
+            span = high - low + 1
+            points: List[Any] = [
+                low + span * i // partitions for i in range(1, partitions)
+            ]
+        else:
+            points = [
+                float(value)
+                for value in np.linspace(
+                    float(lower_bound), float(upper_bound), partitions + 1
+                )[1:-1]
+            ]
+    else:
+        low_ts, high_ts = pd.Timestamp(lower_bound), pd.Timestamp(upper_bound)
+        points = [
+            pd.Timestamp(int(value)).floor("us").to_pydatetime()
+            for value in np.linspace(low_ts.value, high_ts.value, partitions + 1)[1:-1]
+        ]
+
+    # Narrow ranges can produce repeated split points
+    return sorted(set(points))
+
+
+EXTRACTION_FUNCTIONS: List[Callable[..., Frames]] = [
     extract_from_excel,
+    extract_from_excel_chunks,
+    extract_from_excel_sheets,
     extract_from_csv,
+    extract_from_csv_files,
+    extract_from_csv_chunks,
+    extract_from_csv_incremental,
+    extract_from_parquet,
+    extract_from_feather,
     extract_from_api,
+    extract_from_api_paginated,
+    extract_from_api_many,
     extract_from_database,
+    extract_from_database_chunks,
+    extract_from_database_incremental,
+    extract_from_database_partitioned,
+    extract_from_database_partitioned_chunks,
 ]
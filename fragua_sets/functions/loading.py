@@ -1,41 +1,146 @@
 """Load type functions."""
 
-from typing import Any, Callable, Dict, List, Literal, Optional
+from __future__ import annotations
 
-import requests
-from sqlalchemy.engine import Engine
-
-import pandas as pd
+import asyncio
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from functools import partial
+import gzip
+import io
+import time
+import uuid
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TypedDict,
+    Union,
+)
 
 from fragua.utils.helpers.get_project_root import get_project_root
 
-# pylint: disable=too-many-arguments
+from fragua_sets.utils.chunks import Frames, iter_chunks
+from fragua_sets.utils.http import (
+    AsyncHttpClient,
+    create_session,
+    request_with_retry,
+)
+from fragua_sets.utils.lazy import lazy_import
+from fragua_sets.utils.optional import import_optional
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import requests
+    import sqlalchemy as sa
+    from sqlalchemy.engine import Connection, Engine
+else:
+    pd = lazy_import("pandas")
+    requests = lazy_import("requests")
+    sa = lazy_import("sqlalchemy")
+
+# pylint: disable=too-many-arguments,too-many-locals,too-many-lines
+
+BulkLoadStrategy = Literal["auto", "copy", "multi", "executemany"]
+
+# Fastest strategy per SQLAlchemy dialect name
+_AUTO_STRATEGIES: Dict[str, BulkLoadStrategy] = {
+    "postgresql": "copy",
+    "sqlite": "executemany",
+}
+
+# Maximum number of bind parameters per statement per dialect
+_MAX_BIND_PARAMS: Dict[str, int] = {
+    "sqlite": 999,
+    "postgresql": 32_767,
+    "mysql": 65_535,
+    "mssql": 2_100,
+    "oracle": 65_535,
+}
+
+
+# Dialects supporting CREATE TEMPORARY TABLE ... AS SELECT for staging
+_TEMPORARY_STAGING_DIALECTS = ("postgresql", "sqlite", "mysql", "mariadb")
+
+# Positional DBAPI parameter markers, formatted with a 1-based position
+_POSITIONAL_MARKERS: Dict[str, str] = {
+    "qmark": "?",
+    "format": "%s",
+    "numeric": ":{}",
+}
+
+
+class BulkLoadReport(TypedDict):
+    """Throughput report returned by bulk_load_to_database."""
+
+    strategy: str
+    rows: int
+    seconds: float
+    rows_per_second: float
+
+
+class BatchReport(TypedDict):
+    """Outcome of one request sent by load_to_api_batched."""
+
+    batch: int
+    rows: int
+    bytes: int
+    status: Optional[int]
+    attempts: int
+    seconds: float
+    error: Optional[str]
 
 
 def load_to_csv(
-    df: pd.DataFrame,
+    df: Frames,
     filename: str,
     sep: str = ",",
     subdir: str = "pipeline_output",
 ) -> None:
     """
     Save a DataFrame to a CSV file in the project root.
+
+    An iterator of DataFrame chunks is written incrementally: the
+    header comes from the first chunk and the rest are appended. A
+    stream without chunks still replaces the file, with an empty one.
     """
     base_path = get_project_root()
     output_dir = base_path / subdir
     output_dir.mkdir(parents=True, exist_ok=True)
 
     file_path = output_dir / filename
-    df.to_csv(file_path, sep=sep, index=False)
+    written = False
+    for position, chunk in enumerate(iter_chunks(df)):
+        first = position == 0
+        chunk.to_csv(
+            file_path,
+            sep=sep,
+            index=False,
+            mode="w" if first else "a",
+            header=first,
+        )
+        written = True
+
+    # Without chunks there are no columns, so truncate to an empty file
+    if not written:
+        file_path.write_text("", encoding="utf-8")
 
 
 def load_to_excel(
-    df: pd.DataFrame,
+    df: Frames,
     filename: str,
     subdir: str = "pipeline_output",
     *,
     sheet_name: str = "Sheet1",
     index: bool = False,
+    constant_memory: bool = False,
     **kwargs: Any,
 ) -> None:
     """
@@ -44,10 +149,14 @@ def load_to_excel(
     This function writes the DataFrame to an Excel file using
     pandas.to_excel.
 
+    With `constant_memory`, or when given an iterator of DataFrame
+    chunks, rows are streamed to an openpyxl write-only workbook
+    instead, so the workbook is never held in memory as a whole.
+
     Parameters
     ----------
     df:
-        DataFrame to be persisted.
+        DataFrame or iterator of DataFrame chunks to be persisted.
     filename:
         Destination filename.
     subdir:
@@ -56,59 +165,654 @@ def load_to_excel(
         Name of the Excel sheet.
     index:
         Whether to write row indices.
+    constant_memory:
+        Stream rows to a write-only workbook. Always used for chunks.
     **kwargs:
         Additional keyword arguments forwarded to pandas.to_excel.
+        Not supported in constant-memory mode.
+
+    Raises
+    ------
+    ValueError
+        If keyword arguments are given in constant-memory mode.
     """
     base_path = get_project_root()
     output_dir = base_path / subdir
     output_dir.mkdir(parents=True, exist_ok=True)
 
     file_path = output_dir / filename
-    df.to_excel(
-        file_path,
-        sheet_name=sheet_name,
-        index=index,
-        **kwargs,
-    )
+
+    if isinstance(df, pd.DataFrame) and not constant_memory:
+        df.to_excel(
+            file_path,
+            sheet_name=sheet_name,
+            index=index,
+            **kwargs,
+        )
+        return
+
+    if kwargs:
+        raise ValueError(
+            f"Constant-memory Excel writes do not support: {', '.join(kwargs)}"
+        )
+
+    openpyxl = import_optional("openpyxl", "excel")
+
+    workbook = openpyxl.Workbook(write_only=True)
+    sheet = workbook.create_sheet(title=sheet_name)
+
+    for position, chunk in enumerate(iter_chunks(df)):
+        if position == 0:
+            header: List[Any] = list(chunk.columns)
+            if index:
+                header.insert(0, chunk.index.name)
+            sheet.append(header)
+
+        # Empty cells instead of NaN / NaT / NA
+        values = chunk.astype(object).where(chunk.notna(), None)
+        for row in values.itertuples(index=index, name=None):
+            sheet.append(row)
+
+    workbook.save(file_path)
+
+
+def load_to_parquet(
+    df: Frames,
+    filename: str,
+    subdir: str = "pipeline_output",
+    *,
+    compression: Optional[str] = "snappy",
+    row_group_size: Optional[int] = None,
+    index: bool = False,
+) -> None:
+    """
+    Load a pandas DataFrame into a Parquet file.
+
+    Row groups carry per-column statistics that let readers skip data
+    with extract_from_parquet filters; smaller row groups give finer
+    skipping at the cost of more metadata. An iterator of DataFrame
+    chunks is written incrementally with one writer, so the frame is
+    never fully materialized; every chunk must share the first chunk's
+    columns. A stream without chunks replaces the file with one without
+    columns.
+
+    Parameters
+    ----------
+    df:
+        DataFrame, or iterator of DataFrame chunks, to be persisted.
+    filename:
+        Destination filename.
+    subdir:
+        Subdirectory within project root.
+    compression:
+        Compression codec ('snappy', 'zstd', 'gzip', ...) or None.
+    row_group_size:
+        Optional maximum number of rows per row group.
+    index:
+        Whether to write row indices as a column.
+    """
+    parquet = import_optional("pyarrow.parquet", "parquet")
+    pyarrow = import_optional("pyarrow", "parquet")
+
+    base_path = get_project_root()
+    output_dir = base_path / subdir
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    file_path = output_dir / filename
+    writer = None
+    schema = None
+
+    try:
+        for chunk in iter_chunks(df):
+            # Later chunks are converted to the first chunk's schema
+            table = pyarrow.Table.from_pandas(
+                chunk, schema=schema, preserve_index=index
+            )
+            if writer is None:
+                schema = table.schema
+                writer = parquet.ParquetWriter(
+                    file_path, schema, compression=compression
+                )
+            writer.write_table(table, row_group_size=row_group_size)
+
+        # Without chunks there are no columns; still replace the file
+        if writer is None:
+            writer = parquet.ParquetWriter(
+                file_path, pyarrow.schema([]), compression=compression
+            )
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+def load_to_feather(
+    df: Frames,
+    filename: str,
+    subdir: str = "pipeline_output",
+    *,
+    compression: Optional[str] = "lz4",
+    index: bool = False,
+) -> None:
+    """
+    Load a pandas DataFrame into an Arrow IPC (Feather v2) file.
+
+    Feather files can be memory-mapped and read back without parsing,
+    which makes them a cheap hand-off format between pipelines. An
+    iterator of DataFrame chunks is written incrementally as record
+    batches; every chunk must share the first chunk's columns. A stream
+    without chunks replaces the file with one without columns.
+
+    Parameters
+    ----------
+    df:
+        DataFrame, or iterator of DataFrame chunks, to be persisted.
+    filename:
+        Destination filename.
+    subdir:
+        Subdirectory within project root.
+    compression:
+        Compression codec ('lz4', 'zstd') or None.
+    index:
+        Whether to write row indices as a column.
+    """
+    pyarrow = import_optional("pyarrow", "parquet")
+
+    base_path = get_project_root()
+    output_dir = base_path / subdir
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    file_path = output_dir / filename
+    options = pyarrow.ipc.IpcWriteOptions(compression=compression)
+    writer = None
+    schema = None
+
+    try:
+        for chunk in iter_chunks(df):
+            # Later chunks are converted to the first chunk's schema
+            table = pyarrow.Table.from_pandas(
+                chunk, schema=schema, preserve_index=index
+            )
+            if writer is None:
+                schema = table.schema
+                writer = pyarrow.ipc.new_file(str(file_path), schema, options=options)
+            writer.write_table(table)
+
+        # Without chunks there are no columns; still replace the file
+        if writer is None:
+            writer = pyarrow.ipc.new_file(
+                str(file_path), pyarrow.schema([]), options=options
+            )
+    finally:
+        if writer is not None:
+            writer.close()
 
 
 def load_to_database(
-    df: pd.DataFrame,
+    df: Frames,
     engine: Engine,
     table_name: str,
     *,
-    if_exists: Literal["fail", "replace", "append", "delete_rows"] = "append",
+    if_exists: Literal["fail", "replace", "append", "delete_rows", "upsert"] = "append",
     index: bool = False,
+    key_columns: Optional[Sequence[str]] = None,
     **kwargs: Any,
 ) -> None:
     """
     Load a pandas DataFrame into a relational database table.
 
     This function uses pandas.to_sql to persist data into a database
-    via a SQLAlchemy engine.
+    via a SQLAlchemy engine. An iterator of DataFrame chunks is written
+    chunk by chunk; `if_exists` applies to the first chunk and the
+    remaining chunks are appended. A stream without chunks carries no
+    columns to create a table from, so with 'replace' or 'delete_rows'
+    the rows of an existing table are deleted instead.
+
+    With `if_exists='upsert'`, rows are merged on `key_columns`: each
+    batch of `chunksize` rows (default 50,000) is bulk-loaded into a
+    staging table and merged with one set-based statement
+    (`INSERT ... ON CONFLICT` on PostgreSQL and SQLite,
+    `ON DUPLICATE KEY UPDATE` on MySQL, `MERGE` elsewhere), so reruns
+    are idempotent. The target must have a unique constraint on the
+    key columns; if the table does not exist it is created with a
+    unique index on them. Rows repeating a key keep the last occurrence.
+    `schema`, `dtype`, `index_label` and `method` from **kwargs apply to
+    the target and staging tables as they do with pandas.to_sql.
 
     Parameters
     ----------
     df:
-        DataFrame to be persisted.
+        DataFrame, or iterator of DataFrame chunks, to be persisted.
     engine:
         SQLAlchemy Engine connected to the target database.
     table_name:
         Name of the destination table.
     if_exists:
-        Behavior if the table already exists ('fail', 'replace', 'append').
+        Behavior if the table already exists ('fail', 'replace', 'append',
+        'delete_rows' or 'upsert').
     index:
         Whether to write row indices as a column.
+    key_columns:
+        Columns identifying a row, required when if_exists='upsert'.
     **kwargs:
         Additional keyword arguments forwarded to pandas.to_sql.
+
+    Raises
+    ------
+    ValueError
+        If if_exists='upsert' is used without key_columns.
+    """
+    if if_exists == "upsert":
+        if not key_columns:
+            raise ValueError("key_columns are required when if_exists='upsert'")
+
+        batch_size = kwargs.get("chunksize") or 50_000
+        index_label = kwargs.get("index_label")
+        for chunk in iter_chunks(df):
+            if index:
+                chunk = chunk.rename_axis(index_label or chunk.index.names)
+                chunk = chunk.reset_index()
+            _upsert_frame(
+                chunk,
+                engine,
+                table_name,
+                key_columns=list(key_columns),
+                batch_size=batch_size,
+                schema=kwargs.get("schema"),
+                dtype=kwargs.get("dtype"),
+                method=kwargs.get("method"),
+            )
+        return
+
+    # Persist DataFrame (or each chunk) into database table
+    written = False
+    for position, chunk in enumerate(iter_chunks(df)):
+        chunk.to_sql(
+            name=table_name,
+            con=engine,
+            if_exists=if_exists if position == 0 else "append",
+            index=index,
+            **kwargs,
+        )
+        written = True
+
+    if not written and if_exists in ("replace", "delete_rows"):
+        _delete_rows(engine, table_name, schema=kwargs.get("schema"))
+
+
+def _delete_rows(engine: Engine, table_name: str, *, schema: Optional[str]) -> None:
+    """Delete every row of a table, if it exists."""
+    target = _qualified_name(engine, table_name, schema)
+    with engine.begin() as conn:
+        if sa.inspect(conn).has_table(table_name, schema=schema):
+            conn.exec_driver_sql(f"DELETE FROM {target}")
+
+
+def bulk_load_to_database(
+    df: Frames,
+    engine: Engine,
+    table_name: str,
+    *,
+    if_exists: Literal["fail", "replace", "append", "delete_rows"] = "append",
+    strategy: BulkLoadStrategy = "auto",
+    chunksize: Optional[int] = None,
+    index: bool = False,
+) -> BulkLoadReport:
+    """
+    Load a pandas DataFrame into a database table using a bulk fast path.
+
+    Available strategies:
+
+    - 'copy': PostgreSQL `COPY ... FROM STDIN` (psycopg2 or psycopg 3).
+    - 'multi': multi-row `INSERT ... VALUES (...), (...)` statements,
+      with `chunksize` tuned to the dialect's bind-parameter limit.
+    - 'executemany': one prepared `INSERT` executed by the driver over
+      batches of rows, bypassing per-row SQLAlchemy parameter handling.
+    - 'auto': 'copy' on PostgreSQL, 'executemany' on SQLite and
+      'multi' on any other dialect.
+
+    Table creation and `if_exists` handling follow pandas.to_sql. An
+    iterator of DataFrame chunks is loaded chunk by chunk; one without
+    chunks empties an existing table with 'replace' or 'delete_rows',
+    as in load_to_database.
+
+    Parameters
+    ----------
+    df:
+        DataFrame, or iterator of DataFrame chunks, to be persisted.
+    engine:
+        SQLAlchemy Engine connected to the target database.
+    table_name:
+        Name of the destination table.
+    if_exists:
+        Behavior if the table already exists, applied to the first chunk.
+    strategy:
+        Bulk load strategy: 'auto', 'copy', 'multi' or 'executemany'.
+    chunksize:
+        Optional number of rows per statement or batch. Defaults to a
+        per-strategy value.
+    index:
+        Whether to write row indices as a column.
+
+    Returns
+    -------
+    BulkLoadReport
+        Strategy used, rows written, elapsed seconds and rows per second.
+
+    Raises
+    ------
+    ValueError
+        If 'copy' is requested on a non-PostgreSQL engine or the strategy
+        is not supported.
     """
-    # Persist DataFrame into database table
-    df.to_sql(
-        name=table_name,
-        con=engine,
-        if_exists=if_exists,
-        index=index,
-        **kwargs,
+    dialect = engine.dialect.name
+    if strategy == "auto":
+        strategy = _AUTO_STRATEGIES.get(dialect, "multi")
+
+    if strategy == "copy" and dialect != "postgresql":
+        raise ValueError(f"COPY bulk loading requires PostgreSQL, got {dialect}")
+    if strategy not in ("copy", "multi", "executemany"):
+        raise ValueError(f"Unsupported bulk load strategy: {strategy}")
+
+    rows = 0
+    written = False
+    started = time.perf_counter()
+
+    for position, chunk in enumerate(iter_chunks(df)):
+        method, batch = _bulk_insert_options(
+            strategy, dialect, len(chunk.columns) + int(index), chunksize
+        )
+        chunk.to_sql(
+            name=table_name,
+            con=engine,
+            if_exists=if_exists if position == 0 else "append",
+            index=index,
+            method=method,
+            chunksize=batch,
+        )
+        rows += len(chunk)
+        written = True
+
+    if not written and if_exists in ("replace", "delete_rows"):
+        _delete_rows(engine, table_name, schema=None)
+
+    seconds = time.perf_counter() - started
+
+    return {
+        "strategy": strategy,
+        "rows": rows,
+        "seconds": seconds,
+        "rows_per_second": rows / seconds if seconds > 0 else float("inf"),
+    }
+
+
+def _bulk_insert_options(
+    strategy: str,
+    dialect: str,
+    width: int,
+    chunksize: Optional[int],
+) -> Tuple[Any, Optional[int]]:
+    """Return the pandas.to_sql method and chunksize for a bulk strategy."""
+    if strategy == "copy":
+        return _copy_from_stdin, chunksize
+
+    if strategy == "multi":
+        # Keep each statement under the dialect's bind-parameter limit
+        max_params = _MAX_BIND_PARAMS.get(dialect, 1_000)
+        return "multi", chunksize or max(1, max_params // max(width, 1))
+
+    return _dbapi_executemany, chunksize or 50_000
+
+
+def _dbapi_executemany(
+    table: Any,
+    conn: Connection,
+    keys: List[str],
+    data_iter: Iterable[Tuple[Any, ...]],
+) -> int:
+    """pandas.to_sql insertion method running one driver-level executemany."""
+    preparer = conn.dialect.identifier_preparer
+    paramstyle = conn.dialect.paramstyle
+
+    # Fall back to SQLAlchemy for named parameter styles
+    if paramstyle not in _POSITIONAL_MARKERS:
+        result = conn.execute(
+            table.table.insert(), [dict(zip(keys, row)) for row in data_iter]
+        )
+        return int(result.rowcount)
+
+    target = preparer.quote(table.name)
+    if table.schema:
+        target = f"{preparer.quote_schema(table.schema)}.{target}"
+
+    columns = ", ".join(preparer.quote(key) for key in keys)
+    markers = ", ".join(
+        _POSITIONAL_MARKERS[paramstyle].format(position)
+        for position in range(1, len(keys) + 1)
+    )
+
+    # Apply SQLAlchemy type conversions only where the dialect needs them
+    dialect = conn.dialect
+    processors = [
+        table.table.c[key].type.dialect_impl(dialect).bind_processor(dialect)
+        for key in keys
+    ]
+    rows: Iterable[Tuple[Any, ...]] = data_iter
+    if any(processors):
+        rows = (
+            tuple(
+                process(value) if process is not None and value is not None else value
+                for process, value in zip(processors, row)
+            )
+            for row in data_iter
+        )
+
+    result = conn.exec_driver_sql(
+        f"INSERT INTO {target} ({columns}) VALUES ({markers})",
+        list(rows),
+    )
+    return int(result.rowcount)
+
+
+def _copy_from_stdin(
+    table: Any,
+    conn: Connection,
+    keys: List[str],
+    data_iter: Iterable[Tuple[Any, ...]],
+) -> int:
+    """pandas.to_sql insertion method streaming rows through PostgreSQL COPY."""
+    preparer = conn.dialect.identifier_preparer
+    columns = ", ".join(preparer.quote(key) for key in keys)
+    target = preparer.quote(table.name)
+    if table.schema:
+        target = f"{preparer.quote_schema(table.schema)}.{target}"
+
+    # Serialize the batch as CSV with an explicit NULL marker; every other
+    # value is quoted, so empty strings (and a literal \N) stay strings
+    buffer = io.StringIO()
+    for row in data_iter:
+        buffer.write(",".join(_copy_field(value) for value in row))
+        buffer.write("\n")
+    buffer.seek(0)
+
+    sql = f"COPY {target} ({columns}) FROM STDIN WITH (FORMAT csv, NULL '\\N')"
+    dbapi_connection: Any = conn.connection
+    with dbapi_connection.cursor() as cursor:
+        if hasattr(cursor, "copy_expert"):
+            # psycopg2
+            cursor.copy_expert(sql, buffer)
+        else:
+            # psycopg 3
+            with cursor.copy(sql) as copy:
+                copy.write(buffer.getvalue())
+        return int(cursor.rowcount)
+
+
+def _copy_field(value: Any) -> str:
+    """Render one value as a COPY CSV field, NULL as an unquoted \\N."""
+    if value is None:
+        return "\\N"
+
+    return '"' + str(value).replace('"', '""') + '"'
+
+
+def _upsert_frame(
+    frame: pd.DataFrame,
+    engine: Engine,
+    table_name: str,
+    *,
+    key_columns: List[str],
+    batch_size: int,
+    schema: Optional[str] = None,
+    dtype: Any = None,
+    method: Any = None,
+) -> None:
+    """Merge a DataFrame into a table through a staging table, batch by batch."""
+    frame = frame.drop_duplicates(subset=key_columns, keep="last")
+    preparer = engine.dialect.identifier_preparer
+    target = _qualified_name(engine, table_name, schema)
+
+    with engine.begin() as conn:
+        _ensure_upsert_target(
+            conn, frame, table_name, key_columns, schema=schema, dtype=dtype
+        )
+        staging_name, staging_schema = _create_staging_table(
+            conn, frame, target, schema=schema, dtype=dtype
+        )
+        staging = _qualified_name(engine, staging_name, staging_schema)
+
+        merge = _merge_statement(
+            engine.dialect.name,
+            target=target,
+            staging=staging,
+            columns=[preparer.quote(str(column)) for column in frame.columns],
+            keys=[preparer.quote(key) for key in key_columns],
+        )
+
+        try:
+            for start in range(0, len(frame), batch_size):
+                conn.exec_driver_sql(f"DELETE FROM {staging}")
+                frame.iloc[start : start + batch_size].to_sql(
+                    staging_name,
+                    conn,
+                    schema=staging_schema,
+                    if_exists="append",
+                    index=False,
+                    dtype=dtype,
+                    method=method or _dbapi_executemany,
+                )
+                conn.exec_driver_sql(merge)
+        finally:
+            conn.exec_driver_sql(f"DROP TABLE {staging}")
+
+
+def _ensure_upsert_target(
+    conn: Connection,
+    frame: pd.DataFrame,
+    table_name: str,
+    key_columns: List[str],
+    *,
+    schema: Optional[str],
+    dtype: Any,
+) -> None:
+    """Create a missing upsert target with a unique index on the key columns."""
+    if sa.inspect(conn).has_table(table_name, schema=schema):
+        return
+
+    frame.head(0).to_sql(table_name, conn, schema=schema, index=False, dtype=dtype)
+
+    # Let SQLAlchemy place the schema, which differs between dialects
+    table = sa.Table(table_name, sa.MetaData(), schema=schema, autoload_with=conn)
+    sa.Index(
+        f"ux_{table_name}_{'_'.join(key_columns)}",
+        *(table.c[key] for key in key_columns),
+        unique=True,
+    ).create(conn)
+
+
+def _create_staging_table(
+    conn: Connection,
+    frame: pd.DataFrame,
+    target: str,
+    *,
+    schema: Optional[str],
+    dtype: Any,
+) -> Tuple[str, Optional[str]]:
+    """Create an empty staging table and return its name and schema."""
+    preparer = conn.dialect.identifier_preparer
+    staging_name = f"fragua_stg_{uuid.uuid4().hex[:12]}"
+
+    if conn.dialect.name in _TEMPORARY_STAGING_DIALECTS:
+        # Copy the target's column types into a session-local table
+        column_list = ", ".join(preparer.quote(str(column)) for column in frame.columns)
+        conn.exec_driver_sql(
+            f"CREATE TEMPORARY TABLE {preparer.quote(staging_name)} AS "
+            f"SELECT {column_list} FROM {target} WHERE 1 = 0"
+        )
+        return staging_name, None
+
+    frame.head(0).to_sql(staging_name, conn, schema=schema, index=False, dtype=dtype)
+    return staging_name, schema
+
+
+def _qualified_name(
+    bind: Union[Engine, Connection], table_name: str, schema: Optional[str]
+) -> str:
+    """Quote a table name, qualified with its schema if given."""
+    preparer = bind.dialect.identifier_preparer
+    target = preparer.quote(table_name)
+    if schema:
+        target = f"{preparer.quote_schema(schema)}.{target}"
+
+    return target
+
+
+def _merge_statement(
+    dialect: str,
+    *,
+    target: str,
+    staging: str,
+    columns: List[str],
+    keys: List[str],
+) -> str:
+    """Build the set-based statement merging staging rows into the target."""
+    column_list = ", ".join(columns)
+    updates = [column for column in columns if column not in keys]
+
+    if dialect in ("postgresql", "sqlite"):
+        action = (
+            "DO UPDATE SET "
+            + ", ".join(f"{column} = excluded.{column}" for column in updates)
+            if updates
+            else "DO NOTHING"
+        )
+        # WHERE true disambiguates ON CONFLICT from a join clause in SQLite
+        return (
+            f"INSERT INTO {target} ({column_list}) "
+            f"SELECT {column_list} FROM {staging} WHERE true "
+            f"ON CONFLICT ({', '.join(keys)}) {action}"
+        )
+
+    if dialect in ("mysql", "mariadb"):
+        assignments = [f"{column} = VALUES({column})" for column in updates or keys]
+        return (
+            f"INSERT INTO {target} ({column_list}) "
+            f"SELECT {column_list} FROM {staging} "
+            f"ON DUPLICATE KEY UPDATE {', '.join(assignments)}"
+        )
+
+    matched = (
+        "WHEN MATCHED THEN UPDATE SET "
+        + ", ".join(f"t.{column} = s.{column}" for column in updates)
+        + " "
+        if updates
+        else ""
+    )
+    return (
+        f"MERGE INTO {target} t USING {staging} s "
+        f"ON ({' AND '.join(f't.{key} = s.{key}' for key in keys)}) "
+        f"{matched}"
+        f"WHEN NOT MATCHED THEN INSERT ({column_list}) "
+        f"VALUES ({', '.join(f's.{column}' for column in columns)});"
     )
 
 
@@ -165,9 +869,269 @@ def load_to_api(
     response.raise_for_status()
 
 
-LOADING_FUNCTIONS: List[Callable[..., None]] = [
+def load_to_api_batched(
+    df: Frames,
+    url: str,
+    *,
+    method: str = "POST",
+    headers: Optional[Dict[str, str]] = None,
+    timeout: int = 30,
+    batch_size: int = 1_000,
+    compress: bool = False,
+    max_workers: int = 4,
+    retries: int = 3,
+    backoff: float = 0.5,
+    raise_on_error: bool = True,
+    session: Optional[requests.Session] = None,
+) -> List[BatchReport]:
+    """
+    Load a pandas DataFrame to an HTTP API endpoint in concurrent batches.
+
+    Rows are sent in batches of `batch_size` records. Each batch is
+    serialized straight to JSON bytes (a list of records) with
+    DataFrame.to_json, without building Python dicts for the frame,
+    optionally gzip-compressed, and sent over a pooled keep-alive
+    session by up to `max_workers` threads. Only a bounded number of
+    batches is in flight at a time, so an iterator of DataFrame chunks
+    is loaded in constant memory.
+
+    Each batch is retried on its own on 429/5xx responses and
+    connection errors, with exponential backoff.
+
+    Parameters
+    ----------
+    df:
+        DataFrame, or iterator of DataFrame chunks, to be sent.
+    url:
+        API endpoint URL.
+    method:
+        HTTP method to use (e.g. 'POST', 'PUT').
+    headers:
+        Optional HTTP headers.
+    timeout:
+        Request timeout in seconds.
+    batch_size:
+        Number of records per request.
+    compress:
+        Whether to gzip the request bodies (sets Content-Encoding: gzip).
+    max_workers:
+        Maximum number of concurrent requests.
+    retries:
+        Number of retries per batch.
+    backoff:
+        Base retry delay in seconds, doubled on every retry.
+    raise_on_error:
+        Whether to raise the first batch error once all batches finished.
+        If False, failures are only recorded in the reports.
+    session:
+        Optional session to reuse. If None, a pooled session is created
+        and closed when loading finishes.
+
+    Returns
+    -------
+    List[BatchReport]
+        One report per batch, in batch order, with rows, payload bytes,
+        status, attempts, latency in seconds and error message.
+
+    Raises
+    ------
+    ValueError
+        If batch_size is not a positive integer.
+    requests.RequestException
+        If a batch still fails after its retries and raise_on_error is True.
+    """
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be a positive integer, got {batch_size}")
+
+    http = session if session is not None else create_session(pool_maxsize=max_workers)
+    request_headers = {"Content-Type": "application/json", **(headers or {})}
+    if compress:
+        request_headers["Content-Encoding"] = "gzip"
+
+    send = partial(
+        _send_batch,
+        http,
+        method=method,
+        url=url,
+        headers=request_headers,
+        timeout=timeout,
+        compress=compress,
+        retries=retries,
+        backoff=backoff,
+    )
+    reports: List[BatchReport] = []
+    errors: Dict[int, BaseException] = {}
+
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending: Set["Future[BatchReport]"] = set()
+            batches = (
+                chunk.iloc[start : start + batch_size]
+                for chunk in iter_chunks(df)
+                for start in range(0, len(chunk), batch_size)
+            )
+
+            for number, batch in enumerate(batches):
+                # Bound the batches in flight to keep memory constant
+                if len(pending) >= max_workers * 2:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    reports.extend(future.result() for future in done)
+                pending.add(executor.submit(send, number, batch, errors))
+
+            reports.extend(future.result() for future in pending)
+    finally:
+        if session is None:
+            http.close()
+
+    if raise_on_error and errors:
+        raise errors[min(errors)]
+
+    return sorted(reports, key=lambda report: report["batch"])
+
+
+def _send_batch(
+    session: requests.Session,
+    number: int,
+    batch: pd.DataFrame,
+    errors: Dict[int, BaseException],
+    *,
+    method: str,
+    url: str,
+    headers: Dict[str, str],
+    timeout: int,
+    compress: bool,
+    retries: int,
+    backoff: float,
+) -> BatchReport:
+    """Serialize and send one batch, recording its outcome."""
+    body = batch.to_json(orient="records", date_format="iso").encode("utf-8")
+    if compress:
+        body = gzip.compress(body)
+
+    report: BatchReport = {
+        "batch": number,
+        "rows": len(batch),
+        "bytes": len(body),
+        "status": None,
+        "attempts": 0,
+        "seconds": 0.0,
+        "error": None,
+    }
+    started = time.perf_counter()
+
+    try:
+        response, attempts = request_with_retry(
+            session,
+            method,
+            url,
+            data=body,
+            headers=headers,
+            timeout=timeout,
+            retries=retries,
+            backoff=backoff,
+        )
+        report["status"] = response.status_code
+        report["attempts"] = attempts
+        response.raise_for_status()
+    except requests.HTTPError as exc:
+        errors[number] = exc
+        report["error"] = str(exc)
+    except requests.RequestException as exc:
+        errors[number] = exc
+        report["attempts"] = retries + 1
+        report["error"] = str(exc)
+
+    report["seconds"] = time.perf_counter() - started
+    return report
+
+
+async def load_to_api_async(
+    df: pd.DataFrame,
+    url: str,
+    *,
+    method: str = "POST",
+    headers: Optional[Dict[str, str]] = None,
+    timeout: int = 30,
+    json_orient: Literal[
+        "dict",
+        "list",
+        "series",
+        "split",
+        "tight",
+        "records",
+        "index",
+    ] = "records",
+    batch_size: Optional[int] = None,
+    client: Optional[AsyncHttpClient] = None,
+) -> None:
+    """
+    Load a pandas DataFrame to an HTTP API endpoint asynchronously.
+
+    This is the asyncio counterpart of load_to_api. With `batch_size`,
+    the rows are split into batches that are sent concurrently, each
+    serialized with `json_orient`. Passing a shared AsyncHttpClient lets
+    many loads run on one event loop under a common concurrency limit,
+    per-host rate limit and retry policy. Requires the optional
+    `aiohttp` dependency.
+
+    Parameters
+    ----------
+    df:
+        DataFrame to be sent.
+    url:
+        API endpoint URL.
+    method:
+        HTTP method to use (e.g. 'POST', 'PUT').
+    headers:
+        Optional HTTP headers.
+    timeout:
+        Request timeout in seconds, used when no client is given.
+    json_orient:
+        JSON orientation used when serializing the DataFrame.
+    batch_size:
+        Optional number of rows per request. If None, the whole
+        DataFrame is sent in one request.
+    client:
+        Optional open AsyncHttpClient. If None, a client is created
+        for this load only.
+    """
+    if client is None:
+        async with AsyncHttpClient(timeout=timeout) as own_client:
+            await load_to_api_async(
+                df,
+                url,
+                method=method,
+                headers=headers,
+                json_orient=json_orient,
+                batch_size=batch_size,
+                client=own_client,
+            )
+        return
+
+    step = batch_size or max(len(df), 1)
+    batches = [df.iloc[start : start + step] for start in range(0, len(df), step)]
+
+    # Send every batch concurrently; the client bounds requests in flight
+    await asyncio.gather(
+        *(
+            client.request(
+                method,
+                url,
+                headers=headers,
+                json=batch.to_dict(orient=json_orient),
+            )
+            for batch in batches or [df]
+        )
+    )
+
+
+LOADING_FUNCTIONS: List[Callable[..., Any]] = [
     load_to_api,
+    load_to_api_batched,
     load_to_csv,
     load_to_database,
+    bulk_load_to_database,
     load_to_excel,
+    load_to_parquet,
+    load_to_feather,
 ]
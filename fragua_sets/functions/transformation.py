@@ -1,9 +1,96 @@
 """Transform Functions."""
 
-from typing import Any, Callable, Dict, List
-import pandas as pd
+from __future__ import annotations
 
+import importlib.util
+import itertools
+import multiprocessing
+import os
+import pickle
+import tempfile
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from contextvars import ContextVar
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+)
+from fragua_sets.utils.chunks import FrameChunks, Frames, iter_chunks, row_local
+from fragua_sets.utils.lazy import lazy_import
 
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+else:
+    np = lazy_import("numpy")
+    pd = lazy_import("pandas")
+
+# pylint: disable=too-many-arguments,too-many-locals,too-many-lines
+
+TransformationStep = Union[
+    Callable[..., Frames],
+    Tuple[Callable[..., Frames], Mapping[str, Any]],
+]
+
+StringCase = Literal["lower", "upper", "capitalize", "title"]
+
+_STRING_CASES: Dict[str, Callable[[str], str]] = {
+    "lower": str.lower,
+    "upper": str.upper,
+    "capitalize": str.capitalize,
+    "title": str.title,
+}
+
+# Frames owned by the running apply_transformations chain, compared by
+# identity so that frames the caller still holds are never modified
+_OWNED_FRAMES: ContextVar[Optional[List[pd.DataFrame]]] = ContextVar(
+    "fragua_sets_owned_frames", default=None
+)
+
+
+def _copy_on_write_enabled() -> bool:
+    """Return True if pandas Copy-on-Write semantics are active."""
+    if int(pd.__version__.split(".", maxsplit=1)[0]) >= 3:
+        return True
+
+    return pd.get_option("mode.copy_on_write") is True
+
+
+def _writable(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Return a frame that a transformation may modify without affecting callers.
+
+    Inside apply_transformations the frame the chain owns is returned as
+    is. Any other frame is copied: a shallow copy is enough under
+    Copy-on-Write, and a deep copy is made on older pandas defaults. A
+    copy made inside a chain (e.g. of a filtered result, which pandas
+    may flag as a copy of its parent) is owned by the chain from then on.
+    """
+    owned = _OWNED_FRAMES.get()
+    if owned is not None and any(df is frame for frame in owned):
+        return df
+
+    copied = df.copy(deep=not _copy_on_write_enabled())
+    if owned is not None:
+        owned.append(copied)
+
+    return copied
+
+
+@row_local
 def drop_nulls_in_columns(df: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
     """
     Drop rows with null values in specified columns.
@@ -11,24 +98,241 @@ def drop_nulls_in_columns(df: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
     return df.dropna(subset=columns)
 
 
-def parse_datetime_column(df: pd.DataFrame, column: str) -> pd.DataFrame:
+def parse_datetime_column(
+    df: Frames,
+    column: Union[str, Sequence[str]],
+    *,
+    date_format: Optional[str] = None,
+    dayfirst: bool = False,
+    utc: bool = False,
+    cache: bool = True,
+) -> Frames:
     """
-    Convert a column to datetime.
+    Convert one or more columns to datetime.
+
+    Values that cannot be parsed become NaT. Each column's format and
+    the number of values coerced to NaT are reported in
+    `result.attrs["datetime_report"]`.
+
+    Without `date_format`, the format is detected from the first values
+    and used for the whole column; if some values do not match it, the
+    column is parsed again value by value ('mixed') instead of coercing
+    them to NaT. Values with differing UTC offsets, or both aware and
+    naive values, are converted to UTC.
+
+    With `cache`, a column whose values repeat (as timestamps in event
+    logs do) is factorized and each distinct value is parsed only once.
+    Columns whose leading values are all distinct are parsed directly.
+
+    Detection and the UTC conversion depend on the whole column, so a
+    chunk stream (or a partition in apply_transformations_parallel)
+    needs them fixed: pass a `date_format`, and `utc=True` if it is
+    'mixed', 'ISO8601' or carries an offset (%z/%Z). Every chunk then
+    gets the same dtype.
+
+    Parameters
+    ----------
+    df : pd.DataFrame or iterator of pd.DataFrame
+        Input DataFrame or stream of DataFrame chunks.
+    column : str or list of str
+        Column, or columns, to convert.
+    date_format : str, optional
+        strftime format of the values (e.g. '%d/%m/%Y %H:%M'), 'ISO8601'
+        or 'mixed'. Detected per column if None.
+    dayfirst : bool
+        Whether ambiguous dates are read day first.
+    utc : bool
+        Whether to convert every value to UTC, treating naive values as
+        UTC. Otherwise only columns with differing offsets are.
+    cache : bool
+        Whether to parse each distinct value once.
+
+    Returns
+    -------
+    pd.DataFrame or iterator of pd.DataFrame
+        DataFrame (or chunk stream) with the columns converted.
+
+    Raises
+    ------
+    ValueError
+        If a chunk stream is given without a fixed format and timezone.
     """
-    df_copy = df.copy()
-    df_copy[column] = pd.to_datetime(df_copy[column], errors="coerce")
+    if not isinstance(df, pd.DataFrame):
+        if not _fixed_datetime_parsing(date_format, utc):
+            raise ValueError(
+                "Parsing a chunk stream needs a fixed 'date_format', and "
+                "utc=True for 'mixed', 'ISO8601' or formats with an offset"
+            )
+        return (
+            _parse_datetime_frame(
+                chunk,
+                column,
+                date_format=date_format,
+                dayfirst=dayfirst,
+                utc=utc,
+                cache=cache,
+            )
+            for chunk in df
+        )
+
+    return _parse_datetime_frame(
+        df, column, date_format=date_format, dayfirst=dayfirst, utc=utc, cache=cache
+    )
+
+
+def _fixed_datetime_parsing(date_format: Optional[str], utc: bool) -> bool:
+    """Return True if any slice of a column parses to the same dtype."""
+    if date_format is None:
+        return False
+
+    if utc:
+        return True
+
+    return date_format not in ("mixed", "ISO8601") and not any(
+        directive in date_format for directive in ("%z", "%Z")
+    )
+
+
+def _parse_datetime_frame(
+    df: pd.DataFrame,
+    column: Union[str, Sequence[str]],
+    *,
+    date_format: Optional[str],
+    dayfirst: bool,
+    utc: bool,
+    cache: bool,
+) -> pd.DataFrame:
+    """Convert the columns of one frame, reporting formats and coercions."""
+    columns = [column] if isinstance(column, str) else list(column)
+    df_copy = _writable(df)
+    report: Dict[str, Dict[str, Any]] = {}
+
+    for col in columns:
+        values = df_copy[col]
+        parsed, used_format = _parse_datetimes(
+            values, date_format, dayfirst, utc, cache
+        )
+        report[str(col)] = {
+            "format": used_format,
+            "coerced": int((parsed.isna() & values.notna()).sum()),
+        }
+        df_copy[col] = parsed
+
+    df_copy.attrs["datetime_report"] = report
     return df_copy
 
 
+# Distinct values tried when detecting the format of a column
+_FORMAT_GUESS_SAMPLE = 20
+
+# Leading rows checked for repeated values before factorizing a column
+_DATETIME_CACHE_SAMPLE = 10_000
+
+
+def _parse_datetimes(
+    values: pd.Series,
+    date_format: Optional[str],
+    dayfirst: bool,
+    utc: bool,
+    cache: bool,
+) -> Tuple[pd.Series, Optional[str]]:
+    """Parse a column, each distinct value once if caching."""
+    if not (
+        pd.api.types.is_object_dtype(values) or pd.api.types.is_string_dtype(values)
+    ):
+        return pd.to_datetime(values, errors="coerce", utc=utc), date_format
+
+    # Factorizing only pays off if values repeat; skip it on distinct samples
+    sample = values.iloc[:_DATETIME_CACHE_SAMPLE]
+    if not cache or sample.nunique() >= 0.99 * sample.count():
+        return _parse_strings(values, date_format, dayfirst, utc)
+
+    # Missing values get a code of their own, so every code is a position
+    codes, uniques = pd.factorize(values, use_na_sentinel=False)
+    parsed, used_format = _parse_strings(pd.Series(uniques), date_format, dayfirst, utc)
+    expanded = parsed.iloc[codes]
+    expanded.index, expanded.name = values.index, values.name
+
+    return expanded, used_format
+
+
+def _parse_strings(
+    values: pd.Series,
+    date_format: Optional[str],
+    dayfirst: bool,
+    utc: bool,
+) -> Tuple[pd.Series, Optional[str]]:
+    """Parse strings with a given or detected format."""
+    used_format = date_format
+    if used_format is None:
+        candidates = values.dropna().iloc[:_FORMAT_GUESS_SAMPLE]
+        guesses = (_guess_datetime_format(str(value), dayfirst) for value in candidates)
+        used_format = next((guess for guess in guesses if guess), "mixed")
+
+    parsed = _to_datetime(values, used_format, dayfirst, utc)
+
+    # A detected format may not fit every value; parse them all one by one,
+    # since the others may not even share a timezone awareness with it
+    failed = parsed.isna() & values.notna()
+    if date_format is None and used_format != "mixed" and failed.any():
+        used_format = "mixed"
+        parsed = _to_datetime(values, used_format, dayfirst, utc)
+
+    return parsed, used_format
+
+
+def _to_datetime(
+    values: pd.Series, date_format: str, dayfirst: bool, utc: bool
+) -> pd.Series:
+    """Parse strings, converting to UTC if asked or when their offsets differ."""
+    options: Dict[str, Any] = {
+        "errors": "coerce",
+        "format": date_format,
+        "dayfirst": dayfirst,
+        "cache": False,
+    }
+    if utc:
+        return cast(pd.Series, pd.to_datetime(values, utc=True, **options))
+
+    try:
+        with warnings.catch_warnings():
+            # pandas < 3 warns about mixed offsets; they are handled below
+            warnings.simplefilter("ignore", FutureWarning)
+            parsed = pd.to_datetime(values, **options)
+    except ValueError:
+        # pandas >= 3 raises on mixed offsets or aware and naive values
+        parsed = None
+
+    # pandas < 3 returns them as objects instead
+    if parsed is None or parsed.dtype == object:
+        parsed = pd.to_datetime(values, utc=True, **options)
+
+    return cast(pd.Series, parsed)
+
+
+def _guess_datetime_format(value: str, dayfirst: bool) -> Optional[str]:
+    """Return the strftime format of a datetime string, if recognized."""
+    guess: Any = getattr(pd.tseries.api, "guess_datetime_format", None)
+    if guess is None:
+        # Public only since pandas 2.2
+        from pandas._libs.tslibs.parsing import (  # pylint: disable=no-name-in-module
+            guess_datetime_format as guess,
+        )
+
+    return cast(Optional[str], guess(value, dayfirst=dayfirst))
+
+
+@row_local
 def normalize_column_names(df: pd.DataFrame) -> pd.DataFrame:
     """
     Normalize column names: lowercase and replace spaces with underscores.
     """
-    df_copy = df.copy()
+    df_copy = _writable(df)
     df_copy.columns = df_copy.columns.str.strip().str.lower().str.replace(" ", "_")
     return df_copy
 
 
+@row_local
 def filter_by_min_value(
     df: pd.DataFrame, column: str, min_value: float
 ) -> pd.DataFrame:
@@ -38,17 +342,19 @@ def filter_by_min_value(
     return df[df[column] >= min_value]
 
 
+@row_local
 def create_sum_column(
     df: pd.DataFrame, col_a: str, col_b: str, new_col: str
 ) -> pd.DataFrame:
     """
     Create a new column as the sum of two existing columns.
     """
-    df_copy = df.copy()
+    df_copy = _writable(df)
     df_copy[new_col] = df_copy[col_a] + df_copy[col_b]
     return df_copy
 
 
+@row_local
 def add_total_price_derived_column(
     df: pd.DataFrame,
     *,
@@ -87,18 +393,19 @@ def add_total_price_derived_column(
     if col_b not in df.columns:
         raise KeyError(f"Column '{col_b}' does not exist in DataFrame")
 
-    df = df.copy()
+    df = _writable(df)
     df["total_price"] = df[col_a] * df[col_b]
 
     return df
 
 
+@row_local
 def strip_whitespace(df: pd.DataFrame) -> pd.DataFrame:
     """
     Remove leading and trailing whitespace from all string columns
     in a pandas DataFrame.
     """
-    df = df.copy()
+    df = _writable(df)
 
     string_cols = df.select_dtypes(include=["object", "string"]).columns
 
@@ -108,39 +415,141 @@ def strip_whitespace(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
-def fill_missing_values(df: pd.DataFrame) -> pd.DataFrame:
+def fill_missing_values(
+    df: Frames,
+    *,
+    means: Optional[Mapping[Hashable, float]] = None,
+) -> Frames:
     """
     Fill missing values in a DataFrame.
 
     - Numeric columns are filled with their mean.
     - Categorical / string columns are filled with 'desconocido'.
 
+    All column means are computed in one vectorized reduction and all
+    columns are filled in one operation.
+
+    To impute a chunk stream with the global means, compute them first
+    with column_means (which accumulates per-chunk sums and counts) and
+    pass them as `means`; each chunk is then filled independently:
+
+        means = column_means(extract_from_csv_chunks(path))
+        filled = fill_missing_values(extract_from_csv_chunks(path), means=means)
+
     Parameters
     ----------
-    df : pd.DataFrame
-        Input DataFrame.
+    df : pd.DataFrame or iterator of pd.DataFrame
+        Input DataFrame or stream of DataFrame chunks.
+    means : mapping of column label to float, optional
+        Precomputed means per numeric column. If None, the means of
+        `df` itself are used. Required for chunk streams.
 
     Returns
     -------
-    pd.DataFrame
-        DataFrame with missing values filled.
+    pd.DataFrame or iterator of pd.DataFrame
+        DataFrame (or chunk stream) with missing values filled.
+
+    Raises
+    ------
+    ValueError
+        If a chunk stream is given without means.
     """
-    df = df.copy()
+    if isinstance(df, pd.DataFrame):
+        return _fill_missing(df, means)
 
-    # Numeric columns
-    numeric_cols = df.select_dtypes(include=["number"]).columns
-    for col in numeric_cols:
-        mean_value = df[col].mean()
-        df[col] = df[col].fillna(mean_value)
+    if means is None:
+        raise ValueError(
+            "Filling a chunk stream needs global means; compute them with "
+            "column_means and pass them as 'means'"
+        )
+
+    return (_fill_missing(chunk, means) for chunk in df)
 
-    # Categorical / string columns
+
+def _fill_missing(
+    df: pd.DataFrame,
+    means: Optional[Mapping[Hashable, float]],
+) -> pd.DataFrame:
+    """Fill numeric columns with means and string columns with a placeholder."""
+    numeric_cols = df.select_dtypes(include=["number"]).columns
     categorical_cols = df.select_dtypes(include=["object", "string"]).columns
-    for col in categorical_cols:
-        df[col] = df[col].fillna("desconocido")
 
-    return df
+    # One reduction over every numeric column
+    col_means: Mapping[Any, float] = (
+        df[numeric_cols].mean().to_dict() if means is None else means
+    )
+
+    fills: Dict[Any, Any] = {
+        col: col_means[col] for col in numeric_cols if col in col_means
+    }
+    fills.update({col: "desconocido" for col in categorical_cols})
+
+    # One fill over every column; fillna returns a new frame
+    return df.fillna(value=fills)
 
 
+def column_means(data: Frames) -> Dict[Hashable, float]:
+    """
+    Compute numeric column means over a DataFrame or a chunk stream.
+
+    Each chunk contributes its per-column sums and non-null counts, which
+    are merged before dividing, so the result equals the mean over the
+    whole data while holding only one chunk at a time.
+
+    Parameters
+    ----------
+    data : pd.DataFrame or iterator of pd.DataFrame
+        Data to reduce.
+
+    Returns
+    -------
+    dict of column label to float
+        Mean per numeric column, keyed by its label as in the data (NaN
+        for columns without values).
+    """
+    sums: Dict[Hashable, float] = {}
+    counts: Dict[Hashable, int] = {}
+
+    for chunk in iter_chunks(data):
+        _add_numeric_totals(sums, counts, _numeric_totals(chunk))
+
+    return _means(sums, counts)
+
+
+def _numeric_totals(
+    df: pd.DataFrame,
+) -> Tuple[Dict[Hashable, float], Dict[Hashable, int]]:
+    """Return the sums and non-null counts of the numeric columns."""
+    numeric = df.select_dtypes(include=["number"])
+    sums = {col: float(total) for col, total in numeric.sum().items()}
+    counts = {col: int(count) for col, count in numeric.count().items()}
+    return sums, counts
+
+
+def _add_numeric_totals(
+    sums: Dict[Hashable, float],
+    counts: Dict[Hashable, int],
+    totals: Tuple[Dict[Hashable, float], Dict[Hashable, int]],
+) -> None:
+    """Merge partial sums and counts into running totals."""
+    for col, total in totals[0].items():
+        sums[col] = sums.get(col, 0.0) + total
+    for col, count in totals[1].items():
+        counts[col] = counts.get(col, 0) + count
+
+
+def _means(
+    sums: Mapping[Hashable, float],
+    counts: Mapping[Hashable, int],
+) -> Dict[Hashable, float]:
+    """Divide merged sums by counts (NaN for columns without values)."""
+    return {
+        col: total / counts[col] if counts[col] else float("nan")
+        for col, total in sums.items()
+    }
+
+
+@row_local
 def capitalize_string_columns(df: pd.DataFrame) -> pd.DataFrame:
     """
     Capitalize all string / categorical columns in a DataFrame.
@@ -159,7 +568,7 @@ def capitalize_string_columns(df: pd.DataFrame) -> pd.DataFrame:
     pd.DataFrame
         DataFrame with capitalized string columns.
     """
-    df = df.copy()
+    df = _writable(df)
 
     string_cols = df.select_dtypes(include=["object", "string"]).columns
 
@@ -169,11 +578,12 @@ def capitalize_string_columns(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
+@row_local
 def strip_string_columns(df: pd.DataFrame) -> pd.DataFrame:
     """
     Strip leading and trailing whitespace from all string columns.
     """
-    df_copy = df.copy()
+    df_copy = _writable(df)
     string_columns = df_copy.select_dtypes(include="object").columns
 
     for col in string_columns:
@@ -182,15 +592,149 @@ def strip_string_columns(df: pd.DataFrame) -> pd.DataFrame:
     return df_copy
 
 
+@row_local
+def normalize_string_columns(
+    df: pd.DataFrame,
+    *,
+    columns: Optional[List[str]] = None,
+    strip: bool = True,
+    case: Optional[StringCase] = None,
+    as_category: bool = False,
+    string_dtype: Optional[str] = None,
+) -> pd.DataFrame:
+    """
+    Strip and re-case string columns in a single pass over unique values.
+
+    Each column is factorized and the cleaning runs once per distinct
+    value instead of once per row, then the cleaned values are mapped
+    back through the codes. For low-cardinality columns (cities,
+    statuses) this replaces several full passes of strip_whitespace,
+    strip_string_columns and capitalize_string_columns with work
+    proportional to the number of uniques.
+
+    Example:
+        ' montevideo', 'MONTEVIDEO ' -> 'Montevideo' (case='capitalize')
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Input DataFrame.
+    columns : list of str, optional
+        Columns to normalize. If None, all object, string and category
+        columns are normalized.
+    strip : bool
+        Whether to strip leading and trailing whitespace.
+    case : {'lower', 'upper', 'capitalize', 'title'}, optional
+        Case conversion to apply. If None, the case is kept.
+    as_category : bool
+        Whether to return the columns as `category` dtype, reusing the
+        computed codes. Category input columns always stay categorical.
+    string_dtype : str, optional
+        Dtype for non-categorical output, e.g. 'string[pyarrow]' for
+        Arrow-backed strings. If None, the input dtype is kept.
+
+    Returns
+    -------
+    pd.DataFrame
+        DataFrame with normalized string columns.
+    """
+    df = _writable(df)
+
+    if columns is None:
+        columns = list(
+            df.select_dtypes(include=["object", "string", "category"]).columns
+        )
+
+    for col in columns:
+        df[col] = _normalize_strings(
+            df[col],
+            strip=strip,
+            case=case,
+            as_category=as_category,
+            string_dtype=string_dtype,
+        )
+
+    return df
+
+
+def _normalize_strings(
+    series: pd.Series,
+    *,
+    strip: bool,
+    case: Optional[StringCase],
+    as_category: bool,
+    string_dtype: Optional[str],
+) -> pd.Series:
+    """Clean the distinct values of a series and map them back by code."""
+    codes, uniques = pd.factorize(series, use_na_sentinel=True)
+    cleaned = _clean_strings(np.asarray(uniques, dtype=object), strip, case)
+
+    # Cleaning can merge distinct values ('a ' and 'a'), so re-factorize
+    clean_codes, clean_uniques = pd.factorize(cleaned)
+    present = codes >= 0
+    # Index only through present codes: an all-null column has no uniques
+    codes = codes.copy()
+    codes[present] = clean_codes[codes[present]]
+
+    if as_category or isinstance(series.dtype, pd.CategoricalDtype):
+        categorical = pd.Categorical.from_codes(
+            codes, dtype=pd.CategoricalDtype(pd.Index(clean_uniques))
+        )
+        return pd.Series(categorical, index=series.index, name=series.name)
+
+    # Expand the cleaned uniques with one vectorized take in the target dtype
+    dtype: Any = string_dtype or series.dtype
+    if dtype == object:
+        values: Any = pd.api.extensions.take(
+            clean_uniques, codes, allow_fill=True, fill_value=None
+        )
+    else:
+        values = pd.api.extensions.take(
+            pd.array(clean_uniques, dtype=dtype), codes, allow_fill=True
+        )
+
+    result: pd.Series = pd.Series(
+        values, index=series.index, name=series.name, dtype=dtype
+    )
+    return result
+
+
+def _clean_strings(
+    values: np.ndarray,
+    strip: bool,
+    case: Optional[StringCase],
+) -> np.ndarray:
+    """Strip and re-case the string entries of an object array."""
+    recase = _STRING_CASES[case] if case is not None else None
+    cleaned = values.copy()
+
+    for position, value in enumerate(values):
+        if isinstance(value, str):
+            value = value.strip() if strip else value
+            cleaned[position] = recase(value) if recase is not None else value
+
+    return cleaned
+
+
+@row_local
 def fill_nulls_with_value(df: pd.DataFrame, column: str, value: Any) -> pd.DataFrame:
     """
     Fill null values in a specific column with a fixed value.
     """
-    df_copy = df.copy()
+    df_copy = _writable(df)
     df_copy[column] = df_copy[column].fillna(value)
     return df_copy
 
 
+@row_local
+def select_columns(df: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
+    """
+    Keep only the given columns, in that order.
+    """
+    return df[columns]
+
+
+@row_local
 def rename_columns(df: pd.DataFrame, mapping: Dict[str, str]) -> pd.DataFrame:
     """
     Rename columns using a mapping dictionary.
@@ -198,25 +742,681 @@ def rename_columns(df: pd.DataFrame, mapping: Dict[str, str]) -> pd.DataFrame:
     return df.rename(columns=mapping)
 
 
+@row_local
 def cast_column_to_numeric(df: pd.DataFrame, column: str) -> pd.DataFrame:
     """
     Cast a column to numeric type.
     """
-    df_copy = df.copy()
+    df_copy = _writable(df)
     df_copy[column] = pd.to_numeric(df_copy[column], errors="coerce")
     return df_copy
 
 
+def optimize_memory(
+    df: Frames,
+    *,
+    dtypes: Optional[Mapping[str, Any]] = None,
+    category_threshold: float = 0.5,
+    arrow_strings: bool = True,
+    narrow_ints: bool = False,
+) -> Frames:
+    """
+    Shrink a DataFrame to the smallest dtypes that hold its values.
+
+    - Integer columns become int32 when their values fit. With
+      `narrow_ints`, they are downcast to the smallest (unsigned if no
+      value is negative) integer dtype instead; later arithmetic then
+      wraps around silently at that dtype's range (e.g. create_sum_column
+      on two uint8 columns wraps at 255), so only use it for columns
+      that are stored or compared, not computed on.
+    - Float columns are downcast to float32 when every value round-trips
+      exactly.
+    - String columns whose ratio of distinct values to rows is at most
+      `category_threshold` become `category`.
+    - Remaining string columns become Arrow-backed strings when pyarrow
+      is installed.
+
+    The result carries two entries in `df.attrs`:
+
+    - 'memory_report': total and per-column `memory_usage(deep=True)`
+      before and after, with the dtype changes.
+    - 'dtype_map': column -> dtype name, which can be passed back as
+      `dtype=` to extract_from_csv / extract_from_excel, or as `dtypes`
+      to this function to apply the same dtypes without re-analyzing.
+
+    A chunk stream needs a `dtypes` map (e.g. from a sample), since
+    dtypes chosen per chunk could differ or overflow in later chunks.
+    'category' columns still take their categories from each chunk.
+
+    Parameters
+    ----------
+    df : pd.DataFrame or iterator of pd.DataFrame
+        Input DataFrame or stream of DataFrame chunks.
+    dtypes : mapping of str to dtype, optional
+        Dtypes to apply instead of analyzing the data.
+    category_threshold : float
+        Maximum distinct-to-rows ratio for a string column to become
+        categorical.
+    arrow_strings : bool
+        Whether to convert remaining string columns to Arrow strings.
+    narrow_ints : bool
+        Whether to downcast integers below int32.
+
+    Returns
+    -------
+    pd.DataFrame or iterator of pd.DataFrame
+        DataFrame (or chunk stream) with optimized dtypes.
+
+    Raises
+    ------
+    ValueError
+        If a chunk stream is given without dtypes.
+    """
+    if not isinstance(df, pd.DataFrame):
+        if dtypes is None:
+            raise ValueError(
+                "Optimizing a chunk stream needs a dtype map; compute it on a "
+                "sample with optimize_memory and pass it as 'dtypes'"
+            )
+        dtype_map = dict(dtypes)
+        return (chunk.astype(dtype_map) for chunk in df)
+
+    if dtypes is None:
+        dtypes = _smallest_dtypes(df, category_threshold, arrow_strings, narrow_ints)
+
+    before = df.memory_usage(deep=True, index=False)
+    result = df.astype(dict(dtypes))
+    after = result.memory_usage(deep=True, index=False)
+
+    result.attrs["dtype_map"] = {str(col): str(dtype) for col, dtype in dtypes.items()}
+    result.attrs["memory_report"] = {
+        "before_bytes": int(before.sum()),
+        "after_bytes": int(after.sum()),
+        "columns": {
+            str(col): {
+                "before_dtype": str(df[col].dtype),
+                "after_dtype": str(result[col].dtype),
+                "before_bytes": int(before[col]),
+                "after_bytes": int(after[col]),
+            }
+            for col in df.columns
+        },
+    }
+
+    return result
+
+
+def _smallest_dtypes(
+    df: pd.DataFrame,
+    category_threshold: float,
+    arrow_strings: bool,
+    narrow_ints: bool,
+) -> Dict[Any, Any]:
+    """Pick the smallest safe dtype for each column of a DataFrame."""
+    arrow_string = (
+        "string[pyarrow]"
+        if arrow_strings and importlib.util.find_spec("pyarrow") is not None
+        else None
+    )
+    dtypes: Dict[Any, Any] = {}
+
+    for col in df.columns:
+        series = df[col]
+        dtype = series.dtype
+
+        if pd.api.types.is_integer_dtype(dtype) and isinstance(dtype, np.dtype):
+            if narrow_ints:
+                downcast: Literal["unsigned", "integer"] = (
+                    "unsigned" if len(series) and series.min() >= 0 else "integer"
+                )
+                dtypes[col] = pd.to_numeric(series, downcast=downcast).dtype
+            elif dtype.itemsize > 4 and _fits_int32(series):
+                dtypes[col] = np.dtype(np.int32)
+        elif dtype == np.float64:
+            values = series.to_numpy()
+            narrowed = values.astype(np.float32)
+            if np.array_equal(narrowed.astype(np.float64), values, equal_nan=True):
+                dtypes[col] = np.dtype(np.float32)
+        elif pd.api.types.is_string_dtype(dtype) and (
+            pd.api.types.infer_dtype(series, skipna=True) in ("string", "empty")
+        ):
+            if len(series) and series.nunique() / len(series) <= category_threshold:
+                dtypes[col] = "category"
+            elif arrow_string is not None and (
+                getattr(dtype, "storage", None) != "pyarrow"
+            ):
+                dtypes[col] = arrow_string
+
+    return dtypes
+
+
+def _fits_int32(series: pd.Series) -> bool:
+    """Whether every value of an integer series fits in int32."""
+    if series.empty:
+        return True
+
+    bounds = np.iinfo(np.int32)
+    return bool(series.min() >= bounds.min and series.max() <= bounds.max)
+
+
 def sort_by_column(
-    df: pd.DataFrame, column: str, ascending: bool = True
+    df: Frames,
+    column: Union[str, Sequence[str]],
+    ascending: Union[bool, Sequence[bool]] = True,
+    *,
+    top_k: Optional[int] = None,
+    chunksize: int = 100_000,
+    spill_dir: Optional[str] = None,
+) -> Frames:
+    """
+    Sort a DataFrame, or a chunk stream, by one or more columns.
+
+    The sort is stable: rows with equal keys keep their input order, and
+    rows with missing keys come last.
+
+    - With `top_k`, only the first `top_k` rows of the sorted order are
+      returned, selected with nsmallest/nlargest (partial selection)
+      when the keys are numeric and share one direction. A chunk stream
+      keeps only the running top `top_k` rows in memory.
+    - A chunk stream without `top_k` is sorted out of core: each chunk
+      is sorted and spilled to disk as a run, and the runs are k-way
+      merged into a stream of sorted chunks. Memory is bounded by about
+      two blocks of rows per run, not by the size of the data.
+
+    Parameters
+    ----------
+    df:
+        DataFrame or iterator of DataFrame chunks.
+    column:
+        Column, or list of columns, to sort by.
+    ascending:
+        Sort direction, or one direction per column.
+    top_k:
+        Optional number of leading rows to keep (e.g. 'latest N' with
+        ascending=False).
+    chunksize:
+        Rows per chunk yielded by the out-of-core sort.
+    spill_dir:
+        Directory for the sorted runs of the out-of-core sort. Defaults
+        to the system temporary directory. Runs are deleted once the
+        output is exhausted or closed.
+
+    Returns
+    -------
+    pd.DataFrame or iterator of pd.DataFrame
+        Sorted DataFrame; the top `top_k` rows as a DataFrame; or, for
+        a chunk stream without `top_k`, an iterator of sorted chunks.
+    """
+    columns = [column] if isinstance(column, str) else list(column)
+    directions = (
+        [ascending] * len(columns) if isinstance(ascending, bool) else list(ascending)
+    )
+
+    if isinstance(df, pd.DataFrame):
+        if top_k is not None:
+            return _top_rows(df, columns, directions, top_k)
+        return df.sort_values(by=columns, ascending=directions, kind="stable")
+
+    if top_k is not None:
+        # Running top rows; earlier rows come first, so ties stay stable
+        top = None
+        for chunk in df:
+            candidates = chunk if top is None else pd.concat([top, chunk])
+            top = _top_rows(candidates, columns, directions, top_k)
+        return top if top is not None else pd.DataFrame()
+
+    return _external_sort(df, columns, directions, chunksize, spill_dir)
+
+
+def _top_rows(
+    df: pd.DataFrame,
+    columns: List[str],
+    directions: List[bool],
+    top_k: int,
+) -> pd.DataFrame:
+    """Return the first `top_k` rows of the stable sorted order of a frame."""
+    wanted = min(top_k, len(df))
+    numeric = all(pd.api.types.is_numeric_dtype(df[col]) for col in columns)
+
+    if numeric and len(set(directions)) == 1:
+        select = df.nsmallest if directions[0] else df.nlargest
+        top = select(top_k, columns, keep="first")
+        # Partial selection leaves out missing keys; fall back if they are needed
+        if len(top) == wanted:
+            return top
+
+    return df.sort_values(by=columns, ascending=directions, kind="stable").head(top_k)
+
+
+# Rows per block written to, and read back from, a sorted run
+_RUN_BLOCK_ROWS = 10_000
+
+
+def _external_sort(
+    chunks: Iterable[pd.DataFrame],
+    columns: List[str],
+    directions: List[bool],
+    chunksize: int,
+    spill_dir: Optional[str],
+) -> FrameChunks:
+    """Sort chunks into runs on disk and k-way merge them."""
+    with tempfile.TemporaryDirectory(prefix="fragua-sort-", dir=spill_dir) as tmp:
+        runs = _spill_runs(chunks, columns, directions, Path(tmp))
+        yield from _rechunk(_merge_runs(runs, columns, directions), chunksize)
+
+
+def _spill_runs(
+    chunks: Iterable[pd.DataFrame],
+    columns: List[str],
+    directions: List[bool],
+    directory: Path,
+) -> List[Path]:
+    """Sort each chunk and write it to disk as a run of pickled blocks."""
+    runs: List[Path] = []
+
+    for chunk in chunks:
+        if chunk.empty:
+            continue
+
+        path = directory / f"run-{len(runs):06d}.pkl"
+        ordered = chunk.sort_values(by=columns, ascending=directions, kind="stable")
+        with path.open("wb") as file:
+            for start in range(0, len(ordered), _RUN_BLOCK_ROWS):
+                block = ordered.iloc[start : start + _RUN_BLOCK_ROWS]
+                pickle.dump(block, file, protocol=pickle.HIGHEST_PROTOCOL)
+        runs.append(path)
+
+    return runs
+
+
+def _rechunk(frames: Iterable[pd.DataFrame], chunksize: int) -> FrameChunks:
+    """Regroup a stream of frames of any size into chunks of `chunksize` rows."""
+    pending: List[pd.DataFrame] = []
+    rows = 0
+
+    for frame in frames:
+        pending.append(frame)
+        rows += len(frame)
+        while rows >= chunksize:
+            batch = pd.concat(pending)
+            yield batch.iloc[:chunksize]
+            pending, rows = [batch.iloc[chunksize:]], rows - chunksize
+
+    if rows:
+        yield pd.concat(pending)
+
+
+def _read_blocks(path: Path) -> FrameChunks:
+    """Yield the blocks of a sorted run in order."""
+    with path.open("rb") as file:
+        while True:
+            try:
+                yield pickle.load(file)
+            except EOFError:
+                return
+
+
+def _merge_runs(
+    runs: List[Path],
+    columns: List[str],
+    directions: List[bool],
+) -> FrameChunks:
+    """
+    K-way merge sorted runs, a batch of rows at a time.
+
+    Each run keeps at least one block of rows buffered. The buffered rows
+    are sorted by the keys, then run and position within run, which keeps
+    the merge stable. Every row up to the first buffered row that ends a
+    run's loaded blocks (while that run has more on disk) is final and
+    emitted; runs left with less than a block are refilled.
+    """
+    readers = [_read_blocks(path) for path in runs]
+    loaded = np.full(len(runs), -1, dtype=np.int64)
+    more = np.ones(len(runs), dtype=bool)
+    buffered = np.zeros(len(runs), dtype=np.int64)
+    carry: Optional[pd.DataFrame] = None
+    carry_run = np.empty(0, dtype=np.int64)
+    carry_seq = np.empty(0, dtype=np.int64)
+
+    while True:
+        blocks = [carry] if carry is not None else []
+        block_runs, block_seqs = [carry_run], [carry_seq]
+        for run in np.flatnonzero(more & (buffered < _RUN_BLOCK_ROWS)):
+            block = next(readers[run], None)
+            if block is None:
+                more[run] = False
+                continue
+            blocks.append(block)
+            block_runs.append(np.full(len(block), run, dtype=np.int64))
+            block_seqs.append(np.arange(len(block)) + loaded[run] + 1)
+            loaded[run] += len(block)
+            buffered[run] += len(block)
+
+        if not blocks:
+            return
+
+        buffer = pd.concat(blocks)
+        buffer_run = np.concatenate(block_runs)
+        buffer_seq = np.concatenate(block_seqs)
+
+        keys = buffer[columns].set_axis(range(len(columns)), axis=1)
+        keys = keys.reset_index(drop=True).assign(run=buffer_run, seq=buffer_seq)
+        order = keys.sort_values(
+            by=list(keys.columns), ascending=[*directions, True, True]
+        ).index.to_numpy()
+
+        sorted_run, sorted_seq = buffer_run[order], buffer_seq[order]
+        # Rows after a run's last loaded row may precede its unread rows
+        boundary = more[sorted_run] & (sorted_seq == loaded[sorted_run])
+        cut = int(boundary.argmax()) + 1 if boundary.any() else len(order)
+
+        emitted, kept = order[:cut], order[cut:]
+        yield buffer.iloc[emitted]
+
+        carry = buffer.iloc[kept] if kept.size else None
+        carry_run, carry_seq = buffer_run[kept], buffer_seq[kept]
+        buffered = np.bincount(carry_run, minlength=len(runs))
+
+        if carry is None and not more.any():
+            return
+
+
+def apply_transformations(
+    df: Frames,
+    steps: Sequence[TransformationStep],
+    *,
+    copy: bool = True,
+) -> Frames:
+    """
+    Apply a chain of transformations, copying each frame at most once.
+
+    Called on their own, transformations never modify their input and
+    copy it defensively. Within this chain, the frame is copied once at
+    the entry (or not at all with `copy=False`) and the steps then
+    modify the chain-owned frame in place instead of copying it again.
+    A new frame returned by a step (e.g. the rows kept by a filter) is
+    copied by the next step that modifies it, and owned from then on.
+    Frames other than the chain's are never modified.
+
+    An iterator of DataFrame chunks is processed lazily, running the
+    whole chain on each chunk in turn.
+
+    Parameters
+    ----------
+    df:
+        DataFrame, or iterator of DataFrame chunks, to transform.
+    steps:
+        Transformations to apply in order, each either a callable taking
+        the frame or a `(callable, kwargs)` tuple.
+    copy:
+        Whether to copy the input first. Pass False only when the caller
+        no longer needs the input, which then may be modified.
+
+    Returns
+    -------
+    Frames
+        Transformed DataFrame, or iterator of transformed chunks.
+    """
+    if not isinstance(df, pd.DataFrame):
+        return (_apply_chain(chunk, steps, copy) for chunk in df)
+
+    return _apply_chain(df, steps, copy)
+
+
+def _apply_chain(
+    df: pd.DataFrame,
+    steps: Sequence[TransformationStep],
+    copy: bool,
+) -> pd.DataFrame:
+    """Run transformation steps on a frame owned by the chain."""
+    result: Any = df.copy(deep=not _copy_on_write_enabled()) if copy else df
+    owned: List[pd.DataFrame] = [result]
+    token = _OWNED_FRAMES.set(owned)
+
+    try:
+        for step in steps:
+            func, kwargs = step if isinstance(step, tuple) else (step, {})
+            result = func(result, **kwargs)
+            # The chain keeps owning its frame, or the copy a step made of
+            # it; new frames (e.g. filtered results) are copied on write
+            owned[:] = [frame for frame in owned if frame is result]
+    finally:
+        _OWNED_FRAMES.reset(token)
+
+    return cast(pd.DataFrame, result)
+
+
+def apply_transformations_parallel(
+    df: pd.DataFrame,
+    steps: Sequence[TransformationStep],
+    *,
+    max_workers: Optional[int] = None,
+    partitions: Optional[int] = None,
 ) -> pd.DataFrame:
     """
-    Sort DataFrame by a column.
+    Apply a chain of transformations over row partitions in worker processes.
+
+    The frame is split into contiguous row partitions and each run of
+    row-local steps (see row_local) is applied to every partition in its
+    own process. Steps that need the whole frame are handled with a
+    combine phase, so the result matches apply_transformations:
+
+    - fill_missing_values without `means`: each worker returns partial
+      column sums and counts, which are merged into global means that
+      the next phase fills with.
+    - sort_by_column: each worker sorts its partition (or keeps its
+      `top_k` rows) and the results are merged with a stable sort.
+    - parse_datetime_column runs on the partitions only with a fixed
+      format and timezone handling (see its docstring).
+    - Any other step not marked row-local runs in this process on the
+      concatenated frame.
+
+    Where the 'fork' start method is available, workers inherit the
+    partitions and steps from this process instead of receiving a
+    pickled copy, so only the transformed partitions are sent back;
+    steps may then also be lambdas. Means may differ from a serial run
+    in the last floating-point digits, since partitions are summed
+    separately.
+
+    Parameters
+    ----------
+    df:
+        DataFrame to transform. For chunk streams, use
+        apply_transformations.
+    steps:
+        Transformations to apply in order, each either a callable taking
+        the frame or a `(callable, kwargs)` tuple.
+    max_workers:
+        Maximum number of worker processes. Defaults to the number of
+        CPUs; 1 runs the chain in this process.
+    partitions:
+        Number of row partitions. Defaults to one per worker.
+
+    Returns
+    -------
+    pd.DataFrame
+        Transformed DataFrame, with the index of the rows kept.
     """
-    return df.sort_values(by=column, ascending=ascending)
+    workers = max_workers or os.cpu_count() or 1
+    if workers <= 1 or len(df) < 2:
+        return _apply_chain(df, steps, True)
+
+    parts = _split_rows(df, partitions or workers)
+    prelude: List[TransformationStep] = []
+    phases = _plan_phases(steps)
+
+    for position, (segment, barrier) in enumerate(phases):
+        if not any(len(part) for part in parts):
+            # No rows left to partition; the rest of the chain still shapes
+            # the columns of the empty result
+            remaining = prelude + [
+                step
+                for later, end in phases[position:]
+                for step in [*later, *([end] if end is not None else [])]
+            ]
+            return _apply_chain(pd.concat(parts), remaining, False)
+
+        reduced = barrier is not None and _step_parts(barrier)[0] in _COMBINED_STEPS
+        chain = prelude + segment
+
+        outputs: List[Tuple[pd.DataFrame, Any]] = [(part, None) for part in parts]
+        if chain or reduced:
+            outputs = _map_partitions(
+                parts, chain, barrier if reduced else None, workers
+            )
+        parts, prelude = _combine(outputs, barrier)
+
+    return pd.concat(parts)
+
+
+# Partitions and steps inherited by forked workers, by phase id, so that
+# concurrent calls do not overwrite each other's state
+_PARTITION_STATES: Dict[int, Dict[str, Any]] = {}
+_PHASE_IDS = itertools.count()
+
+# Global steps finished by a combine phase rather than in this process
+_COMBINED_STEPS = (fill_missing_values, sort_by_column)
+
+
+def _step_parts(step: TransformationStep) -> Tuple[Callable[..., Frames], Any]:
+    """Return the function and kwargs of a transformation step."""
+    return step if isinstance(step, tuple) else (step, {})
+
+
+def _combine(
+    outputs: List[Tuple[pd.DataFrame, Any]],
+    barrier: Optional[TransformationStep],
+) -> Tuple[List[pd.DataFrame], List[TransformationStep]]:
+    """
+    Finish a global step from the partition outputs of a phase.
+
+    Returns the partitions for the next phase and the steps it must run
+    first.
+    """
+    parts = [frame for frame, _ in outputs]
+    if barrier is None:
+        return parts, []
+
+    func, kwargs = _step_parts(barrier)
+
+    if func is fill_missing_values:
+        sums: Dict[Hashable, float] = {}
+        counts: Dict[Hashable, int] = {}
+        for _, totals in outputs:
+            _add_numeric_totals(sums, counts, totals)
+        # The fill itself is row-local once the means are known
+        return parts, [(fill_missing_values, {"means": _means(sums, counts)})]
+
+    if func is sort_by_column:
+        # Stable sort detects the sorted partitions as runs and merges them
+        merged = _sort_partition(pd.concat(parts), kwargs)
+        return _split_rows(merged, len(parts)), []
+
+    result = _apply_chain(pd.concat(parts), [barrier], False)
+    return _split_rows(result, len(parts)), []
+
+
+def _sort_partition(df: pd.DataFrame, kwargs: Mapping[str, Any]) -> pd.DataFrame:
+    """Sort a frame with the arguments of a sort_by_column step."""
+    return cast(pd.DataFrame, sort_by_column(df, **kwargs))
+
+
+def _plan_phases(
+    steps: Sequence[TransformationStep],
+) -> List[Tuple[List[TransformationStep], Optional[TransformationStep]]]:
+    """Group steps into runs of row-local steps, each ended by a global step."""
+    phases: List[Tuple[List[TransformationStep], Optional[TransformationStep]]] = []
+    segment: List[TransformationStep] = []
+
+    for step in steps:
+        func, kwargs = _step_parts(step)
+        local = (
+            getattr(func, "row_local", False)
+            or (func is fill_missing_values and kwargs.get("means") is not None)
+            or (
+                func is parse_datetime_column
+                and _fixed_datetime_parsing(
+                    kwargs.get("date_format"), kwargs.get("utc", False)
+                )
+            )
+        )
+        if local:
+            segment.append(step)
+        else:
+            phases.append((segment, step))
+            segment = []
+
+    phases.append((segment, None))
+    return phases
+
+
+def _split_rows(df: pd.DataFrame, partitions: int) -> List[pd.DataFrame]:
+    """
+    Split a frame into at most `partitions` contiguous row slices.
+
+    An empty frame gives one empty slice, which keeps its columns.
+    """
+    count = max(min(partitions, len(df)), 1)
+    bounds = np.linspace(0, len(df), count + 1, dtype=int)
+    return [df.iloc[start:stop] for start, stop in zip(bounds[:-1], bounds[1:])]
+
+
+def _map_partitions(
+    parts: List[pd.DataFrame],
+    chain: List[TransformationStep],
+    barrier: Optional[TransformationStep],
+    workers: int,
+) -> List[Tuple[pd.DataFrame, Any]]:
+    """Run one phase over every partition in a process pool."""
+    state = {"parts": parts, "chain": chain, "barrier": barrier}
+    workers = min(workers, len(parts))
+
+    if "fork" in multiprocessing.get_all_start_methods():
+        # Forked workers read the state from memory inherited from this process
+        phase = next(_PHASE_IDS)
+        _PARTITION_STATES[phase] = state
+        try:
+            with ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("fork")
+            ) as executor:
+                return list(
+                    executor.map(
+                        _run_partition, range(len(parts)), itertools.repeat(phase)
+                    )
+                )
+        finally:
+            del _PARTITION_STATES[phase]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(
+            executor.map(
+                _run_partition,
+                range(len(parts)),
+                [{**state, "parts": {index: part}} for index, part in enumerate(parts)],
+            )
+        )
+
+
+def _run_partition(
+    index: int,
+    state: Union[int, Dict[str, Any]],
+) -> Tuple[pd.DataFrame, Any]:
+    """Transform one partition and reduce it; runs in a worker process."""
+    if not isinstance(state, dict):
+        # Forked worker: the state was inherited under its phase id
+        state = _PARTITION_STATES[state]
+    frame = _apply_chain(state["parts"][index], state["chain"], True)
+    if state["barrier"] is None:
+        return frame, None
+
+    func, kwargs = _step_parts(state["barrier"])
+    if func is fill_missing_values:
+        return frame, _numeric_totals(frame)
+
+    return _sort_partition(frame, kwargs), None
 
 
-TRANSFORMATION_FUNCTIONS: List[Callable[..., pd.DataFrame]] = [
+TRANSFORMATION_FUNCTIONS: List[Callable[..., Frames]] = [
     strip_whitespace,
     fill_missing_values,
     add_total_price_derived_column,
@@ -227,8 +1427,13 @@ TRANSFORMATION_FUNCTIONS: List[Callable[..., pd.DataFrame]] = [
     filter_by_min_value,
     create_sum_column,
     cast_column_to_numeric,
+    select_columns,
     rename_columns,
     fill_nulls_with_value,
     strip_string_columns,
+    normalize_string_columns,
+    optimize_memory,
     sort_by_column,
+    apply_transformations,
+    apply_transformations_parallel,
 ]
@@ -1,7 +1,18 @@
 """Sets module."""
 
-from .sets_config import (
-    FRAGUA_SETS,
-)
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .sets_config import FRAGUA_SETS
 
 __all__ = ["FRAGUA_SETS"]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the sets configuration, and its functions, on first access."""
+    if name == "FRAGUA_SETS":
+        from . import sets_config
+
+        return sets_config.FRAGUA_SETS
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
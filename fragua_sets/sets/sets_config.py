@@ -1,12 +1,14 @@
 """Configuration for Sets."""
 
-from typing import Any, Dict, List
+from threading import Lock
+from typing import Any, Dict, List, Optional
 from fragua import FraguaSet
 
 from fragua_sets.functions.extraction import EXTRACTION_FUNCTIONS
 from fragua_sets.functions.loading import LOADING_FUNCTIONS
 from fragua_sets.functions.transformation import TRANSFORMATION_FUNCTIONS
 from fragua_sets.functions.utility import UTILITY_FUNCTIONS
+from fragua_sets.utils.instrumentation import MetricsSink, instrument
 
 FUNCTION_LISTS: Dict[str, Dict[str, Any]] = {
     "extraction": {"functions": EXTRACTION_FUNCTIONS},
@@ -16,8 +18,28 @@ FUNCTION_LISTS: Dict[str, Dict[str, Any]] = {
 }
 
 
-def create_sets() -> List[FraguaSet]:
-    """Create a list of FraguaSet objects from FUNCTION_LISTS."""
+def create_sets(
+    *,
+    sink: Optional[MetricsSink] = None,
+    deep_memory: bool = False,
+) -> List[FraguaSet]:
+    """
+    Create a list of FraguaSet objects from FUNCTION_LISTS.
+
+    Instrumentation is opt-in: with a sink, every registered function
+    is wrapped to report per-call StepMetrics (wall/CPU time, row and
+    column counts, frame memory, bytes read/written by I/O functions)
+    to it. Without a sink the raw functions are registered, so there
+    is no overhead.
+
+    Parameters
+    ----------
+    sink:
+        Optional metrics sink, e.g. AggregatingSink, JsonLinesSink or
+        PrometheusTextfileSink from fragua_sets.utils.instrumentation.
+    deep_memory:
+        Whether frame memory is measured with memory_usage(deep=True).
+    """
     sets_list: List[FraguaSet] = []
 
     for set_name, items in FUNCTION_LISTS.items():
@@ -28,6 +50,14 @@ def create_sets() -> List[FraguaSet]:
             func_name = getattr(func, "__name__", f"{set_name}_func_{idx}")
             if func_name == "<lambda>":
                 func_name = f"{set_name}_lambda_{idx}"
+            if sink is not None:
+                func = instrument(
+                    func,
+                    set_name=set_name,
+                    sink=sink,
+                    deep_memory=deep_memory,
+                    name=func_name,
+                )
             func_dict[func_name] = func
 
         func_set = FraguaSet(
@@ -40,4 +70,17 @@ def create_sets() -> List[FraguaSet]:
     return sets_list
 
 
-FRAGUA_SETS: List[FraguaSet] = create_sets()
+_SETS_LOCK = Lock()
+
+
+def __getattr__(name: str) -> Any:
+    """Create FRAGUA_SETS on first access instead of at import time."""
+    if name != "FRAGUA_SETS":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    with _SETS_LOCK:
+        # Cache as a module global so later accesses skip this hook
+        if "FRAGUA_SETS" not in globals():
+            globals()["FRAGUA_SETS"] = create_sets()
+
+    return globals()["FRAGUA_SETS"]
@@ -0,0 +1,434 @@
+"""On-disk cache for extraction results."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from collections import OrderedDict
+from functools import wraps
+from pathlib import Path
+from threading import Lock
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Optional,
+    ParamSpec,
+    TypedDict,
+    TypeVar,
+    Union,
+    cast,
+)
+
+from fragua_sets.utils.files import expand_paths, is_glob
+from fragua_sets.utils.lazy import lazy_import
+from fragua_sets.utils.optional import import_optional
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import sqlalchemy as sa
+else:
+    pd = lazy_import("pandas")
+    sa = lazy_import("sqlalchemy")
+
+# pylint: disable=too-many-instance-attributes
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+_INDEX_FILE = "index.json"
+
+
+class CacheStats(TypedDict):
+    """Counters and size of an ExtractionCache."""
+
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    size_bytes: int
+
+
+class ExtractionCache:
+    """
+    Size-bounded on-disk cache of extraction results.
+
+    Results are stored as Arrow IPC snapshots, which are read back
+    through a memory map instead of re-parsing the source. Frames that
+    Arrow cannot represent (e.g. mixed-type object columns) fall back
+    to a pickle snapshot.
+
+    Entries are keyed by a fingerprint of the extraction call (see
+    `cached`). When the total snapshot size exceeds `max_bytes`, the
+    least recently used entries are evicted; entries older than `ttl`
+    seconds are treated as misses and removed. The index is kept in the
+    cache directory, so recency and expiry survive across runs.
+
+    Parameters
+    ----------
+    directory:
+        Directory holding the snapshots and the index.
+    max_bytes:
+        Maximum total size of the snapshots.
+    ttl:
+        Optional time to live of an entry, in seconds.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, "os.PathLike[str]"],
+        *,
+        max_bytes: int = 1 << 30,
+        ttl: Optional[float] = None,
+    ) -> None:
+        if max_bytes < 1:
+            raise ValueError(f"max_bytes must be a positive integer, got {max_bytes}")
+
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = Lock()
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._index = self._load_index()
+
+    @property
+    def stats(self) -> CacheStats:
+        """Return the hit/miss/eviction counters and the cache size."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._index),
+                "size_bytes": sum(entry["size"] for entry in self._index.values()),
+            }
+
+    def get(self, key: str) -> Optional[pd.DataFrame]:
+        """
+        Return the cached result for a key, or None on a miss.
+
+        Parameters
+        ----------
+        key:
+            Cache key.
+
+        Returns
+        -------
+        pd.DataFrame or None
+            Cached DataFrame, or None if absent or expired.
+        """
+        with self._lock:
+            entry = self._index.get(key)
+
+            if entry is not None and self._expired(entry):
+                self._remove(key)
+                self._save_index()
+                entry = None
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            try:
+                df = _read_snapshot(self.directory / entry["file"])
+            except OSError:
+                # Snapshot removed behind our back
+                self._remove(key)
+                self._save_index()
+                self.misses += 1
+                return None
+
+            entry["accessed"] = time.time()
+            self._index.move_to_end(key)
+            self._save_index()
+            self.hits += 1
+
+            return df
+
+    def metadata(self, key: str) -> Optional[Dict[str, str]]:
+        """
+        Return the metadata stored with an unexpired entry.
+
+        Looking up metadata does not load the snapshot, count as a hit or
+        miss, or refresh the entry's recency.
+
+        Parameters
+        ----------
+        key:
+            Cache key.
+
+        Returns
+        -------
+        dict or None
+            Metadata given to `put`, or None if the entry is absent or
+            expired.
+        """
+        with self._lock:
+            entry = self._index.get(key)
+            if entry is None or self._expired(entry):
+                return None
+
+            return dict(entry.get("metadata") or {})
+
+    def refresh(
+        self,
+        key: str,
+        *,
+        metadata: Optional[Dict[str, str]] = None,
+    ) -> bool:
+        """
+        Restart the time to live of an entry, e.g. after revalidating it.
+
+        The snapshot is kept as is; the entry becomes the most recently
+        used one.
+
+        Parameters
+        ----------
+        key:
+            Cache key.
+        metadata:
+            Optional metadata merged into the entry's metadata (e.g. new
+            HTTP validators).
+
+        Returns
+        -------
+        bool
+            True if the entry exists, False otherwise.
+        """
+        with self._lock:
+            entry = self._index.get(key)
+            if entry is None:
+                return False
+
+            now = time.time()
+            entry["created"] = entry["accessed"] = now
+            entry["metadata"] = {**(entry.get("metadata") or {}), **(metadata or {})}
+            self._index.move_to_end(key)
+            self._save_index()
+
+            return True
+
+    def put(
+        self,
+        key: str,
+        df: pd.DataFrame,
+        *,
+        metadata: Optional[Dict[str, str]] = None,
+    ) -> None:
+        """
+        Store a result, evicting least recently used entries if needed.
+
+        Parameters
+        ----------
+        key:
+            Cache key.
+        df:
+            DataFrame to store.
+        metadata:
+            Optional string metadata kept in the index with the entry
+            (e.g. HTTP validators).
+        """
+        with self._lock:
+            if key in self._index:
+                self._remove(key)
+
+            file_name = _write_snapshot(self.directory, key, df)
+            now = time.time()
+            self._index[key] = {
+                "file": file_name,
+                "size": (self.directory / file_name).stat().st_size,
+                "created": now,
+                "accessed": now,
+                "metadata": metadata or {},
+            }
+
+            # Evict from the least recently used end, keeping the new entry
+            total = sum(entry["size"] for entry in self._index.values())
+            while total > self.max_bytes and len(self._index) > 1:
+                oldest = next(iter(self._index))
+                total -= self._index[oldest]["size"]
+                self._remove(oldest)
+                self.evictions += 1
+
+            self._save_index()
+
+    def clear(self) -> None:
+        """Remove every entry from the cache."""
+        with self._lock:
+            for key in list(self._index):
+                self._remove(key)
+            self._save_index()
+
+    def cached(
+        self,
+        func: Callable[P, R],
+        *,
+        hash_contents: bool = False,
+    ) -> Callable[P, R]:
+        """
+        Wrap an extraction function so its DataFrame results are cached.
+
+        The key fingerprints the function and every argument: existing
+        file paths by absolute path, modification time and size (plus a
+        content hash if `hash_contents`), engines by their URL (without
+        password), and other values by their repr. Queries and their
+        parameters are therefore part of the key, and editing a source
+        file invalidates its entries.
+
+        Results that are not DataFrames (e.g. chunk streams) are returned
+        without being cached.
+
+        Parameters
+        ----------
+        func:
+            Extraction function to wrap.
+        hash_contents:
+            Also hash the contents of file arguments, for sources whose
+            modification time is not reliable.
+
+        Returns
+        -------
+        Callable
+            Function with the same signature, served from the cache.
+        """
+
+        @wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            parts = [f"{func.__module__}.{func.__qualname__}"]
+            parts += [
+                source_fingerprint(arg, hash_contents=hash_contents) for arg in args
+            ]
+            parts += [
+                f"{name}={source_fingerprint(value, hash_contents=hash_contents)}"
+                for name, value in sorted(kwargs.items())
+            ]
+            key = hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+            cached_df = self.get(key)
+            if cached_df is not None:
+                return cached_df  # type: ignore[return-value]
+
+            result = func(*args, **kwargs)
+            if isinstance(result, pd.DataFrame):
+                self.put(key, result)
+
+            return result
+
+        return wrapper
+
+    def _expired(self, entry: Dict[str, Any]) -> bool:
+        """Return True if an entry is older than the TTL."""
+        return self.ttl is not None and time.time() - entry["created"] > self.ttl
+
+    def _remove(self, key: str) -> None:
+        """Drop an entry and its snapshot."""
+        entry = self._index.pop(key)
+        (self.directory / entry["file"]).unlink(missing_ok=True)
+
+    def _load_index(self) -> "OrderedDict[str, Dict[str, Any]]":
+        """Load the index ordered from least to most recently used."""
+        path = self.directory / _INDEX_FILE
+        if not path.exists():
+            return OrderedDict()
+
+        with path.open("r", encoding="utf-8") as file:
+            entries: Dict[str, Dict[str, Any]] = json.load(file)
+
+        return OrderedDict(
+            sorted(entries.items(), key=lambda item: item[1]["accessed"])
+        )
+
+    def _save_index(self) -> None:
+        """Atomically replace the index file."""
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as file:
+            json.dump(self._index, file)
+        os.replace(tmp_path, self.directory / _INDEX_FILE)
+
+
+def source_fingerprint(value: Any, *, hash_contents: bool = False) -> str:
+    """
+    Fingerprint an extraction argument for use in a cache key.
+
+    Parameters
+    ----------
+    value:
+        Argument value.
+    hash_contents:
+        Also hash the contents of existing files.
+
+    Returns
+    -------
+    str
+        Fingerprint string.
+    """
+    if isinstance(value, sa.engine.Engine):
+        return value.url.render_as_string(hide_password=True)
+
+    # Glob patterns and path lists cover every file they currently match
+    if isinstance(value, (list, tuple)) or (
+        isinstance(value, (str, os.PathLike)) and is_glob(value)
+    ):
+        try:
+            paths = expand_paths(value)
+        except (FileNotFoundError, TypeError):
+            return repr(value)
+        return "|".join(
+            source_fingerprint(path, hash_contents=hash_contents) for path in paths
+        )
+
+    if isinstance(value, (str, os.PathLike)) and os.path.isfile(value):
+        stat = os.stat(value)
+        fingerprint = f"{os.path.abspath(value)}:{stat.st_mtime_ns}:{stat.st_size}"
+
+        if hash_contents:
+            digest = hashlib.sha256()
+            with open(value, "rb") as file:
+                for block in iter(lambda: file.read(1 << 20), b""):
+                    digest.update(block)
+            fingerprint += f":{digest.hexdigest()}"
+
+        return fingerprint
+
+    if isinstance(value, dict):
+        return json.dumps(value, sort_keys=True, default=repr)
+
+    return repr(value)
+
+
+def _write_snapshot(directory: Path, key: str, df: pd.DataFrame) -> str:
+    """Write a DataFrame snapshot and return its file name."""
+    pa = import_optional("pyarrow", "parquet")
+
+    try:
+        table = pa.Table.from_pandas(df)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        file_name = f"{key}.pkl"
+        df.to_pickle(directory / file_name)
+        return file_name
+
+    file_name = f"{key}.arrow"
+    with pa.OSFile(str(directory / file_name), "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+
+    return file_name
+
+
+def _read_snapshot(path: Path) -> pd.DataFrame:
+    """Read a DataFrame snapshot written by _write_snapshot."""
+    if path.suffix == ".pkl":
+        return cast(pd.DataFrame, pd.read_pickle(path))
+
+    pa = import_optional("pyarrow", "parquet")
+
+    with pa.memory_map(str(path), "r") as source:
+        return cast(pd.DataFrame, pa.ipc.open_file(source).read_all().to_pandas())
@@ -0,0 +1,123 @@
+"""Chunked DataFrame helpers."""
+
+from __future__ import annotations
+
+from functools import wraps
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Concatenate,
+    Iterable,
+    Iterator,
+    ParamSpec,
+    Union,
+    cast,
+)
+
+from fragua_sets.utils.lazy import lazy_import
+
+if TYPE_CHECKING:
+    import pandas as pd
+else:
+    pd = lazy_import("pandas")
+
+P = ParamSpec("P")
+
+FrameChunks = Iterator["pd.DataFrame"]
+Frames = Union["pd.DataFrame", FrameChunks]
+
+
+def is_chunked(data: object) -> bool:
+    """
+    Check whether an object is a stream of DataFrame chunks.
+
+    Parameters
+    ----------
+    data:
+        Object to inspect.
+
+    Returns
+    -------
+    bool
+        True if the object is an iterable that is not a DataFrame.
+    """
+    return not isinstance(data, pd.DataFrame) and isinstance(data, Iterable)
+
+
+def row_local(
+    func: Callable[Concatenate[pd.DataFrame, P], pd.DataFrame],
+) -> Callable[Concatenate[Frames, P], Frames]:
+    """
+    Make a row-local transformation accept DataFrame chunk streams.
+
+    A row-local transformation produces each output row from its
+    input row alone, so applying it chunk by chunk yields the same
+    result as applying it to the whole frame. The decorated function
+    keeps its behavior for DataFrames and lazily maps itself over
+    chunk iterators, so no more than one chunk is held at a time.
+
+    Parameters
+    ----------
+    func:
+        Transformation whose first argument is a DataFrame.
+
+    Returns
+    -------
+    Callable
+        Transformation accepting a DataFrame or an iterator of chunks.
+    """
+
+    # `df` stays a keyword argument: fragua agents call steps with df=...
+    @wraps(func)
+    def wrapper(df: Frames, *args: P.args, **kwargs: P.kwargs) -> Frames:
+        if isinstance(df, pd.DataFrame):
+            return func(df, *args, **kwargs)
+
+        return (func(chunk, *args, **kwargs) for chunk in df)
+
+    setattr(wrapper, "row_local", True)
+    return cast(Callable[Concatenate[Frames, P], Frames], wrapper)
+
+
+def collect_chunks(data: Frames) -> pd.DataFrame:
+    """
+    Materialize a stream of DataFrame chunks into a single DataFrame.
+
+    Parameters
+    ----------
+    data:
+        DataFrame or iterator of DataFrame chunks.
+
+    Returns
+    -------
+    pd.DataFrame
+        Concatenated DataFrame. DataFrames are returned unchanged.
+    """
+    if isinstance(data, pd.DataFrame):
+        return data
+
+    chunks = list(data)
+    if not chunks:
+        return pd.DataFrame()
+
+    return pd.concat(chunks, ignore_index=True)
+
+
+def iter_chunks(data: Frames) -> FrameChunks:
+    """
+    Iterate over a DataFrame or a stream of chunks uniformly.
+
+    Parameters
+    ----------
+    data:
+        DataFrame or iterator of DataFrame chunks.
+
+    Returns
+    -------
+    Iterator[pd.DataFrame]
+        Iterator yielding the DataFrame once, or each chunk in order.
+    """
+    if isinstance(data, pd.DataFrame):
+        return iter([data])
+
+    return iter(data)
@@ -10,9 +10,22 @@ class ExtractionFunction(str, Enum):
     """Extraction function types."""
 
     EXTRACT_FROM_CSV = "extract_from_csv"
+    EXTRACT_FROM_CSV_FILES = "extract_from_csv_files"
+    EXTRACT_FROM_CSV_CHUNKS = "extract_from_csv_chunks"
+    EXTRACT_FROM_CSV_INCREMENTAL = "extract_from_csv_incremental"
     EXTRACT_FROM_EXCEL = "extract_from_excel"
+    EXTRACT_FROM_EXCEL_CHUNKS = "extract_from_excel_chunks"
+    EXTRACT_FROM_EXCEL_SHEETS = "extract_from_excel_sheets"
+    EXTRACT_FROM_PARQUET = "extract_from_parquet"
+    EXTRACT_FROM_FEATHER = "extract_from_feather"
     EXTRACT_FROM_API = "extract_from_api"
+    EXTRACT_FROM_API_PAGINATED = "extract_from_api_paginated"
+    EXTRACT_FROM_API_MANY = "extract_from_api_many"
     EXTRACT_FROM_DB = "extract_from_database"
+    EXTRACT_FROM_DB_CHUNKS = "extract_from_database_chunks"
+    EXTRACT_FROM_DB_INCREMENTAL = "extract_from_database_incremental"
+    EXTRACT_FROM_DB_PARTITIONED = "extract_from_database_partitioned"
+    EXTRACT_FROM_DB_PARTITIONED_CHUNKS = "extract_from_database_partitioned_chunks"
 
 
 # ----------------------------
@@ -35,10 +48,15 @@ class TransfomationFunction(str, Enum):
     FILTER_BY_MIN_VALUE = "filter_by_min_value"
 
     STRIP_STRING_COLUMNS = "strip_string_columns"
+    NORMALIZE_STRING_COLUMNS = "normalize_string_columns"
     FILL_NULLS_WITH_VALUE = "fill_nulls_with_value"
+    SELECT_COLUMNS = "select_columns"
     RENAME_COLUMNS = "rename_columns"
     CAST_COLUMN_TO_NUMERIC = "cast_column_to_numeric"
+    OPTIMIZE_MEMORY = "optimize_memory"
     SORT_BY_COLUMN = "sort_by_column"
+    APPLY_TRANSFORMATIONS = "apply_transformations"
+    APPLY_TRANSFORMATIONS_PARALLEL = "apply_transformations_parallel"
 
 
 # ----------------------------
@@ -49,8 +67,12 @@ class LoadFunction(str, Enum):
 
     LOAD_TO_CSV = "load_to_csv"
     LOAD_TO_EXCEL = "load_to_excel"
+    LOAD_TO_PARQUET = "load_to_parquet"
+    LOAD_TO_FEATHER = "load_to_feather"
     LOAD_TO_API = "load_to_api"
+    LOAD_TO_API_BATCHED = "load_to_api_batched"
     LOAD_TO_DB = "load_to_database"
+    BULK_LOAD_TO_DB = "bulk_load_to_database"
 
 
 # ----------------------------
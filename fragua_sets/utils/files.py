@@ -0,0 +1,85 @@
+"""Source file helpers."""
+
+import glob
+import os
+from typing import IO, Any, List, Sequence, Union
+from urllib.parse import urlsplit
+
+PathLike = Union[str, "os.PathLike[str]"]
+
+# A path, URL or open file, as accepted by pandas readers
+FileSource = Union[PathLike, IO[Any]]
+PathSource = Union[FileSource, Sequence[FileSource]]
+
+# One file to read: a path or URL string, or an open file
+ReadTarget = Union[str, IO[Any]]
+
+_GLOB_CHARACTERS = frozenset("*?[")
+
+
+def is_url(path: PathLike) -> bool:
+    """Return whether a path is a URL (e.g. 'https://...', 's3://...')."""
+    path = os.fspath(path)
+    return "://" in path and len(urlsplit(path).scheme) > 1
+
+
+def is_glob(path: PathLike) -> bool:
+    """
+    Return whether a path is a glob pattern.
+
+    Paths of existing files and URLs are never patterns, even when they
+    contain glob characters (e.g. 'report[2024].csv', '...csv?v=1').
+    """
+    path = os.fspath(path)
+    return (
+        not _GLOB_CHARACTERS.isdisjoint(path)
+        and not is_url(path)
+        and not os.path.exists(path)
+    )
+
+
+def expand_paths(source: PathSource) -> List[ReadTarget]:
+    """
+    Return the files designated by a path, a glob pattern or a list of them.
+
+    Glob matches are sorted, so the same set of files always comes back
+    in the same order; explicit lists keep the given order. URLs and
+    open files (buffers, file handles) are returned as they are.
+
+    Parameters
+    ----------
+    source:
+        File path, URL, open file, glob pattern (e.g. 'data/2024-*.csv',
+        '**' recurses) or list/tuple of them.
+
+    Returns
+    -------
+    list
+        Matching file paths, URLs and open files.
+
+    Raises
+    ------
+    FileNotFoundError
+        If a glob pattern matches no file.
+    """
+    items: List[Any] = list(source) if isinstance(source, (list, tuple)) else [source]
+
+    paths: List[ReadTarget] = []
+    for item in items:
+        if not isinstance(item, (str, os.PathLike)):
+            paths.append(item)
+            continue
+
+        path = os.fspath(item)
+        if not is_glob(path):
+            paths.append(path)
+            continue
+
+        matches = sorted(
+            match for match in glob.glob(path, recursive=True) if os.path.isfile(match)
+        )
+        if not matches:
+            raise FileNotFoundError(f"No files match '{path}'")
+        paths.extend(matches)
+
+    return paths
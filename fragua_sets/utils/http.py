@@ -0,0 +1,303 @@
+"""HTTP helpers shared by API functions."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Coroutine, Dict, Optional, Tuple, TypeVar
+from urllib.parse import urlsplit
+
+from fragua_sets.utils.lazy import lazy_import
+from fragua_sets.utils.optional import import_optional
+
+if TYPE_CHECKING:
+    import aiohttp
+    import requests
+else:
+    requests = lazy_import("requests")
+
+# pylint: disable=too-many-arguments,too-many-instance-attributes
+
+T = TypeVar("T")
+
+
+def create_session(
+    *,
+    pool_maxsize: int = 10,
+    headers: Optional[Dict[str, str]] = None,
+) -> requests.Session:
+    """
+    Create a keep-alive HTTP session with a sized connection pool.
+
+    Reusing a session keeps TCP/TLS connections open across requests.
+    The pool size should be at least the number of concurrent workers
+    using the session, otherwise connections are discarded and reopened.
+
+    Parameters
+    ----------
+    pool_maxsize:
+        Maximum number of pooled connections per host.
+    headers:
+        Optional headers sent with every request.
+
+    Returns
+    -------
+    requests.Session
+        Configured session. The caller is responsible for closing it.
+    """
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(
+        pool_connections=pool_maxsize, pool_maxsize=pool_maxsize
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+    if headers:
+        session.headers.update(headers)
+
+    return session
+
+
+def request_with_retry(
+    session: requests.Session,
+    method: str,
+    url: str,
+    *,
+    retries: int = 3,
+    backoff: float = 0.5,
+    **kwargs: Any,
+) -> Tuple[requests.Response, int]:
+    """
+    Perform a request, retrying 429 and 5xx responses and connection errors.
+
+    Retries use exponential backoff (`backoff * 2**attempt` seconds) or a
+    numeric `Retry-After` header when the server sends one.
+
+    Parameters
+    ----------
+    session:
+        Session used to send the request.
+    method:
+        HTTP method to use.
+    url:
+        Request URL.
+    retries:
+        Maximum number of retries after the first attempt.
+    backoff:
+        Base delay in seconds, doubled on every retry.
+    **kwargs:
+        Additional keyword arguments forwarded to session.request.
+
+    Returns
+    -------
+    Tuple[requests.Response, int]
+        Final response, whatever its status code, and the number of
+        attempts made. Callers decide whether to raise_for_status.
+
+    Raises
+    ------
+    requests.ConnectionError
+        If the final attempt cannot connect.
+    requests.Timeout
+        If the final attempt times out.
+    """
+    for attempt in range(retries + 1):
+        retry_after: Optional[float] = None
+
+        try:
+            response = session.request(method, url, **kwargs)
+        except (requests.ConnectionError, requests.Timeout):
+            if attempt == retries:
+                raise
+        else:
+            retryable = response.status_code == 429 or response.status_code >= 500
+            if not retryable or attempt == retries:
+                return response, attempt + 1
+
+            retry_after = _parse_retry_after(response.headers.get("Retry-After"))
+
+        time.sleep(retry_after if retry_after is not None else backoff * 2**attempt)
+
+    raise AssertionError("unreachable")  # pragma: no cover
+
+
+def run_coroutine(coroutine: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine to completion from synchronous code.
+
+    asyncio.run cannot be called while an event loop is running in the
+    same thread (Jupyter, async applications). In that case the
+    coroutine runs on its own event loop in a worker thread, and the
+    calling thread blocks until it finishes.
+
+    Parameters
+    ----------
+    coroutine:
+        Coroutine to run.
+
+    Returns
+    -------
+    T
+        Result of the coroutine.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coroutine).result()
+
+
+class AsyncHttpClient:
+    """
+    Asyncio HTTP client for driving many concurrent requests from one thread.
+
+    The client bounds the number of in-flight requests, spaces requests
+    to the same host according to an optional per-host rate limit, and
+    retries 429 and 5xx responses with exponential backoff (honoring a
+    numeric `Retry-After` header when present).
+
+    It requires the optional `aiohttp` dependency and must be used as an
+    async context manager:
+
+        async with AsyncHttpClient(max_concurrency=200) as client:
+            body = await client.request("GET", url)
+    """
+
+    def __init__(
+        self,
+        *,
+        max_concurrency: int = 100,
+        rate_limit: Optional[float] = None,
+        retries: int = 3,
+        backoff: float = 0.5,
+        timeout: float = 30,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        max_concurrency:
+            Maximum number of requests in flight at once.
+        rate_limit:
+            Optional maximum number of requests per second per host.
+        retries:
+            Number of retries for 429 and 5xx responses and connection errors.
+        backoff:
+            Base delay in seconds, doubled on every retry.
+        timeout:
+            Total timeout in seconds for each request.
+        headers:
+            Optional headers sent with every request.
+        """
+        self.max_concurrency = max_concurrency
+        self.rate_limit = rate_limit
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.headers = headers
+        self._session: Optional["aiohttp.ClientSession"] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._next_slot: Dict[str, float] = {}
+
+    async def __aenter__(self) -> "AsyncHttpClient":
+        aiohttp_module = import_optional("aiohttp", "async")
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._session = aiohttp_module.ClientSession(
+            connector=aiohttp_module.TCPConnector(limit=self.max_concurrency),
+            timeout=aiohttp_module.ClientTimeout(total=self.timeout),
+            headers=self.headers,
+        )
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        json: Any = None,
+        data: Optional[bytes] = None,
+    ) -> bytes:
+        """
+        Perform a request and return the response body.
+
+        Raises
+        ------
+        RuntimeError
+            If the client is used outside its context manager.
+        aiohttp.ClientResponseError
+            If the final attempt returns a non-success status code.
+        """
+        if self._session is None or self._semaphore is None:
+            raise RuntimeError("AsyncHttpClient must be used with 'async with'")
+
+        aiohttp_module = import_optional("aiohttp", "async")
+        host = urlsplit(url).netloc
+
+        async with self._semaphore:
+            for attempt in range(self.retries + 1):
+                await self._wait_for_host(host)
+                retry_after: Optional[float] = None
+
+                try:
+                    async with self._session.request(
+                        method,
+                        url,
+                        params=params,
+                        headers=headers,
+                        json=json,
+                        data=data,
+                    ) as response:
+                        body = await response.read()
+                        retryable = response.status == 429 or response.status >= 500
+
+                        if not retryable or attempt == self.retries:
+                            response.raise_for_status()
+                            return body
+
+                        retry_after = _parse_retry_after(
+                            response.headers.get("Retry-After")
+                        )
+                except (aiohttp_module.ClientConnectionError, asyncio.TimeoutError):
+                    if attempt == self.retries:
+                        raise
+
+                await asyncio.sleep(
+                    retry_after
+                    if retry_after is not None
+                    else self.backoff * 2**attempt
+                )
+
+        raise AssertionError("unreachable")  # pragma: no cover
+
+    async def _wait_for_host(self, host: str) -> None:
+        """Sleep until the host's next rate-limit slot is available."""
+        if not self.rate_limit:
+            return
+
+        now = asyncio.get_running_loop().time()
+        slot = max(now, self._next_slot.get(host, now))
+        self._next_slot[host] = slot + 1 / self.rate_limit
+
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a numeric Retry-After header value in seconds."""
+    if value is None:
+        return None
+
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        return None
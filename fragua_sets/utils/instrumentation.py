@@ -0,0 +1,374 @@
+"""Per-call instrumentation of registered functions."""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import time
+from collections import defaultdict
+from functools import wraps
+from pathlib import Path
+from threading import Lock
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Protocol,
+    Tuple,
+    TypedDict,
+    Union,
+)
+
+from fragua_sets.utils.lazy import lazy_import
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+else:
+    np = lazy_import("numpy")
+    pd = lazy_import("pandas")
+
+# pylint: disable=too-few-public-methods
+
+# Sets whose functions perform I/O and get bytes read/written recorded
+IO_SETS = ("extraction", "loading")
+
+_PROC_IO = Path("/proc/self/io")
+
+
+class StepMetrics(TypedDict):
+    """Measurements of one call of a registered function."""
+
+    set: str
+    function: str
+    timestamp: float
+    wall_seconds: float
+    cpu_seconds: float
+    rows_in: Optional[int]
+    columns_in: Optional[int]
+    memory_in_bytes: Optional[int]
+    rows_out: Optional[int]
+    columns_out: Optional[int]
+    memory_out_bytes: Optional[int]
+    bytes_read: Optional[int]
+    bytes_written: Optional[int]
+    error: Optional[str]
+
+
+class MetricsSink(Protocol):
+    """Destination of StepMetrics records."""
+
+    def emit(self, metrics: StepMetrics) -> None:
+        """Receive the metrics of one call."""
+
+
+class AggregatingSink:
+    """
+    In-process sink keeping per-function totals.
+
+    Parameters
+    ----------
+    keep_records:
+        Whether to also keep every record in `records`.
+    """
+
+    def __init__(self, *, keep_records: bool = False) -> None:
+        self.keep_records = keep_records
+        self.records: List[StepMetrics] = []
+        self._totals: Dict[Tuple[str, str], Dict[str, float]] = defaultdict(
+            lambda: defaultdict(float)
+        )
+        self._lock = Lock()
+
+    def emit(self, metrics: StepMetrics) -> None:
+        """Add one call to the totals of its function."""
+        with self._lock:
+            _accumulate(self._totals[(metrics["set"], metrics["function"])], metrics)
+            if self.keep_records:
+                self.records.append(metrics)
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """
+        Return the totals per function.
+
+        Returns
+        -------
+        dict
+            Mapping of 'set.function' to its call count, errors, total
+            wall/CPU seconds, rows out, bytes read/written and peak
+            output memory.
+        """
+        with self._lock:
+            return {
+                f"{set_name}.{function}": dict(totals)
+                for (set_name, function), totals in self._totals.items()
+            }
+
+
+class JsonLinesSink:
+    """
+    Sink appending one JSON object per call to a file.
+
+    Parameters
+    ----------
+    path:
+        Destination file. It is created if missing and appended to.
+    """
+
+    def __init__(self, path: Union[str, "os.PathLike[str]"]) -> None:
+        self.path = Path(path)
+        self._lock = Lock()
+
+    def emit(self, metrics: StepMetrics) -> None:
+        """Append the call as one JSON line."""
+        line = json.dumps(metrics, default=str)
+        with self._lock, self.path.open("a", encoding="utf-8") as file:
+            file.write(line + "\n")
+
+
+class PrometheusTextfileSink:
+    """
+    Sink exposing per-function totals in the Prometheus text format.
+
+    The file is rewritten atomically after every call, for the node
+    exporter's textfile collector to pick up.
+
+    Parameters
+    ----------
+    path:
+        Destination .prom file.
+    prefix:
+        Prefix of the metric names.
+    """
+
+    _METRICS = (
+        ("calls", "calls_total", "Number of calls."),
+        ("errors", "errors_total", "Number of calls that raised."),
+        ("wall_seconds", "wall_seconds_total", "Wall time spent."),
+        ("cpu_seconds", "cpu_seconds_total", "Process CPU time spent."),
+        ("rows_out", "rows_out_total", "Rows returned."),
+        ("bytes_read", "read_bytes_total", "Bytes read by I/O functions."),
+        ("bytes_written", "written_bytes_total", "Bytes written by I/O functions."),
+    )
+
+    def __init__(
+        self,
+        path: Union[str, "os.PathLike[str]"],
+        *,
+        prefix: str = "fragua_step",
+    ) -> None:
+        self.path = Path(path)
+        self.prefix = prefix
+        self._aggregator = AggregatingSink()
+        self._lock = Lock()
+
+    def emit(self, metrics: StepMetrics) -> None:
+        """Add the call to the totals and rewrite the textfile."""
+        self._aggregator.emit(metrics)
+        with self._lock:
+            self._write(self._aggregator.summary())
+
+    def _write(self, summary: Dict[str, Dict[str, float]]) -> None:
+        """Atomically replace the textfile with the current totals."""
+        lines = []
+        for key, name, help_text in self._METRICS:
+            metric = f"{self.prefix}_{name}"
+            lines += [f"# HELP {metric} {help_text}", f"# TYPE {metric} counter"]
+            for step, totals in sorted(summary.items()):
+                set_name, function = step.split(".", 1)
+                labels = f'set="{set_name}",function="{function}"'
+                lines.append(f"{metric}{{{labels}}} {totals.get(key, 0.0):g}")
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as file:
+            file.write("\n".join(lines) + "\n")
+        os.replace(tmp_path, self.path)
+
+
+def instrument(
+    func: Callable[..., Any],
+    *,
+    set_name: str,
+    sink: MetricsSink,
+    deep_memory: bool = False,
+    name: Optional[str] = None,
+) -> Callable[..., Any]:
+    """
+    Wrap a function so every call reports StepMetrics to a sink.
+
+    The first argument (or `df` keyword), if a DataFrame, gives the
+    input row/column counts and memory; a DataFrame result gives the output ones. A
+    chunk stream result is measured lazily: its metrics are emitted when
+    it is exhausted or closed, with the time spent producing chunks and
+    the rows summed over chunks. Bytes read/written are the process's
+    I/O counters (/proc/self/io rchar/wchar, Linux only) across the call
+    for functions of the I/O sets, so concurrent work in other threads
+    is included.
+
+    Parameters
+    ----------
+    func:
+        Function to wrap.
+    set_name:
+        Name of the set the function is registered in.
+    sink:
+        Destination of the metrics.
+    deep_memory:
+        Whether frame memory uses memory_usage(deep=True), which scans
+        string columns.
+    name:
+        Name reported for the function. Defaults to its __name__.
+
+    Returns
+    -------
+    Callable
+        Wrapped function.
+    """
+    measure_io = set_name in IO_SETS
+    function = name or str(getattr(func, "__name__", repr(func)))
+
+    @wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        # fragua agents pass the input frame as df=...
+        source = args[0] if args else kwargs.get("df")
+        metrics: StepMetrics = {
+            "set": set_name,
+            "function": function,
+            "timestamp": time.time(),
+            "wall_seconds": 0.0,
+            "cpu_seconds": 0.0,
+            "rows_in": None,
+            "columns_in": None,
+            "memory_in_bytes": None,
+            "rows_out": None,
+            "columns_out": None,
+            "memory_out_bytes": None,
+            "bytes_read": None,
+            "bytes_written": None,
+            "error": None,
+        }
+        if isinstance(source, pd.DataFrame):
+            metrics["rows_in"], metrics["columns_in"] = source.shape
+            metrics["memory_in_bytes"] = _frame_memory(source, deep_memory)
+
+        io_before = _io_counters() if measure_io else None
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            result = func(*args, **kwargs)
+        except Exception as exc:
+            metrics["error"] = type(exc).__name__
+            raise
+        finally:
+            metrics["wall_seconds"] = time.perf_counter() - wall
+            metrics["cpu_seconds"] = time.process_time() - cpu
+            _add_io(metrics, io_before)
+            if metrics["error"] is not None:
+                sink.emit(metrics)
+
+        if isinstance(result, pd.DataFrame):
+            metrics["rows_out"], metrics["columns_out"] = result.shape
+            metrics["memory_out_bytes"] = _frame_memory(result, deep_memory)
+        elif isinstance(result, Iterator):
+            return _measure_chunks(result, metrics, sink, measure_io, deep_memory)
+
+        sink.emit(metrics)
+        return result
+
+    return wrapper
+
+
+def _measure_chunks(
+    chunks: Iterator[Any],
+    metrics: StepMetrics,
+    sink: MetricsSink,
+    measure_io: bool,
+    deep_memory: bool,
+) -> Iterator[Any]:
+    """Pass chunks through, adding their production cost to the metrics."""
+    rows = memory = 0
+    try:
+        while True:
+            io_before = _io_counters() if measure_io else None
+            wall, cpu = time.perf_counter(), time.process_time()
+            try:
+                chunk = next(chunks)
+            except StopIteration:
+                return
+            except Exception as exc:
+                metrics["error"] = type(exc).__name__
+                raise
+            finally:
+                metrics["wall_seconds"] += time.perf_counter() - wall
+                metrics["cpu_seconds"] += time.process_time() - cpu
+                _add_io(metrics, io_before)
+
+            if isinstance(chunk, pd.DataFrame):
+                rows += len(chunk)
+                memory = max(memory, _frame_memory(chunk, deep_memory))
+                metrics["columns_out"] = chunk.shape[1]
+            yield chunk
+    finally:
+        # Peak chunk memory, since chunks are not held together
+        metrics["rows_out"], metrics["memory_out_bytes"] = rows, memory
+        sink.emit(metrics)
+
+
+def _frame_memory(df: pd.DataFrame, deep: bool) -> int:
+    """Return the memory used by a frame, index included."""
+    if deep:
+        return int(df.memory_usage(index=True, deep=True).sum())
+
+    # Shallow size from dtypes; memory_usage costs ~1 ms even on tiny frames
+    rows = len(df)
+    total = int(df.index.nbytes)
+    for position, dtype in enumerate(df.dtypes):
+        if isinstance(dtype, np.dtype):
+            total += rows * dtype.itemsize
+        else:
+            total += int(df.iloc[:, position].array.nbytes)
+
+    return total
+
+
+def _io_counters() -> Optional[Tuple[int, int]]:
+    """Return the process's (rchar, wchar) counters, if available."""
+    try:
+        text = _PROC_IO.read_text(encoding="ascii")
+    except OSError:
+        return None
+
+    counters = dict(line.split(": ") for line in text.splitlines())
+    return int(counters["rchar"]), int(counters["wchar"])
+
+
+def _add_io(metrics: StepMetrics, before: Optional[Tuple[int, int]]) -> None:
+    """Add the I/O performed since `before` to the metrics."""
+    if before is None:
+        return
+
+    after = _io_counters()
+    if after is None:
+        return
+
+    metrics["bytes_read"] = (metrics["bytes_read"] or 0) + after[0] - before[0]
+    metrics["bytes_written"] = (metrics["bytes_written"] or 0) + after[1] - before[1]
+
+
+def _accumulate(totals: Dict[str, float], metrics: StepMetrics) -> None:
+    """Add one call to a function's running totals."""
+    totals["calls"] += 1
+    totals["errors"] += metrics["error"] is not None
+    totals["wall_seconds"] += metrics["wall_seconds"]
+    totals["cpu_seconds"] += metrics["cpu_seconds"]
+    totals["rows_out"] += metrics["rows_out"] or 0
+    totals["bytes_read"] += metrics["bytes_read"] or 0
+    totals["bytes_written"] += metrics["bytes_written"] or 0
+    totals["max_memory_out_bytes"] = max(
+        totals["max_memory_out_bytes"], metrics["memory_out_bytes"] or 0
+    )
@@ -0,0 +1,59 @@
+"""Lazy module imports."""
+
+import importlib
+import importlib.util
+import sys
+from functools import partial
+from types import ModuleType
+from typing import Any
+
+
+class _LazyModule(ModuleType):  # pylint: disable=too-few-public-methods
+    """Stand-in for a module that imports it on first attribute access."""
+
+    def __getattr__(self, attr: str) -> Any:
+        # import_module holds the import system's per-module lock, so
+        # threads racing on the first access all see a fully loaded module
+        module = importlib.import_module(self.__name__)
+        # Bind its namespace and drop the hook, so later lookups cost the
+        # same as on the module itself. Names the module only gains later
+        # (e.g. submodules imported afterwards) are still found through it.
+        self.__dict__.update(module.__dict__)
+        self.__dict__["__getattr__"] = partial(getattr, module)
+        self.__class__ = ModuleType  # type: ignore[assignment]
+        return getattr(module, attr)
+
+
+def lazy_import(name: str) -> ModuleType:
+    """
+    Return a module that is only executed on first attribute access.
+
+    Heavy dependencies (pandas, numpy, SQLAlchemy, requests) are bound
+    at module level through this function, so importing fragua_sets
+    costs nothing until a function actually uses them. Modules already
+    imported are returned as is. The first access imports the module
+    normally, so it is safe from several threads at once, and binds its
+    attributes so later lookups cost no more than a direct import.
+
+    Parameters
+    ----------
+    name:
+        Absolute name of the module (e.g. 'pandas').
+
+    Returns
+    -------
+    ModuleType
+        The module, or a lazy proxy importing it on first use.
+
+    Raises
+    ------
+    ModuleNotFoundError
+        If the module is not installed.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+
+    if importlib.util.find_spec(name) is None:
+        raise ModuleNotFoundError(f"No module named '{name}'", name=name)
+
+    return _LazyModule(name)
@@ -0,0 +1,35 @@
+"""Optional dependency helpers."""
+
+import importlib
+from types import ModuleType
+
+
+def import_optional(module: str, extra: str) -> ModuleType:
+    """
+    Import an optional dependency or raise an informative ImportError.
+
+    Parameters
+    ----------
+    module:
+        Name of the module to import (e.g. 'pyarrow.parquet').
+    extra:
+        Name of the fragua-sets extra that installs the dependency.
+
+    Returns
+    -------
+    ModuleType
+        Imported module.
+
+    Raises
+    ------
+    ImportError
+        If the module is not installed.
+    """
+    try:
+        return importlib.import_module(module)
+    except ImportError as exc:
+        package = module.split(".", maxsplit=1)[0]
+        raise ImportError(
+            f"This function requires the optional dependency '{package}'. "
+            f"Install it with: pip install 'fragua-sets[{extra}]'"
+        ) from exc
@@ -0,0 +1,349 @@
+"""Pushdown of transformation steps into extraction steps."""
+
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import replace
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, TypedDict
+
+from fragua import FraguaPipeline, FraguaStep
+
+from fragua_sets.utils.lazy import lazy_import
+from fragua_sets.utils.sql import quote_identifier, render_literal, subquery
+
+if TYPE_CHECKING:
+    import sqlalchemy as sa
+else:
+    sa = lazy_import("sqlalchemy")
+
+# Extractions whose SQL query absorbs filters and projections
+SQL_EXTRACTIONS = ("extract_from_database", "extract_from_database_chunks")
+
+# Extractions taking `columns` and `filters`, and whether 'not null' is supported
+FILE_EXTRACTIONS = {
+    "extract_from_csv": True,
+    "extract_from_csv_chunks": True,
+    "extract_from_csv_files": True,
+    "extract_from_parquet": False,
+    "extract_from_feather": False,
+}
+
+# Transformations that can be folded into a preceding extraction
+PUSHABLE_TRANSFORMATIONS = (
+    "filter_by_min_value",
+    "drop_nulls_in_columns",
+    "select_columns",
+)
+
+
+class PushedStep(TypedDict):
+    """A transformation step folded into an extraction."""
+
+    step: str
+    function: str
+    pushed_as: str
+
+
+class Pushdown(TypedDict):
+    """An extraction step rewritten to absorb the steps that followed it."""
+
+    extraction: str
+    function: str
+    output: str
+    pushed: List[PushedStep]
+    params: Dict[str, Any]
+
+
+class PushdownPlan(TypedDict):
+    """Rewritten steps and what was pushed into each extraction."""
+
+    steps: List[FraguaStep]
+    pushdowns: List[Pushdown]
+
+
+def plan_pushdown(steps: Sequence[FraguaStep]) -> PushdownPlan:
+    """
+    Fold filters and projections into the extraction steps they follow.
+
+    A `filter_by_min_value`, `drop_nulls_in_columns` or `select_columns`
+    step is pushed down when it consumes the output of an extraction
+    step, directly or through steps already pushed, and nothing else uses
+    that output:
+
+    - Database extractions (SQL_EXTRACTIONS) wrap their query as
+      `SELECT <columns> FROM (<query>) AS fragua_pushdown WHERE ...`,
+      so rows and columns are discarded by the database.
+    - File extractions (FILE_EXTRACTIONS) get `columns` and `filters`,
+      so CSV files parse only the needed columns and filter rows chunk
+      by chunk, and Parquet/Feather skip row groups. Parquet and
+      Feather have no 'not null' predicate, so null drops stay steps.
+
+    The rewritten extraction takes the place and output key of the last
+    step pushed into it, so later steps and the pipeline result are
+    unchanged. Steps that cannot be pushed are left as they are.
+
+    Parameters
+    ----------
+    steps:
+        Pipeline steps in execution order.
+
+    Returns
+    -------
+    PushdownPlan
+        Rewritten steps and a record of every pushdown.
+    """
+    steps = list(steps)
+    users = Counter(step.use for step in steps if step.use)
+    consumers = {step.use: index for index, step in enumerate(steps) if step.use}
+    rewritten: Dict[int, FraguaStep] = {}
+    removed = set()
+    pushdowns: List[Pushdown] = []
+
+    for index, step in enumerate(steps):
+        pushdown = _Pushdown.for_step(step)
+        if pushdown is None:
+            continue
+
+        key, position = _step_key(step), index
+        pushed: List[PushedStep] = []
+
+        # Follow the chain while its only consumer can be pushed
+        while users[key] == 1 and consumers[key] > position:
+            consumer = steps[consumers[key]]
+            description = pushdown.absorb(consumer)
+            if description is None:
+                break
+
+            pushed.append(
+                {
+                    "step": _step_key(consumer),
+                    "function": consumer.function,
+                    "pushed_as": description,
+                }
+            )
+            removed.add(position)
+            key, position = _step_key(consumer), consumers[key]
+
+        if pushed:
+            params = pushdown.params()
+            rewritten[position] = replace(step, params=params, save_as=key)
+            pushdowns.append(
+                {
+                    "extraction": _step_key(step),
+                    "function": step.function,
+                    "output": key,
+                    "pushed": pushed,
+                    "params": {
+                        name: value
+                        for name, value in params.items()
+                        if name in ("query", "columns", "filters")
+                    },
+                }
+            )
+
+    return {
+        "steps": [
+            rewritten.get(index, step)
+            for index, step in enumerate(steps)
+            if index not in removed
+        ],
+        "pushdowns": pushdowns,
+    }
+
+
+def optimize_pipeline(pipeline: FraguaPipeline) -> FraguaPipeline:
+    """
+    Return a copy of a pipeline with filters and projections pushed down.
+
+    Parameters
+    ----------
+    pipeline:
+        Pipeline to optimize. It is not modified.
+
+    Returns
+    -------
+    FraguaPipeline
+        Pipeline with the same name and the rewritten steps.
+    """
+    optimized = FraguaPipeline(pipeline.name)
+    optimized.add(plan_pushdown(pipeline.steps())["steps"])
+    return optimized
+
+
+def explain_pushdown(plan: PushdownPlan) -> str:
+    """
+    Describe what a pushdown plan folded into each extraction.
+
+    Parameters
+    ----------
+    plan:
+        Result of plan_pushdown.
+
+    Returns
+    -------
+    str
+        One block per rewritten extraction, listing the pushed steps and
+        the resulting query or file reader arguments.
+    """
+    pushed = sum(len(pushdown["pushed"]) for pushdown in plan["pushdowns"])
+    lines = [f"{pushed} step(s) pushed into {len(plan['pushdowns'])} extraction(s)"]
+
+    for pushdown in plan["pushdowns"]:
+        lines.append(
+            f"{pushdown['function']} '{pushdown['extraction']}' "
+            f"-> output '{pushdown['output']}'"
+        )
+        for step in pushdown["pushed"]:
+            lines.append(f"  {step['function']} '{step['step']}': {step['pushed_as']}")
+        for name, value in pushdown["params"].items():
+            lines.append(f"  {name}: {value}")
+
+    return "\n".join(lines)
+
+
+def _step_key(step: FraguaStep) -> str:
+    """Return the key under which a step's result is stored."""
+    return str(step.save_as or step.function)
+
+
+class _Pushdown:
+    """Filters and projection accumulated for one extraction step."""
+
+    def __init__(self, step: FraguaStep) -> None:
+        self.step = step
+        self.columns: Optional[List[str]] = step.params.get("columns")
+        self.conditions: List[str] = []
+        self.filters: List[Any] = []
+
+    @classmethod
+    def for_step(cls, step: FraguaStep) -> Optional[_Pushdown]:
+        """Return a pushdown for a standalone extraction step, if supported."""
+        if step.set_name != "extraction" or step.use:
+            return None
+
+        if step.function in SQL_EXTRACTIONS:
+            engine = step.params.get("engine")
+            if not isinstance(engine, sa.engine.Engine) or "query" not in step.params:
+                return None
+            pushdown = cls(step)
+            pushdown.columns = None
+            return pushdown
+
+        if step.function in FILE_EXTRACTIONS:
+            return cls(step)
+
+        return None
+
+    @property
+    def is_sql(self) -> bool:
+        """Whether the extraction runs a SQL query."""
+        return self.step.function in SQL_EXTRACTIONS
+
+    def absorb(self, step: FraguaStep) -> Optional[str]:
+        """Fold a transformation step in, returning how, or None if not possible."""
+        if (
+            step.set_name != "transformation"
+            or step.function not in PUSHABLE_TRANSFORMATIONS
+        ):
+            return None
+
+        params = step.params
+        if step.function == "select_columns":
+            return self._select(params.get("columns"))
+
+        if step.function == "filter_by_min_value":
+            if "column" not in params or "min_value" not in params:
+                return None
+            return self._filter([(params["column"], ">=", params["min_value"])])
+
+        columns = params.get("columns")
+        if not isinstance(columns, list):
+            return None
+        return self._filter([(column, "not null", None) for column in columns])
+
+    def params(self) -> Dict[str, Any]:
+        """Return the extraction parameters with the pushdowns applied."""
+        params = dict(self.step.params)
+
+        if self.is_sql:
+            engine = params["engine"]
+            select = (
+                ", ".join(quote_identifier(engine, column) for column in self.columns)
+                if self.columns
+                else "*"
+            )
+            source = subquery(str(params["query"]), "fragua_pushdown")
+            params["query"] = f"SELECT {select} FROM {source}"
+            if self.conditions:
+                params["query"] += " WHERE " + " AND ".join(self.conditions)
+            return params
+
+        if self.columns is not None:
+            params["columns"] = list(self.columns)
+        if self.filters:
+            params["filters"] = _and_filters(params.get("filters"), self.filters)
+        return params
+
+    def _select(self, columns: Any) -> Optional[str]:
+        """Push a projection, which must keep only available columns."""
+        if not isinstance(columns, list) or not self._available(columns):
+            return None
+
+        params = self.step.params
+        if not self.is_sql and ("usecols" in params or params.get("source_column")):
+            return None
+
+        self.columns = list(columns)
+        if self.is_sql:
+            engine = params["engine"]
+            quoted = ", ".join(quote_identifier(engine, column) for column in columns)
+            return f"SELECT {quoted}"
+        return f"columns={columns!r}"
+
+    def _filter(self, predicates: List[Any]) -> Optional[str]:
+        """Push row predicates on available columns."""
+        columns = [column for column, _, _ in predicates]
+        if not self._available(columns):
+            return None
+
+        if self.is_sql:
+            engine = self.step.params["engine"]
+            try:
+                conditions = [
+                    (
+                        f"{quote_identifier(engine, column)} IS NOT NULL"
+                        if operator == "not null"
+                        else f"{quote_identifier(engine, column)} {operator} "
+                        f"{render_literal(engine, value)}"
+                    )
+                    for column, operator, value in predicates
+                ]
+            except sa.exc.CompileError:
+                # A value without a SQL literal form stays a pandas step
+                return None
+            self.conditions.extend(conditions)
+            return "WHERE " + " AND ".join(conditions)
+
+        not_null = FILE_EXTRACTIONS[self.step.function]
+        if not not_null and any(op == "not null" for _, op, _ in predicates):
+            return None
+        if self.step.params.get("source_column") in columns:
+            return None
+
+        self.filters.extend(predicates)
+        return f"filters += {predicates!r}"
+
+    def _available(self, columns: List[Any]) -> bool:
+        """Whether the columns survive the projection pushed so far."""
+        return self.columns is None or all(column in self.columns for column in columns)
+
+
+def _and_filters(existing: Any, predicates: List[Any]) -> Any:
+    """AND predicates into Parquet-style filters, which may be OR groups."""
+    if not existing:
+        return list(predicates)
+
+    if isinstance(existing[0], list):
+        return [[*group, *predicates] for group in existing]
+
+    return [*existing, *predicates]
@@ -0,0 +1,43 @@
+"""SQL rendering helpers."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from fragua_sets.utils.lazy import lazy_import
+
+if TYPE_CHECKING:
+    import sqlalchemy as sa
+    from sqlalchemy.engine import Engine
+else:
+    sa = lazy_import("sqlalchemy")
+
+
+def render_literal(engine: Engine, value: Any) -> str:
+    """Render a Python value as a SQL literal for the engine's dialect."""
+    # numpy scalars (e.g. from DataFrame.max()) have no literal renderer
+    item = getattr(value, "item", None)
+    if item is not None and type(value).__module__ == "numpy":
+        value = item()
+
+    return str(
+        sa.literal(value).compile(
+            dialect=engine.dialect,
+            compile_kwargs={"literal_binds": True},
+        )
+    )
+
+
+def quote_identifier(engine: Engine, name: str) -> str:
+    """Quote a column or table name for the engine's dialect if needed."""
+    return str(engine.dialect.identifier_preparer.quote(name))
+
+
+def subquery(query: str, alias: str) -> str:
+    """
+    Wrap a query as an aliased derived table.
+
+    The query goes on its own lines, so a trailing `--` comment cannot
+    swallow the closing parenthesis, and trailing semicolons are dropped.
+    """
+    return f"(\n{query.strip().rstrip(';').rstrip()}\n) AS {alias}"
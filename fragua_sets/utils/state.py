@@ -0,0 +1,183 @@
+"""Persisted extraction state."""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from datetime import date, datetime
+from decimal import Decimal
+from pathlib import Path
+from threading import Lock
+from typing import TYPE_CHECKING, Any, Dict, Optional, Union
+
+from fragua_sets.utils.lazy import lazy_import
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+else:
+    np = lazy_import("numpy")
+    pd = lazy_import("pandas")
+
+
+class WatermarkStore:
+    """
+    JSON file holding one watermark per extraction source.
+
+    Incremental extractions read the watermark of their source before
+    running and save the new one after the delta has been read. Each
+    update rewrites the file atomically (temporary file + os.replace),
+    so an interrupted run leaves the previous state intact.
+
+    Watermarks may be JSON values or dicts of them, dates, datetimes,
+    pandas Timestamps, Decimals and numpy scalars; dates and decimals
+    are restored to their original type when read back.
+
+    Parameters
+    ----------
+    path:
+        Path of the JSON state file. It is created on the first save.
+    """
+
+    def __init__(self, path: Union[str, "os.PathLike[str]"]) -> None:
+        self.path = Path(path)
+        self._lock = Lock()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Return the watermark stored for a source.
+
+        Parameters
+        ----------
+        key:
+            Source identifier.
+        default:
+            Value returned if the source has no watermark yet.
+
+        Returns
+        -------
+        Any
+            Stored watermark or `default`.
+        """
+        with self._lock:
+            state = self._read()
+
+        if key not in state:
+            return default
+
+        return _decode(state[key])
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Save the watermark of a source.
+
+        Parameters
+        ----------
+        key:
+            Source identifier.
+        value:
+            New watermark.
+        """
+        with self._lock:
+            state = self._read()
+            state[key] = _encode(value)
+            self._write(state)
+
+    def delete(self, key: str) -> None:
+        """
+        Forget the watermark of a source so its next run reads everything.
+
+        Parameters
+        ----------
+        key:
+            Source identifier.
+        """
+        with self._lock:
+            state = self._read()
+            if state.pop(key, None) is not None:
+                self._write(state)
+
+    def _read(self) -> Dict[str, Any]:
+        """Load the state file, returning an empty state if missing."""
+        if not self.path.exists():
+            return {}
+
+        with self.path.open("r", encoding="utf-8") as file:
+            return dict(json.load(file))
+
+    def _write(self, state: Dict[str, Any]) -> None:
+        """Atomically replace the state file."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        fd, tmp_path = tempfile.mkstemp(
+            dir=self.path.parent, prefix=f".{self.path.name}.", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as file:
+                json.dump(state, file, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+
+def resolve_store(
+    store: Union[str, "os.PathLike[str]", WatermarkStore],
+) -> WatermarkStore:
+    """
+    Return a WatermarkStore for a store instance or a state file path.
+
+    Parameters
+    ----------
+    store:
+        WatermarkStore or path of its JSON file.
+
+    Returns
+    -------
+    WatermarkStore
+        Store instance.
+    """
+    if isinstance(store, WatermarkStore):
+        return store
+
+    return WatermarkStore(store)
+
+
+def _encode(value: Any) -> Any:
+    """Convert a watermark into a JSON-serializable value."""
+    if isinstance(value, dict):
+        return {str(key): _encode(item) for key, item in value.items()}
+
+    if isinstance(value, np.generic):
+        value = value.item()
+
+    if isinstance(value, pd.Timestamp):
+        value = value.to_pydatetime()
+
+    if isinstance(value, datetime):
+        return {"__type__": "datetime", "value": value.isoformat()}
+
+    if isinstance(value, date):
+        return {"__type__": "date", "value": value.isoformat()}
+
+    if isinstance(value, Decimal):
+        return {"__type__": "decimal", "value": str(value)}
+
+    return value
+
+
+def _decode(value: Any) -> Any:
+    """Restore a watermark saved by _encode."""
+    if not isinstance(value, dict):
+        return value
+
+    kind: Optional[str] = value.get("__type__")
+    if kind == "datetime":
+        return datetime.fromisoformat(value["value"])
+    if kind == "date":
+        return date.fromisoformat(value["value"])
+    if kind == "decimal":
+        return Decimal(value["value"])
+
+    return {key: _decode(item) for key, item in value.items()}
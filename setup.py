@@ -24,4 +24,9 @@ setup(
         "numpy",
         "sqlalchemy",
     ],
+    extras_require={
+        "async": ["aiohttp>=3.9"],
+        "excel": ["openpyxl>=3.1"],
+        "parquet": ["pyarrow>=14"],
+    },
 )
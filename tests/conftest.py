@@ -0,0 +1,85 @@
+"""Shared fixtures of the test suite."""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+# A route maps a recorded request to (status, headers, body); dict and
+# list bodies are sent as JSON
+Route = Callable[[Dict[str, Any]], Tuple[int, Dict[str, str], Any]]
+
+
+class StandInServer:
+    """Local HTTP server standing in for an API, recording its requests."""
+
+    def __init__(self) -> None:
+        self.routes: Dict[str, Route] = {}
+        self.requests: List[Dict[str, Any]] = []
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        setattr(self._server, "stand_in", self)
+        self.url = f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    def start(self) -> None:
+        """Serve requests from a background thread."""
+        threading.Thread(
+            target=self._server.serve_forever, args=(0.05,), daemon=True
+        ).start()
+
+    def stop(self) -> None:
+        """Stop serving and close the socket."""
+        self._server.shutdown()
+        self._server.server_close()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Dispatch requests to the routes of the StandInServer."""
+
+    def do_GET(self) -> None:  # pylint: disable=invalid-name
+        """Handle a GET request."""
+        self._respond()
+
+    def do_POST(self) -> None:  # pylint: disable=invalid-name
+        """Handle a POST request."""
+        self._respond()
+
+    def _respond(self) -> None:
+        stand_in: StandInServer = getattr(self.server, "stand_in")
+        url = urlsplit(self.path)
+        length = int(self.headers.get("Content-Length") or 0)
+        request = {
+            "method": self.command,
+            "path": url.path,
+            "query": {name: values[-1] for name, values in parse_qs(url.query).items()},
+            "headers": dict(self.headers),
+            "body": self.rfile.read(length) if length else b"",
+        }
+        stand_in.requests.append(request)
+
+        route = stand_in.routes.get(url.path)
+        status, headers, body = route(request) if route else (404, {}, b"")
+        payload = json.dumps(body).encode() if isinstance(body, (dict, list)) else body
+
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        if isinstance(body, (dict, list)):
+            self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format: str, *args: Any) -> None:  # pylint: disable=W0622
+        """Keep the test output quiet."""
+
+
+@pytest.fixture(name="http_server")
+def fixture_http_server() -> Iterator[StandInServer]:
+    """Local stand-in HTTP server; add routes to its `routes`."""
+    server = StandInServer()
+    server.start()
+    yield server
+    server.stop()
@@ -0,0 +1,338 @@
+"""Tests of the HTTP API extraction and loading functions."""
+
+import asyncio
+import gzip
+import importlib.util
+import json
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Dict, List
+
+import pandas as pd
+import pytest
+import requests
+
+from fragua_sets.functions.extraction import (
+    PaginationStrategy,
+    extract_from_api,
+    extract_from_api_many,
+    extract_from_api_paginated,
+)
+from fragua_sets.functions.loading import load_to_api_async, load_to_api_batched
+from fragua_sets.utils import cache as cache_module
+from fragua_sets.utils.cache import ExtractionCache
+
+from conftest import StandInServer
+
+# The response store keeps Arrow snapshots; the async engine runs on aiohttp
+REQUIRES_PYARROW = pytest.mark.skipif(
+    importlib.util.find_spec("pyarrow") is None, reason="pyarrow is not installed"
+)
+REQUIRES_AIOHTTP = pytest.mark.skipif(
+    importlib.util.find_spec("aiohttp") is None, reason="aiohttp is not installed"
+)
+
+
+def _versioned_items(request: Dict[str, Any]) -> Any:
+    """Serve two items with an ETag, or 304 when it is sent back."""
+    if request["headers"].get("If-None-Match") == '"v1"':
+        return 304, {"ETag": '"v1"'}, b""
+    return 200, {"ETag": '"v1"'}, [{"id": 1}, {"id": 2}]
+
+
+@REQUIRES_PYARROW
+def test_extract_from_api_revalidates_cached_responses(
+    http_server: StandInServer, tmp_path: Path
+) -> None:
+    """A 304 response is served from the cache."""
+    http_server.routes["/items"] = _versioned_items
+    cache = ExtractionCache(tmp_path)
+
+    first = extract_from_api(f"{http_server.url}/items", cache=cache)
+    second = extract_from_api(f"{http_server.url}/items", cache=cache)
+
+    assert second.equals(first)
+    assert http_server.requests[1]["headers"]["If-None-Match"] == '"v1"'
+    assert cache.stats["hits"] == 1
+
+
+@REQUIRES_PYARROW
+def test_extract_from_api_refetches_evicted_responses(
+    http_server: StandInServer, tmp_path: Path
+) -> None:
+    """A 304 for an entry evicted meanwhile stores the full response again."""
+    http_server.routes["/items"] = _versioned_items
+    cache = ExtractionCache(tmp_path)
+    url = f"{http_server.url}/items"
+
+    extract_from_api(url, cache=cache)
+    for snapshot in tmp_path.glob("*.arrow"):
+        snapshot.unlink()
+
+    assert len(extract_from_api(url, cache=cache)) == 2
+    assert len(extract_from_api(url, cache=cache)) == 2
+
+    sent: List[Any] = [
+        request["headers"].get("If-None-Match") for request in http_server.requests
+    ]
+    assert sent == [None, '"v1"', None, '"v1"']
+    assert cache.stats["entries"] == 1
+
+
+@REQUIRES_PYARROW
+def test_extract_from_api_304_restarts_the_ttl(
+    http_server: StandInServer, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Revalidated entries stay fresh for another TTL."""
+    clock = [1_000.0]
+    monkeypatch.setattr(cache_module, "time", SimpleNamespace(time=lambda: clock[0]))
+    http_server.routes["/items"] = _versioned_items
+    cache = ExtractionCache(tmp_path, ttl=100)
+    url = f"{http_server.url}/items"
+
+    for now in (1_000.0, 1_080.0, 1_160.0):
+        clock[0] = now
+        extract_from_api(url, cache=cache)
+
+    assert http_server.requests[2]["headers"].get("If-None-Match") == '"v1"'
+    assert cache.stats["hits"] == 2
+
+
+def _customer(request: Dict[str, Any]) -> Any:
+    """Serve the records of the customer named in the path."""
+    customer = int(request["path"].rsplit("/", 1)[1])
+    return 200, {}, {"data": [{"customer": customer, "order": n} for n in range(2)]}
+
+
+@REQUIRES_AIOHTTP
+def test_extract_from_api_many_concatenates_in_url_order(
+    http_server: StandInServer,
+) -> None:
+    """Every endpoint is fetched once and results keep the URL order."""
+    urls = [f"{http_server.url}/customers/{n}" for n in (3, 1, 2)]
+    for url in urls:
+        http_server.routes[url[len(http_server.url) :]] = _customer
+
+    df = extract_from_api_many(urls, json_path="data", source_column="url")
+
+    assert df["customer"].tolist() == [3, 3, 1, 1, 2, 2]
+    assert df["url"].tolist() == [url for url in urls for _ in range(2)]
+    assert len(http_server.requests) == 3
+
+
+@REQUIRES_AIOHTTP
+def test_extract_from_api_many_retries_throttled_requests(
+    http_server: StandInServer,
+) -> None:
+    """429 and 5xx responses are retried, honoring Retry-After."""
+    statuses = iter([429, 503])
+
+    def flaky(_: Dict[str, Any]) -> Any:
+        status = next(statuses, 200)
+        if status != 200:
+            return status, {"Retry-After": "0"}, b""
+        return 200, {}, [{"id": 1}]
+
+    http_server.routes["/flaky"] = flaky
+
+    df = extract_from_api_many([f"{http_server.url}/flaky"], backoff=0)
+
+    assert df["id"].tolist() == [1]
+    assert len(http_server.requests) == 3
+
+
+@REQUIRES_AIOHTTP
+def test_extract_from_api_many_inside_a_running_loop(
+    http_server: StandInServer,
+) -> None:
+    """Calls from async code run on a loop of their own."""
+    http_server.routes["/customers/1"] = _customer
+
+    async def caller() -> pd.DataFrame:
+        return extract_from_api_many(
+            [f"{http_server.url}/customers/1"], json_path="data"
+        )
+
+    assert len(asyncio.run(caller())) == 2
+
+
+@REQUIRES_AIOHTTP
+def test_load_to_api_async_sends_batches(http_server: StandInServer) -> None:
+    """Each batch is sent as one request with its records."""
+    http_server.routes["/load"] = lambda _: (201, {}, b"")
+    df = pd.DataFrame({"id": range(5)})
+
+    asyncio.run(load_to_api_async(df, f"{http_server.url}/load", batch_size=2))
+
+    batches = sorted(
+        (json.loads(request["body"]) for request in http_server.requests),
+        key=lambda batch: batch[0]["id"],
+    )
+    assert batches == [
+        [{"id": 0}, {"id": 1}],
+        [{"id": 2}, {"id": 3}],
+        [{"id": 4}],
+    ]
+
+
+RECORDS = [{"id": n} for n in range(23)]
+
+
+def _capped_pages(request: Dict[str, Any]) -> Any:
+    """Serve page/offset pages, capping the page size at 5 like many APIs."""
+    size = min(int(request["query"].get("limit", 5)), 5)
+    if "offset" in request["query"]:
+        start = int(request["query"]["offset"])
+    else:
+        start = (int(request["query"].get("page", 1)) - 1) * size
+    return 200, {}, {"data": RECORDS[start : start + size], "total": len(RECORDS)}
+
+
+@pytest.mark.parametrize("pagination", ["page", "offset"])
+def test_paginated_reads_pages_shorter_than_requested(
+    http_server: StandInServer, pagination: PaginationStrategy
+) -> None:
+    """A capped page size does not end the data early."""
+    http_server.routes["/records"] = _capped_pages
+
+    df = extract_from_api_paginated(
+        f"{http_server.url}/records",
+        pagination=pagination,
+        json_path="data",
+        page_size=5 if pagination == "offset" else 10,
+    )
+
+    assert df["id"].tolist() == list(range(23))
+
+
+def test_paginated_stops_at_the_total(http_server: StandInServer) -> None:
+    """total_path ends the data without requesting an empty page."""
+    http_server.routes["/records"] = _capped_pages
+
+    df = extract_from_api_paginated(
+        f"{http_server.url}/records",
+        json_path="data",
+        page_size=5,
+        total_path="total",
+        max_workers=1,
+    )
+
+    assert len(df) == 23
+    assert len(http_server.requests) == 5
+
+
+def test_paginated_stops_when_has_more_is_false(http_server: StandInServer) -> None:
+    """has_more_path ends the data on the last page."""
+
+    def pages(request: Dict[str, Any]) -> Any:
+        page = int(request["query"]["page"])
+        return 200, {}, {"data": [{"page": page}], "meta": {"more": page < 3}}
+
+    http_server.routes["/records"] = pages
+
+    df = extract_from_api_paginated(
+        f"{http_server.url}/records",
+        json_path="data",
+        has_more_path="meta.more",
+        max_workers=1,
+    )
+
+    assert df["page"].tolist() == [1, 2, 3]
+    assert len(http_server.requests) == 3
+
+
+def test_paginated_stops_when_the_page_parameter_is_ignored(
+    http_server: StandInServer,
+) -> None:
+    """A server returning the same page every time does not loop forever."""
+    http_server.routes["/records"] = lambda _: (200, {}, {"data": RECORDS[:5]})
+
+    df = extract_from_api_paginated(f"{http_server.url}/records", json_path="data")
+
+    assert df["id"].tolist() == list(range(5))
+
+
+def test_paginated_follows_cursors(http_server: StandInServer) -> None:
+    """Cursor pagination reads the next cursor from the body."""
+
+    def pages(request: Dict[str, Any]) -> Any:
+        start = int(request["query"].get("cursor", 0))
+        following = start + 10 if start + 10 < len(RECORDS) else None
+        return 200, {}, {"data": RECORDS[start : start + 10], "next": following}
+
+    http_server.routes["/records"] = pages
+
+    df = extract_from_api_paginated(
+        f"{http_server.url}/records",
+        pagination="cursor",
+        json_path="data",
+        cursor_path="next",
+    )
+
+    assert df["id"].tolist() == list(range(23))
+
+
+def test_paginated_follows_link_headers(http_server: StandInServer) -> None:
+    """Link pagination follows rel="next" headers."""
+
+    def pages(request: Dict[str, Any]) -> Any:
+        start = int(request["query"].get("from", 0))
+        headers = {}
+        if start + 10 < len(RECORDS):
+            headers["Link"] = (
+                f'<{http_server.url}/records?from={start + 10}>; rel="next"'
+            )
+        return 200, headers, RECORDS[start : start + 10]
+
+    http_server.routes["/records"] = pages
+
+    df = extract_from_api_paginated(f"{http_server.url}/records", pagination="link")
+
+    assert df["id"].tolist() == list(range(23))
+    assert len(http_server.requests) == 3
+
+
+def test_load_to_api_batched_sends_compressed_batches(
+    http_server: StandInServer,
+) -> None:
+    """Chunks are split into gzip-compressed batches, reported in order."""
+    http_server.routes["/load"] = lambda _: (201, {}, b"")
+    chunks = iter([pd.DataFrame({"id": range(5)}), pd.DataFrame({"id": range(5, 7)})])
+
+    reports = load_to_api_batched(
+        chunks, f"{http_server.url}/load", batch_size=2, compress=True
+    )
+
+    received = sorted(
+        record["id"]
+        for request in http_server.requests
+        for record in json.loads(gzip.decompress(request["body"]))
+    )
+    assert received == list(range(7))
+    assert [report["rows"] for report in reports] == [2, 2, 1, 2]
+    assert all(report["status"] == 201 for report in reports)
+    assert http_server.requests[0]["headers"]["Content-Encoding"] == "gzip"
+
+
+def test_load_to_api_batched_reports_failed_batches(
+    http_server: StandInServer,
+) -> None:
+    """Failures are retried per batch and reported without raising."""
+    http_server.routes["/load"] = lambda request: (
+        (400, {}, b"") if b'"id":0' in request["body"] else (201, {}, b"")
+    )
+
+    reports = load_to_api_batched(
+        pd.DataFrame({"id": range(4)}),
+        f"{http_server.url}/load",
+        batch_size=2,
+        raise_on_error=False,
+    )
+
+    assert [report["status"] for report in reports] == [400, 201]
+    assert reports[0]["error"] is not None
+
+    with pytest.raises(requests.HTTPError):
+        load_to_api_batched(
+            pd.DataFrame({"id": range(4)}), f"{http_server.url}/load", batch_size=2
+        )
@@ -0,0 +1,38 @@
+"""Tests of the benchmark suite's coverage of the registered functions."""
+
+import sys
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "benchmarks"))
+
+# pylint: disable=wrong-import-position
+from bench_suite import registered_functions, run_once
+from suite_cases import CASES, Fixture, build_frame
+
+
+def test_every_registered_function_has_a_case() -> None:
+    """Functions added to FRAGUA_SETS must come with a benchmark case."""
+    registered = registered_functions()
+
+    assert [name for name in registered if name not in CASES] == []
+    assert [name for name in CASES if name not in registered] == []
+
+
+@pytest.fixture(name="fixture", scope="module")
+def fixture_fixture(tmp_path_factory: pytest.TempPathFactory) -> Any:
+    """Benchmark inputs for a small frame, shared by the case runs."""
+    for module in ("pyarrow", "aiohttp", "openpyxl"):
+        pytest.importorskip(module)
+
+    fixture = Fixture(build_frame(200), tmp_path_factory.mktemp("bench"))
+    yield fixture
+    fixture.close()
+
+
+@pytest.mark.parametrize("name", sorted(CASES))
+def test_case_runs(fixture: Fixture, name: str) -> None:
+    """Every case prepares and runs once on a small frame."""
+    run_once(CASES[name].prepare(fixture))
@@ -0,0 +1,91 @@
+"""Tests of the on-disk extraction cache."""
+
+import os
+from pathlib import Path
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+
+from fragua_sets.functions.extraction import extract_from_csv
+from fragua_sets.utils import cache as cache_module
+from fragua_sets.utils.cache import ExtractionCache
+
+# Snapshots are Arrow IPC files
+pytest.importorskip("pyarrow")
+
+
+def _frame(rows: int) -> pd.DataFrame:
+    """Frame of a given number of rows."""
+    return pd.DataFrame({"value": range(rows), "label": "x"})
+
+
+def test_cache_round_trips_frames(tmp_path: Path) -> None:
+    """Snapshots read back equal, with a pickle fallback for mixed columns."""
+    cache = ExtractionCache(tmp_path)
+    mixed = pd.DataFrame({"value": [1, "a", 2.5]})
+
+    cache.put("arrow", _frame(3))
+    cache.put("mixed", mixed)
+
+    pd.testing.assert_frame_equal(cache.get("arrow"), _frame(3))
+    pd.testing.assert_frame_equal(cache.get("mixed"), mixed)
+    assert cache.get("missing") is None
+    assert (cache.stats["hits"], cache.stats["misses"]) == (2, 1)
+
+
+def test_cache_evicts_least_recently_used(tmp_path: Path) -> None:
+    """Going over max_bytes evicts the entries used longest ago."""
+    probe = ExtractionCache(tmp_path / "probe")
+    probe.put("probe", _frame(1_000))
+    size = probe.stats["size_bytes"]
+
+    cache = ExtractionCache(tmp_path / "cache", max_bytes=int(size * 2.5))
+    cache.put("a", _frame(1_000))
+    cache.put("b", _frame(1_000))
+    cache.get("a")
+    cache.put("c", _frame(1_000))
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+    assert cache.stats["evictions"] == 1
+
+
+def test_cache_index_survives_restarts(tmp_path: Path) -> None:
+    """Entries and their recency are kept across cache instances."""
+    ExtractionCache(tmp_path).put("a", _frame(3))
+
+    assert ExtractionCache(tmp_path).get("a") is not None
+
+
+def test_cache_expires_entries(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Entries older than the TTL are misses."""
+    clock = [1_000.0]
+    monkeypatch.setattr(cache_module, "time", SimpleNamespace(time=lambda: clock[0]))
+    cache = ExtractionCache(tmp_path, ttl=60)
+    cache.put("a", _frame(3))
+
+    clock[0] = 1_059.0
+    assert cache.get("a") is not None
+    clock[0] = 1_121.0
+    assert cache.get("a") is None
+    assert cache.stats["entries"] == 0
+
+
+def test_cached_extraction_invalidates_on_file_changes(tmp_path: Path) -> None:
+    """Editing a source file gives a new key."""
+    path = tmp_path / "source.csv"
+    path.write_text("a\n1\n", encoding="utf-8")
+    cache = ExtractionCache(tmp_path / "cache")
+    extract = cache.cached(extract_from_csv)
+
+    assert extract(str(path))["a"].tolist() == [1]
+    assert extract(str(path))["a"].tolist() == [1]
+    assert cache.stats["hits"] == 1
+
+    path.write_text("a\n1\n2\n", encoding="utf-8")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert extract(str(path))["a"].tolist() == [1, 2]
+    assert cache.stats["misses"] == 2
@@ -0,0 +1,81 @@
+"""Tests of the chunked DataFrame helpers."""
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+import sqlalchemy as sa
+
+from fragua_sets.functions import loading
+from fragua_sets.functions.extraction import (
+    extract_from_csv_chunks,
+    extract_from_database_chunks,
+)
+from fragua_sets.functions.transformation import (
+    create_sum_column,
+    filter_by_min_value,
+    rename_columns,
+)
+from fragua_sets.utils.chunks import Frames, collect_chunks
+
+
+def test_row_local_accepts_df_keyword() -> None:
+    """Decorated steps are called the way fragua agents call them."""
+    df = pd.DataFrame({"value": [1, 5, 3]})
+
+    result = filter_by_min_value(df=df, column="value", min_value=3)
+
+    assert result["value"].tolist() == [5, 3]
+
+
+def test_row_local_maps_chunk_streams_given_as_keyword() -> None:
+    """Chunk streams passed as df= are transformed chunk by chunk."""
+    chunks = iter([pd.DataFrame({"value": [1, 5]}), pd.DataFrame({"value": [3]})])
+
+    result = filter_by_min_value(df=chunks, column="value", min_value=3)
+
+    assert collect_chunks(result)["value"].tolist() == [5, 3]
+
+
+def test_csv_chunks_stream_through_transformations_to_csv(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A chunked CSV pipeline writes the same file as the eager one."""
+    monkeypatch.setattr(loading, "get_project_root", lambda: tmp_path)
+    source = tmp_path / "source.csv"
+    pd.DataFrame({"a": range(10), "b": range(10, 20)}).to_csv(source, index=False)
+
+    def pipeline(df: Frames) -> Frames:
+        df = create_sum_column(df, "a", "b", "total")
+        df = filter_by_min_value(df, column="total", min_value=16)
+        return rename_columns(df, {"total": "sum"})
+
+    chunks = extract_from_csv_chunks(str(source), chunksize=3)
+    loading.load_to_csv(pipeline(chunks), "chunked.csv", subdir="out")
+    loading.load_to_csv(pipeline(pd.read_csv(source)), "eager.csv", subdir="out")
+
+    assert (tmp_path / "out" / "chunked.csv").read_text(encoding="utf-8") == (
+        tmp_path / "out" / "eager.csv"
+    ).read_text(encoding="utf-8")
+
+
+@pytest.mark.parametrize("chunksize", [1, 4, 100])
+def test_database_chunks_match_read_sql(tmp_path: Path, chunksize: int) -> None:
+    """Batches from the server-side cursor add up to the full query result."""
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'source.db'}")
+    pd.DataFrame({"id": range(10), "name": list("abcdefghij")}).to_sql(
+        "source", engine, index=False
+    )
+    query = "SELECT * FROM source WHERE id >= :low"
+
+    chunks = list(
+        extract_from_database_chunks(
+            engine, query, params={"low": 3}, chunksize=chunksize
+        )
+    )
+
+    assert all(len(chunk) <= chunksize for chunk in chunks)
+    pd.testing.assert_frame_equal(
+        collect_chunks(iter(chunks)),
+        pd.read_sql(sa.text(query), engine, params={"low": 3}),
+    )
@@ -0,0 +1,70 @@
+"""Tests of the Parquet and Feather extraction and loading."""
+
+from pathlib import Path
+from typing import Callable
+
+import pandas as pd
+import pytest
+
+from fragua_sets.functions import loading
+from fragua_sets.functions.extraction import extract_from_feather, extract_from_parquet
+from fragua_sets.functions.loading import load_to_feather, load_to_parquet
+
+pytest.importorskip("pyarrow")
+
+
+@pytest.fixture(name="output_dir")
+def fixture_output_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Directory the loaders write into."""
+    monkeypatch.setattr(loading, "get_project_root", lambda: tmp_path)
+    return tmp_path / "output"
+
+
+FRAME = pd.DataFrame(
+    {
+        "id": range(10),
+        "amount": [5.0, 150.0, 20.0, None, 300.0, 7.0, 101.0, 99.0, 100.0, 1.0],
+        "city": list("abcabcabca"),
+    }
+)
+
+
+@pytest.mark.parametrize(
+    ("load", "extract"),
+    [(load_to_parquet, extract_from_parquet), (load_to_feather, extract_from_feather)],
+    ids=["parquet", "feather"],
+)
+def test_columnar_round_trip_with_pushdown(
+    output_dir: Path,
+    load: Callable[..., None],
+    extract: Callable[..., pd.DataFrame],
+) -> None:
+    """Chunk streams load into one file; reads project and filter it."""
+    load(iter([FRAME.iloc[:4], FRAME.iloc[4:]]), "data", subdir="output")
+    path = str(output_dir / "data")
+
+    full = extract(path)
+    selected = extract(
+        path,
+        columns=["id", "amount"],
+        filters=[[("amount", ">=", 100), ("city", "!=", "c")], [("id", "==", 0)]],
+    )
+
+    pd.testing.assert_frame_equal(full, FRAME)
+    assert selected.columns.tolist() == ["id", "amount"]
+    assert sorted(selected["id"]) == [0, 1, 4, 6]
+
+
+def test_parquet_row_groups(output_dir: Path) -> None:
+    """row_group_size bounds the rows of every row group."""
+    parquet = pytest.importorskip("pyarrow.parquet")
+
+    load_to_parquet(FRAME, "data", subdir="output", row_group_size=3)
+
+    metadata = parquet.ParquetFile(output_dir / "data").metadata
+    assert [metadata.row_group(n).num_rows for n in range(metadata.num_row_groups)] == [
+        3,
+        3,
+        3,
+        1,
+    ]
@@ -0,0 +1,71 @@
+"""Tests of the streaming Excel extraction and loading."""
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from fragua_sets.functions import loading
+from fragua_sets.functions.extraction import (
+    extract_from_excel,
+    extract_from_excel_chunks,
+    extract_from_excel_sheets,
+)
+from fragua_sets.functions.loading import load_to_excel
+from fragua_sets.utils.chunks import collect_chunks
+
+openpyxl = pytest.importorskip("openpyxl")
+
+FRAME = pd.DataFrame({"id": range(7), "name": list("abcdefg"), "x": 0.5})
+
+
+@pytest.fixture(name="output_dir")
+def fixture_output_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Directory the loaders write into."""
+    monkeypatch.setattr(loading, "get_project_root", lambda: tmp_path)
+    return tmp_path / "output"
+
+
+def test_streamed_workbook_reads_back_in_chunks(output_dir: Path) -> None:
+    """Chunk streams written in constant memory read back in chunks."""
+    load_to_excel(iter([FRAME.iloc[:3], FRAME.iloc[3:]]), "data.xlsx", subdir="output")
+
+    chunks = list(extract_from_excel_chunks(str(output_dir / "data.xlsx"), chunksize=3))
+
+    assert [len(chunk) for chunk in chunks] == [3, 3, 1]
+    pd.testing.assert_frame_equal(collect_chunks(chunks), FRAME)
+    pd.testing.assert_frame_equal(
+        extract_from_excel(str(output_dir / "data.xlsx")), FRAME
+    )
+
+
+def test_excel_chunks_pad_ragged_rows(tmp_path: Path) -> None:
+    """Rows without trailing cells are padded; blank rows are skipped."""
+    path = tmp_path / "ragged.xlsx"
+    workbook = openpyxl.Workbook(write_only=True)
+    sheet = workbook.create_sheet("data")
+    for row in (["id", "name", "note"], [1, "a"], [], [2, "b", "late"], [3]):
+        sheet.append(row)
+    workbook.save(path)
+
+    df = collect_chunks(extract_from_excel_chunks(str(path), sheet_name="data"))
+
+    assert df.columns.tolist() == ["id", "name", "note"]
+    assert df.astype(object).where(df.notna(), None).values.tolist() == [
+        [1, "a", None],
+        [2, "b", "late"],
+        [3, None, None],
+    ]
+
+
+def test_excel_sheets_are_concatenated_in_order(tmp_path: Path) -> None:
+    """Sheets read in parallel keep the requested order and are tagged."""
+    path = tmp_path / "sheets.xlsx"
+    with pd.ExcelWriter(path) as writer:
+        FRAME.iloc[:2].to_excel(writer, sheet_name="first", index=False)
+        FRAME.iloc[2:5].to_excel(writer, sheet_name="second", index=False)
+
+    df = extract_from_excel_sheets(str(path), sheet_names=["second", "first"])
+
+    assert df["id"].tolist() == [2, 3, 4, 0, 1]
+    assert df["sheet"].tolist() == ["second"] * 3 + ["first"] * 2
@@ -0,0 +1,162 @@
+"""Tests of the extraction functions."""
+
+import io
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pandas as pd
+import pytest
+import sqlalchemy as sa
+
+from fragua_sets.functions.extraction import (
+    extract_from_csv,
+    extract_from_csv_files,
+    extract_from_database_chunks,
+    extract_from_database_partitioned,
+    extract_from_database_partitioned_chunks,
+)
+from fragua_sets.utils.chunks import collect_chunks
+
+
+def test_database_chunks_connect_on_first_batch(tmp_path: Path) -> None:
+    """A stream holds a pooled connection only while it is being read."""
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'source.db'}")
+    pd.DataFrame({"value": range(5)}).to_sql("source", engine, index=False)
+
+    chunks = extract_from_database_chunks(engine, "SELECT * FROM source", chunksize=2)
+    assert engine.pool.checkedout() == 0
+
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    assert engine.pool.checkedout() == 0
+
+
+def test_extract_from_csv_reads_paths_with_glob_characters(tmp_path: Path) -> None:
+    """An existing file is read as is, even if its name looks like a glob."""
+    path = tmp_path / "report[2024].csv"
+    path.write_text("a,b\n1,2\n", encoding="utf-8")
+
+    assert extract_from_csv(str(path)).shape == (1, 2)
+
+
+def test_extract_from_csv_reads_buffers() -> None:
+    """Open files and buffers go straight to pandas.read_csv."""
+    assert extract_from_csv(io.StringIO("a,b\n1,2\n3,4\n")).shape == (2, 2)
+
+
+def test_extract_from_csv_filters_buffers_without_matches() -> None:
+    """Buffers whose rows are all filtered out keep their columns."""
+    df = extract_from_csv(
+        io.StringIO("a,b\n1,2\n3,4\n"), filters=[("a", ">", 10)], source_column="file"
+    )
+
+    assert df.empty
+    assert df.columns.tolist() == ["a", "b", "file"]
+
+
+@pytest.fixture(name="orders_engine")
+def fixture_orders_engine(tmp_path: Path) -> sa.engine.Engine:
+    """File-backed SQLite database with an 'orders' table."""
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'orders.db'}")
+    pd.DataFrame(
+        {
+            "id": [1, 2, 3, None, 5, 6, 7, 8, 9, 100],
+            "day": pd.date_range("2024-01-01", periods=10).astype(str),
+        }
+    ).to_sql("orders", engine, index=False)
+    return engine
+
+
+@pytest.mark.parametrize(
+    "bounds", [{}, {"lower_bound": 3, "upper_bound": 6}], ids=["queried", "explicit"]
+)
+def test_partitioned_extraction_returns_every_row_once(
+    orders_engine: sa.engine.Engine, bounds: Dict[str, Any]
+) -> None:
+    """Partitions cover NULLs and values outside explicit bounds."""
+    query = "SELECT * FROM orders -- every order"
+
+    df = extract_from_database_partitioned(
+        orders_engine, query, partition_column="id", partitions=3, **bounds
+    )
+
+    expected = pd.read_sql_query("SELECT * FROM orders", orders_engine)
+    assert sorted(df["id"].fillna(-1)) == sorted(expected["id"].fillna(-1))
+
+
+def test_partitioned_chunks_match_partitioned_extraction(
+    orders_engine: sa.engine.Engine,
+) -> None:
+    """The streaming variant yields the same rows, in completion order."""
+    options: Dict[str, Any] = {"partition_column": "id", "partitions": 3}
+    query = "SELECT * FROM orders"
+
+    frame = extract_from_database_partitioned(orders_engine, query, **options)
+    chunks = extract_from_database_partitioned_chunks(orders_engine, query, **options)
+
+    streamed = collect_chunks(chunks).sort_values("id", ignore_index=True)
+    pd.testing.assert_frame_equal(streamed, frame.sort_values("id", ignore_index=True))
+
+
+@pytest.fixture(name="shards")
+def fixture_shards(tmp_path: Path) -> List[Path]:
+    """Three CSV shards with disjoint ids and some missing amounts."""
+    paths = []
+    for shard in range(3):
+        path = tmp_path / f"shard_{shard}.csv"
+        pd.DataFrame(
+            {
+                "id": range(shard * 4, shard * 4 + 4),
+                "amount": [1.5, None, 3.5, 4.5],
+                "region": ["north", "south", "east", "west"],
+            }
+        ).to_csv(path, index=False)
+        paths.append(path)
+    return paths
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_csv_glob_matches_serial_concat(
+    shards: List[Path], tmp_path: Path, max_workers: int
+) -> None:
+    """A glob is read in sorted order, serially or in worker processes."""
+    expected = pd.concat([pd.read_csv(path) for path in shards], ignore_index=True)
+
+    df = extract_from_csv(str(tmp_path / "shard_*.csv"), max_workers=max_workers)
+
+    pd.testing.assert_frame_equal(df, expected)
+
+
+def test_csv_list_keeps_order_and_applies_filters(shards: List[Path]) -> None:
+    """Columns and filters are applied per file, in the order of the list."""
+    paths = [str(path) for path in reversed(shards)]
+    expected = pd.concat(
+        [pd.read_csv(path) for path in paths], ignore_index=True
+    ).dropna(subset=["amount"])
+    expected = expected[expected["amount"] >= 3][["amount", "id"]]
+
+    df = extract_from_csv(
+        paths,
+        max_workers=2,
+        columns=["amount", "id"],
+        filters=[("amount", "not null", None), ("amount", ">=", 3)],
+    )
+
+    pd.testing.assert_frame_equal(df, expected.reset_index(drop=True))
+
+
+def test_csv_files_stream_every_file_with_its_source(
+    shards: List[Path], tmp_path: Path
+) -> None:
+    """Each streamed chunk is one file, tagged with its path."""
+    chunks = list(
+        extract_from_csv_files(
+            str(tmp_path / "shard_*.csv"), max_workers=2, source_column="file"
+        )
+    )
+
+    assert len(chunks) == len(shards)
+    for chunk in chunks:
+        source = chunk["file"].iloc[0]
+        assert chunk["file"].nunique() == 1
+        pd.testing.assert_frame_equal(chunk.drop(columns="file"), pd.read_csv(source))
+    assert sorted(Path(chunk["file"].iloc[0]) for chunk in chunks) == shards
@@ -0,0 +1,85 @@
+"""Tests of the incremental (high-watermark) extraction."""
+
+from pathlib import Path
+from typing import List
+
+import pandas as pd
+import sqlalchemy as sa
+
+from fragua_sets.functions.extraction import (
+    extract_from_csv_incremental,
+    extract_from_database_incremental,
+)
+from fragua_sets.utils.state import WatermarkStore
+
+
+def test_csv_incremental_reads_only_appended_lines(tmp_path: Path) -> None:
+    """Each run resumes after the last complete line of the previous one."""
+    path = tmp_path / "events.csv"
+    state = str(tmp_path / "state.json")
+    path.write_text("id,name\n1,a\n2,b\n", encoding="utf-8")
+
+    assert extract_from_csv_incremental(str(path), store=state)["id"].tolist() == [1, 2]
+
+    with path.open("a", encoding="utf-8") as file:
+        file.write("3,c\n4,")
+    assert extract_from_csv_incremental(str(path), store=state)["id"].tolist() == [3]
+
+    with path.open("a", encoding="utf-8") as file:
+        file.write("d\n")
+    delta = extract_from_csv_incremental(str(path), store=state)
+    assert delta.to_dict("records") == [{"id": 4, "name": "d"}]
+
+    empty = extract_from_csv_incremental(str(path), store=state)
+    assert empty.empty
+    assert empty.columns.tolist() == ["id", "name"]
+
+
+def test_csv_incremental_rereads_replaced_files(tmp_path: Path) -> None:
+    """A truncated file is read again from the start."""
+    path = tmp_path / "events.csv"
+    store = WatermarkStore(tmp_path / "state.json")
+    path.write_text("id\n1\n2\n3\n", encoding="utf-8")
+    extract_from_csv_incremental(str(path), store=store)
+
+    path.write_text("id\n9\n", encoding="utf-8")
+
+    assert extract_from_csv_incremental(str(path), store=store)["id"].tolist() == [9]
+
+
+def test_csv_incremental_without_header(tmp_path: Path) -> None:
+    """Headerless files give an empty frame with `names` when nothing is new."""
+    path = tmp_path / "events.csv"
+    state = str(tmp_path / "state.json")
+    path.write_text("1,a\n", encoding="utf-8")
+    options = {"header": None, "names": ["id", "name"]}
+
+    first = extract_from_csv_incremental(str(path), store=state, **options)
+    second = extract_from_csv_incremental(str(path), store=state, **options)
+
+    assert first["id"].tolist() == [1]
+    assert second.empty
+    assert second.columns.tolist() == ["id", "name"]
+
+
+def test_database_incremental_resumes_from_the_saved_watermark(
+    tmp_path: Path,
+) -> None:
+    """Only rows above the persisted watermark are read."""
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'source.db'}")
+    pd.DataFrame({"id": [1, 2, 3]}).to_sql("events", engine, index=False)
+    state = str(tmp_path / "state.json")
+    query = "SELECT * FROM events -- all events"
+
+    def run() -> List[int]:
+        return extract_from_database_incremental(
+            engine, query, watermark_column="id", store=state, key="events"
+        )["id"].tolist()
+
+    assert run() == [1, 2, 3]
+    pd.DataFrame({"id": [4, 5]}).to_sql(
+        "events", engine, index=False, if_exists="append"
+    )
+    assert run() == [4, 5]
+    assert run() == []
+    assert WatermarkStore(state).get("events") == 5
@@ -0,0 +1,89 @@
+"""Tests of the per-call instrumentation."""
+
+import json
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from fragua_sets.functions.transformation import filter_by_min_value
+from fragua_sets.sets.sets_config import create_sets
+from fragua_sets.utils.instrumentation import (
+    AggregatingSink,
+    JsonLinesSink,
+    PrometheusTextfileSink,
+    instrument,
+)
+
+
+def test_instrument_measures_df_keyword_input() -> None:
+    """Input metrics are recorded when the frame is passed as df=."""
+    sink = AggregatingSink(keep_records=True)
+    step = instrument(filter_by_min_value, set_name="transformation", sink=sink)
+
+    step(df=pd.DataFrame({"value": [1, 2, 3]}), column="value", min_value=2)
+
+    (record,) = sink.records
+    assert (record["rows_in"], record["columns_in"], record["rows_out"]) == (3, 1, 2)
+
+
+def test_create_sets_instruments_only_with_a_sink() -> None:
+    """Registered functions report to the sink, and stay raw without one."""
+    sink = AggregatingSink()
+    sets = {fragua_set.name: fragua_set for fragua_set in create_sets(sink=sink)}
+    raw = {fragua_set.name: fragua_set for fragua_set in create_sets()}
+
+    step = sets["transformation"].get_function("filter_by_min_value")
+    step(df=pd.DataFrame({"value": [1, 2, 3]}), column="value", min_value=2)
+
+    totals = sink.summary()["transformation.filter_by_min_value"]
+    assert (totals["calls"], totals["rows_out"]) == (1, 2)
+    assert (
+        raw["transformation"].get_function("filter_by_min_value") is filter_by_min_value
+    )
+
+
+def test_instrument_measures_chunk_streams_when_exhausted() -> None:
+    """A chunk stream reports once, with the rows summed over its chunks."""
+    sink = AggregatingSink(keep_records=True)
+    step = instrument(filter_by_min_value, set_name="transformation", sink=sink)
+    chunks = iter([pd.DataFrame({"value": [1, 5]}), pd.DataFrame({"value": [3]})])
+
+    result = step(chunks, column="value", min_value=3)
+    assert not sink.records
+
+    assert sum(len(chunk) for chunk in result) == 2
+    (record,) = sink.records
+    assert record["rows_out"] == 2
+    assert record["error"] is None
+
+
+def test_instrument_records_errors(tmp_path: Path) -> None:
+    """Failed calls are emitted with the exception name and re-raised."""
+    sink = JsonLinesSink(tmp_path / "metrics.jsonl")
+    step = instrument(filter_by_min_value, set_name="transformation", sink=sink)
+
+    with pytest.raises(KeyError):
+        step(pd.DataFrame({"value": [1]}), column="missing", min_value=0)
+
+    (line,) = (tmp_path / "metrics.jsonl").read_text(encoding="utf-8").splitlines()
+    assert json.loads(line)["error"] == "KeyError"
+
+
+def test_prometheus_sink_writes_counters(tmp_path: Path) -> None:
+    """The textfile holds one counter per metric and function."""
+    path = tmp_path / "metrics" / "fragua.prom"
+    step = instrument(
+        filter_by_min_value,
+        set_name="transformation",
+        sink=PrometheusTextfileSink(path),
+    )
+
+    for _ in range(2):
+        step(pd.DataFrame({"value": [1, 2, 3]}), column="value", min_value=2)
+
+    lines = path.read_text(encoding="utf-8").splitlines()
+    labels = 'set="transformation",function="filter_by_min_value"'
+    assert f"fragua_step_calls_total{{{labels}}} 2" in lines
+    assert f"fragua_step_rows_out_total{{{labels}}} 4" in lines
+    assert not list(path.parent.glob("*.tmp"))
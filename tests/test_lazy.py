@@ -0,0 +1,50 @@
+"""Tests of the lazy module imports."""
+
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from types import ModuleType
+
+import pytest
+
+from fragua_sets.utils.lazy import lazy_import
+
+
+@pytest.fixture(name="unimported")
+def fixture_unimported(monkeypatch: pytest.MonkeyPatch) -> str:
+    """Name of a module removed from sys.modules for the test."""
+    monkeypatch.delitem(sys.modules, "colorsys", raising=False)
+    return "colorsys"
+
+
+def test_lazy_import_defers_the_import(unimported: str) -> None:
+    """The module is only executed on first attribute access."""
+    module = lazy_import(unimported)
+    assert unimported not in sys.modules
+
+    assert module.rgb_to_hsv(1.0, 0.0, 0.0) == (0.0, 1.0, 1.0)
+    assert unimported in sys.modules
+
+
+def test_lazy_import_binds_the_module_after_first_access(unimported: str) -> None:
+    """Loaded proxies are plain modules with the real attributes."""
+    module = lazy_import(unimported)
+    rgb_to_hsv = module.rgb_to_hsv
+
+    assert type(module) is ModuleType  # pylint: disable=unidiomatic-typecheck
+    assert module.__dict__["rgb_to_hsv"] is rgb_to_hsv
+
+
+def test_lazy_import_first_access_from_several_threads(unimported: str) -> None:
+    """Threads racing on the first access all see a loaded module."""
+    module = lazy_import(unimported)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lambda _: module.hls_to_rgb(0.0, 0.5, 1.0), range(8)))
+
+    assert results == [(1.0, 0.0, 0.0)] * 8
+
+
+def test_lazy_import_missing_module() -> None:
+    """Missing modules fail at lazy_import time."""
+    with pytest.raises(ModuleNotFoundError):
+        lazy_import("fragua_sets_missing_module")
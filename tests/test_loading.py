@@ -0,0 +1,207 @@
+"""Tests of the loading functions."""
+
+import importlib.util
+import io
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Callable, Dict
+
+import pandas as pd
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from fragua_sets.functions import loading
+from fragua_sets.functions.loading import (
+    BulkLoadStrategy,
+    bulk_load_to_database,
+    load_to_csv,
+    load_to_database,
+    load_to_feather,
+    load_to_parquet,
+)
+
+REQUIRES_PYARROW = pytest.mark.skipif(
+    importlib.util.find_spec("pyarrow") is None, reason="pyarrow is not installed"
+)
+
+
+def test_load_to_database_replace_with_empty_stream_empties_table() -> None:
+    """Replacing a table with an empty chunk stream leaves no stale rows."""
+    engine = sa.create_engine("sqlite://")
+    pd.DataFrame({"value": [1, 2]}).to_sql("target", engine, index=False)
+
+    load_to_database(iter([]), engine, "target", if_exists="replace")
+
+    assert pd.read_sql_query("SELECT * FROM target", engine).empty
+
+
+def test_upsert_writes_to_the_given_schema(tmp_path: Path) -> None:
+    """Upserts honor the schema and dtype options of pandas.to_sql."""
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'main.db'}")
+    other = tmp_path / "other.db"
+
+    @sa.event.listens_for(engine, "connect")
+    def attach(dbapi_connection: Any, _: Any) -> None:
+        dbapi_connection.execute(f"ATTACH DATABASE '{other}' AS other")
+
+    for frame in (
+        pd.DataFrame({"id": [1, 2], "name": ["a", "b"]}),
+        pd.DataFrame({"id": [2, 3], "name": ["B", "c"]}),
+    ):
+        load_to_database(
+            frame,
+            engine,
+            "target",
+            if_exists="upsert",
+            key_columns=["id"],
+            schema="other",
+            dtype={"name": sa.Text()},
+        )
+
+    result = pd.read_sql_query("SELECT * FROM other.target ORDER BY id", engine)
+    assert result["name"].tolist() == ["a", "B", "c"]
+    assert not sa.inspect(engine).has_table("target")
+
+
+def test_upsert_merges_batches_idempotently() -> None:
+    """Reruns and small batches give the same merged rows, last key wins."""
+    engine = sa.create_engine("sqlite://")
+    pd.DataFrame({"region": ["n", "s"], "id": [1, 1], "amount": [1.0, 2.0]}).to_sql(
+        "target", engine, index=False
+    )
+    with engine.begin() as conn:
+        conn.exec_driver_sql("CREATE UNIQUE INDEX target_key ON target (region, id)")
+    update = pd.DataFrame(
+        {
+            "region": ["n", "e", "n", "e"],
+            "id": [1, 2, 3, 2],
+            "amount": [10.0, 20.0, 30.0, 21.0],
+        }
+    )
+
+    for _ in range(2):
+        load_to_database(
+            iter([update.iloc[:3], update.iloc[3:]]),
+            engine,
+            "target",
+            if_exists="upsert",
+            key_columns=["region", "id"],
+            chunksize=2,
+        )
+
+    result = pd.read_sql_query("SELECT * FROM target ORDER BY region, id", engine)
+    assert result.to_dict("list") == {
+        "region": ["e", "n", "n", "s"],
+        "id": [2, 1, 3, 1],
+        "amount": [21.0, 10.0, 30.0, 2.0],
+    }
+    assert sa.inspect(engine).get_table_names() == ["target"]
+
+
+def test_upsert_requires_key_columns() -> None:
+    """Upserts without key columns are refused before touching the table."""
+    with pytest.raises(ValueError, match="key_columns"):
+        load_to_database(
+            pd.DataFrame({"id": [1]}),
+            sa.create_engine("sqlite://"),
+            "target",
+            if_exists="upsert",
+        )
+
+
+@pytest.mark.parametrize(
+    ("load", "read"),
+    [
+        (load_to_csv, pd.read_csv),
+        pytest.param(load_to_parquet, pd.read_parquet, marks=REQUIRES_PYARROW),
+        pytest.param(load_to_feather, pd.read_feather, marks=REQUIRES_PYARROW),
+    ],
+)
+def test_file_loaders_replace_files_with_empty_stream(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    load: Callable[..., None],
+    read: Callable[..., Any],
+) -> None:
+    """An empty chunk stream leaves no rows from an earlier run."""
+    monkeypatch.setattr(loading, "get_project_root", lambda: tmp_path)
+
+    load(pd.DataFrame({"value": [1, 2]}), "out", subdir="output")
+    load(iter([]), "out", subdir="output")
+
+    path = tmp_path / "output" / "out"
+    if read is pd.read_csv:
+        assert path.read_text(encoding="utf-8") == ""
+    else:
+        assert read(path).empty
+
+
+@pytest.mark.parametrize("strategy", ["auto", "multi", "executemany"])
+def test_bulk_load_matches_to_sql(strategy: BulkLoadStrategy) -> None:
+    """Every strategy stores what pandas.to_sql stores, NULLs included."""
+    engine = sa.create_engine("sqlite://")
+    frame = pd.DataFrame(
+        {"id": range(7), "name": ["a", "", None, "d", "e", None, "g"], "x": 1.5}
+    )
+    chunks = iter([frame.iloc[:4], frame.iloc[4:]])
+
+    report = bulk_load_to_database(
+        chunks, engine, "target", strategy=strategy, chunksize=3
+    )
+
+    result = pd.read_sql_query("SELECT * FROM target ORDER BY id", engine)
+    pd.testing.assert_frame_equal(result, frame)
+    assert report["rows"] == 7
+    assert report["strategy"] == ("executemany" if strategy == "auto" else strategy)
+
+
+def test_bulk_load_copy_requires_postgresql() -> None:
+    """COPY is only offered on PostgreSQL."""
+    with pytest.raises(ValueError):
+        bulk_load_to_database(
+            pd.DataFrame({"a": [1]}),
+            sa.create_engine("sqlite://"),
+            "t",
+            strategy="copy",
+        )
+
+
+def test_copy_payload_keeps_empty_strings_apart_from_nulls() -> None:
+    """COPY CSV marks NULLs with \\N and quotes every other value."""
+    copied: Dict[str, Any] = {}
+
+    class Cursor:
+        """psycopg2-style cursor recording its COPY."""
+
+        rowcount = 3
+
+        def __enter__(self) -> "Cursor":
+            return self
+
+        def __exit__(self, *exc_info: object) -> None:
+            pass
+
+        def copy_expert(self, sql: str, buffer: io.StringIO) -> None:
+            """Record the statement and payload."""
+            copied.update(sql=sql, payload=buffer.read())
+
+    connection = SimpleNamespace(
+        dialect=postgresql.dialect(), connection=SimpleNamespace(cursor=Cursor)
+    )
+    table = SimpleNamespace(name="target", schema="staging")
+
+    rows = [("", 1), (None, 2), ('say "\\N"', None)]
+    count = loading._copy_from_stdin(  # pylint: disable=protected-access
+        table, connection, ["name", "id"], iter(rows)
+    )
+
+    assert count == 3
+    assert copied["sql"] == (
+        "COPY staging.target (name, id) FROM STDIN WITH (FORMAT csv, NULL '\\N')"
+    )
+    assert copied["payload"].splitlines() == [
+        '"","1"',
+        '\\N,"2"',
+        '"say ""\\N""",\\N',
+    ]
@@ -0,0 +1,209 @@
+"""Tests of pushing transformation steps down into extractions."""
+
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+import pytest
+import sqlalchemy as sa
+from fragua import FraguaStep
+
+from fragua_sets.functions import extraction, transformation
+from fragua_sets.utils.planner import explain_pushdown, plan_pushdown
+
+FUNCTION_SETS = {"extraction": extraction, "transformation": transformation}
+
+
+def run_steps(steps: Sequence[FraguaStep]) -> pd.DataFrame:
+    """Run steps in order, as a pipeline would, and return the last result."""
+    results: Dict[str, Any] = {}
+    result: Any = None
+
+    for step in steps:
+        function = getattr(FUNCTION_SETS[step.set_name], step.function)
+        args = [results[step.use]] if step.use else []
+        result = function(*args, **step.params)
+        results[step.save_as or step.function] = result
+
+    return result
+
+
+def chain(
+    extract: FraguaStep, *transforms: Any, last: Optional[str] = None
+) -> List[FraguaStep]:
+    """Build `extract` followed by transformations, each using the previous."""
+    steps = [extract]
+    for index, (function, params) in enumerate(transforms):
+        steps.append(
+            FraguaStep(
+                set_name="transformation",
+                function=function,
+                params=params,
+                save_as=last if index == len(transforms) - 1 and last else f"t{index}",
+                use=steps[-1].save_as,
+            )
+        )
+    return steps
+
+
+@pytest.fixture(name="engine")
+def fixture_engine(tmp_path: Path) -> sa.engine.Engine:
+    """File-backed SQLite database with a 'readings' table."""
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'readings.db'}")
+    pd.DataFrame(
+        {
+            "id": range(6),
+            "value": [1.0, None, 3.0, 4.0, None, 6.0],
+            "label": list("abcdef"),
+        }
+    ).to_sql("readings", engine, index=False)
+    return engine
+
+
+def test_database_steps_fold_into_one_query(engine: sa.engine.Engine) -> None:
+    """Filters and projections become one query returning the same rows."""
+    steps = chain(
+        FraguaStep(
+            set_name="extraction",
+            function="extract_from_database",
+            params={"engine": engine, "query": "SELECT * FROM readings -- all"},
+            save_as="raw",
+        ),
+        ("filter_by_min_value", {"column": "id", "min_value": np.int64(2)}),
+        ("drop_nulls_in_columns", {"columns": ["value"]}),
+        ("select_columns", {"columns": ["id", "label"]}),
+        last="clean",
+    )
+
+    plan = plan_pushdown(steps)
+
+    assert len(plan["steps"]) == 1
+    assert plan["steps"][0].save_as == "clean"
+    assert "WHERE" in plan["steps"][0].params["query"]
+    assert explain_pushdown(plan).startswith("3 step(s) pushed into 1 extraction(s)")
+    pd.testing.assert_frame_equal(
+        run_steps(plan["steps"]), run_steps(steps).reset_index(drop=True)
+    )
+
+
+def test_csv_steps_become_reader_arguments(tmp_path: Path) -> None:
+    """CSV extractions take the projection and filters as arguments."""
+    path = tmp_path / "readings.csv"
+    pd.DataFrame(
+        {"id": range(6), "value": [1.0, None, 3.0, 4.0, None, 6.0], "label": "x"}
+    ).to_csv(path, index=False)
+    steps = chain(
+        FraguaStep(
+            set_name="extraction",
+            function="extract_from_csv",
+            params={"path": str(path)},
+            save_as="raw",
+        ),
+        ("select_columns", {"columns": ["id", "value"]}),
+        ("drop_nulls_in_columns", {"columns": ["value"]}),
+        ("filter_by_min_value", {"column": "id", "min_value": 2}),
+    )
+
+    plan = plan_pushdown(steps)
+    params = plan["steps"][0].params
+
+    assert len(plan["steps"]) == 1
+    assert params["columns"] == ["id", "value"]
+    assert params["filters"] == [("value", "not null", None), ("id", ">=", 2)]
+    pd.testing.assert_frame_equal(
+        run_steps(plan["steps"]).reset_index(drop=True),
+        run_steps(steps).reset_index(drop=True),
+    )
+
+
+def test_parquet_keeps_null_drops_as_steps(tmp_path: Path) -> None:
+    """Parquet has no 'not null' predicate, so the null drop is not pushed."""
+    steps = chain(
+        FraguaStep(
+            set_name="extraction",
+            function="extract_from_parquet",
+            params={"path": str(tmp_path / "readings.parquet")},
+            save_as="raw",
+        ),
+        ("filter_by_min_value", {"column": "id", "min_value": 2}),
+        ("drop_nulls_in_columns", {"columns": ["value"]}),
+    )
+
+    plan = plan_pushdown(steps)
+
+    assert [step.function for step in plan["steps"]] == [
+        "extract_from_parquet",
+        "drop_nulls_in_columns",
+    ]
+    assert plan["steps"][0].params["filters"] == [("id", ">=", 2)]
+    assert plan["steps"][1].use == plan["steps"][0].save_as
+
+
+def test_shared_results_are_not_pushed(engine: sa.engine.Engine) -> None:
+    """An extraction used by two steps keeps its original query."""
+    steps = [
+        FraguaStep(
+            set_name="extraction",
+            function="extract_from_database",
+            params={"engine": engine, "query": "SELECT * FROM readings"},
+            save_as="raw",
+        ),
+        FraguaStep(
+            set_name="transformation",
+            function="filter_by_min_value",
+            params={"column": "id", "min_value": 2},
+            use="raw",
+        ),
+        FraguaStep(
+            set_name="transformation",
+            function="select_columns",
+            params={"columns": ["label"]},
+            save_as="labels",
+            use="raw",
+        ),
+    ]
+
+    plan = plan_pushdown(steps)
+
+    assert plan["steps"] == steps
+    assert not plan["pushdowns"]
+
+
+def test_values_without_sql_literals_are_not_pushed(
+    engine: sa.engine.Engine,
+) -> None:
+    """A filter whose value cannot be rendered as SQL stays a pandas step."""
+    steps = chain(
+        FraguaStep(
+            set_name="extraction",
+            function="extract_from_database",
+            params={"engine": engine, "query": "SELECT * FROM readings"},
+            save_as="raw",
+        ),
+        ("filter_by_min_value", {"column": "id", "min_value": object()}),
+    )
+
+    assert plan_pushdown(steps)["steps"] == steps
+
+
+def test_filters_on_projected_away_columns_are_not_pushed(tmp_path: Path) -> None:
+    """A filter after a projection that dropped its column stays a step."""
+    steps = chain(
+        FraguaStep(
+            set_name="extraction",
+            function="extract_from_csv",
+            params={"path": str(tmp_path / "readings.csv")},
+            save_as="raw",
+        ),
+        ("select_columns", {"columns": ["label"]}),
+        ("filter_by_min_value", {"column": "id", "min_value": 2}),
+    )
+
+    plan = plan_pushdown(steps)
+
+    assert [step.function for step in plan["steps"]] == [
+        "extract_from_csv",
+        "filter_by_min_value",
+    ]
+    assert plan["steps"][0].params["columns"] == ["label"]
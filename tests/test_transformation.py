@@ -0,0 +1,269 @@
+"""Tests of the transformation functions."""
+
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Union
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from fragua_sets.functions.transformation import (
+    TransformationStep,
+    apply_transformations,
+    apply_transformations_parallel,
+    column_means,
+    create_sum_column,
+    fill_missing_values,
+    fill_nulls_with_value,
+    filter_by_min_value,
+    normalize_string_columns,
+    optimize_memory,
+    parse_datetime_column,
+    rename_columns,
+    sort_by_column,
+)
+from fragua_sets.utils.chunks import collect_chunks
+
+
+@pytest.fixture(name="frame")
+def fixture_frame() -> pd.DataFrame:
+    """Small frame with missing values and an unsorted column."""
+    return pd.DataFrame(
+        {
+            "a": [5.0, 1.0, None, 4.0, 2.0, 8.0, 3.0, 7.0],
+            "b": [1.0, 2.0, 3.0, None, 5.0, 6.0, 7.0, 8.0],
+            "label": ["x", None, "y", "x", "z", None, "y", "x"],
+        }
+    )
+
+
+PARALLEL_CHAINS = {
+    "filtered": [
+        (filter_by_min_value, {"column": "a", "min_value": 3}),
+        (create_sum_column, {"col_a": "a", "col_b": "b", "new_col": "s"}),
+    ],
+    "reordered": [
+        fill_missing_values,
+        (sort_by_column, {"column": "a", "ascending": False}),
+        (rename_columns, {"mapping": {"a": "z"}}),
+    ],
+    "empty": [
+        (filter_by_min_value, {"column": "a", "min_value": 100}),
+        (sort_by_column, {"column": "a"}),
+        (rename_columns, {"mapping": {"a": "z"}}),
+    ],
+}
+
+
+@pytest.mark.parametrize("name", sorted(PARALLEL_CHAINS))
+def test_parallel_chain_matches_serial(frame: pd.DataFrame, name: str) -> None:
+    """Partitioned runs give the serial result, including empty ones."""
+    steps: List[TransformationStep] = PARALLEL_CHAINS[name]
+
+    serial = apply_transformations(frame, steps)
+    parallel = apply_transformations_parallel(frame, steps, max_workers=2)
+
+    pd.testing.assert_frame_equal(parallel, serial)
+
+
+def test_parallel_chains_from_several_threads(frame: pd.DataFrame) -> None:
+    """Concurrent calls keep their own partitions and steps."""
+    chains = [PARALLEL_CHAINS["filtered"], PARALLEL_CHAINS["reordered"]] * 2
+
+    with ThreadPoolExecutor(max_workers=len(chains)) as pool:
+        results = list(
+            pool.map(
+                lambda steps: apply_transformations_parallel(
+                    frame, steps, max_workers=2
+                ),
+                chains,
+            )
+        )
+
+    for steps, result in zip(chains, results):
+        pd.testing.assert_frame_equal(result, apply_transformations(frame, steps))
+
+
+def test_parse_datetime_column_same_dtype_in_parallel() -> None:
+    """Whole-column detection is not split across partitions."""
+    frame = pd.DataFrame(
+        {"t": ["2024-01-01 10:00"] * 4 + ["2024-01-01 10:00+02:00"] * 4}
+    )
+    steps: List[TransformationStep] = [(parse_datetime_column, {"column": "t"})]
+
+    serial = apply_transformations(frame, steps)
+    parallel = apply_transformations_parallel(frame, steps, max_workers=2)
+
+    assert isinstance(serial, pd.DataFrame)
+    assert str(serial["t"].dtype).endswith("UTC]")
+    pd.testing.assert_frame_equal(parallel, serial)
+
+
+def test_parse_datetime_column_chunks_need_fixed_format() -> None:
+    """Chunk streams are parsed only with a fixed format."""
+    chunks = [pd.DataFrame({"t": ["01/02/2024"]}), pd.DataFrame({"t": ["13/02/2024"]})]
+
+    with pytest.raises(ValueError):
+        parse_datetime_column(iter(chunks), "t")
+
+    parsed = collect_chunks(
+        parse_datetime_column(iter(chunks), "t", date_format="%d/%m/%Y")
+    )
+    assert parsed["t"].dt.month.tolist() == [2, 2]
+
+
+def test_normalize_string_columns_all_null_column() -> None:
+    """A string column without values is kept as missing values."""
+    frame = pd.DataFrame(
+        {"empty": pd.Series([None, None], dtype=object), "s": [" a", "b "]}
+    )
+
+    result = normalize_string_columns(frame, columns=["empty", "s"], case="upper")
+
+    assert result["empty"].isna().all()
+    assert result["s"].tolist() == ["A", "B"]
+
+
+def test_two_phase_fill_with_integer_labels() -> None:
+    """Means keep the labels of frames read without a header."""
+    chunks = [
+        pd.DataFrame({0: [1.0, None], 1: ["a", None]}),
+        pd.DataFrame({0: [None, 5.0], 1: [None, "b"]}),
+    ]
+
+    means = column_means(iter(chunks))
+    filled = collect_chunks(fill_missing_values(iter(chunks), means=means))
+
+    assert means == {0: 3.0}
+    assert filled[0].tolist() == [1.0, 3.0, 3.0, 5.0]
+    assert not filled.isna().any().any()
+
+
+def test_chain_modifies_only_its_own_frame(frame: pd.DataFrame) -> None:
+    """Steps write into the chain's frame, never into other frames."""
+    lookup = frame.copy()
+
+    def sum_lookup(df: pd.DataFrame) -> pd.DataFrame:
+        create_sum_column(lookup, col_a="a", col_b="b", new_col="s")
+        return df
+
+    steps: List[TransformationStep] = [
+        sum_lookup,
+        (create_sum_column, {"col_a": "a", "col_b": "b", "new_col": "s"}),
+    ]
+
+    result = apply_transformations(frame, steps, copy=False)
+
+    assert result is frame
+    assert "s" not in lookup
+
+
+def test_chain_writes_into_filtered_frames(frame: pd.DataFrame) -> None:
+    """Filtered results are copied before a later step writes into them."""
+    original = frame.copy()
+    steps: List[TransformationStep] = [
+        (filter_by_min_value, {"column": "a", "min_value": 3}),
+        (create_sum_column, {"col_a": "a", "col_b": "b", "new_col": "s"}),
+        (fill_nulls_with_value, {"column": "s", "value": 0.0}),
+    ]
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        result = apply_transformations(frame, steps, copy=False)
+
+    assert isinstance(result, pd.DataFrame)
+    assert result["s"].tolist() == [6.0, 0.0, 14.0, 10.0, 15.0]
+    pd.testing.assert_frame_equal(frame, original)
+
+
+def test_optimize_memory_picks_safe_dtypes() -> None:
+    """Integers stay int32 or wider unless narrowing is asked for."""
+    frame = pd.DataFrame(
+        {
+            "small": [1, 2, 3, 4],
+            "big": [0, 2**40, 1, 2],
+            "ratio": [0.5, 0.25, 1.5, 2.0],
+            "precise": [0.1, 0.2, 0.3, 0.4],
+            "city": ["a", "b", "a", "a"],
+        }
+    )
+
+    result = optimize_memory(frame, arrow_strings=False)
+    narrowed = optimize_memory(frame, narrow_ints=True, arrow_strings=False)
+
+    assert isinstance(result, pd.DataFrame) and isinstance(narrowed, pd.DataFrame)
+    assert {col: str(dtype) for col, dtype in result.dtypes.items()} == {
+        "small": "int32",
+        "big": "int64",
+        "ratio": "float32",
+        "precise": "float64",
+        "city": "category",
+    }
+    assert str(narrowed["small"].dtype) == "uint8"
+    pd.testing.assert_frame_equal(result.astype(frame.dtypes), frame)
+    report = result.attrs["memory_report"]
+    assert report["after_bytes"] < report["before_bytes"]
+
+
+def test_optimize_memory_chunks_use_a_dtype_map() -> None:
+    """Chunk streams take the dtype map of a sample."""
+    sample = optimize_memory(pd.DataFrame({"a": [1, 2]}), arrow_strings=False)
+    assert isinstance(sample, pd.DataFrame)
+    chunks = iter([pd.DataFrame({"a": [1]}), pd.DataFrame({"a": [2]})])
+
+    with pytest.raises(ValueError):
+        optimize_memory(iter([]))
+
+    result = collect_chunks(optimize_memory(chunks, dtypes=sample.attrs["dtype_map"]))
+    assert str(result["a"].dtype) == "int32"
+
+
+@pytest.fixture(name="unsorted")
+def fixture_unsorted() -> pd.DataFrame:
+    """Frame with ties and missing keys, in random order."""
+    rng = np.random.default_rng(7)
+    keys = rng.integers(0, 20, 1_000).astype(float)
+    keys[rng.choice(1_000, 50, replace=False)] = np.nan
+    return pd.DataFrame(
+        {"key": keys, "group": rng.choice(list("abc"), 1_000), "row": range(1_000)}
+    )
+
+
+@pytest.mark.parametrize(
+    ("column", "ascending"),
+    [("key", True), ("key", False), (["group", "key"], [True, False])],
+)
+def test_external_sort_matches_sort_values(
+    unsorted: pd.DataFrame,
+    tmp_path: Path,
+    column: Union[str, List[str]],
+    ascending: Union[bool, List[bool]],
+) -> None:
+    """Spilled runs merge into the stable in-memory order."""
+    chunks = (unsorted.iloc[start : start + 128] for start in range(0, 1_000, 128))
+
+    result = sort_by_column(
+        chunks, column, ascending, chunksize=100, spill_dir=str(tmp_path)
+    )
+
+    expected = unsorted.sort_values(column, ascending=ascending, kind="stable")
+    pd.testing.assert_frame_equal(
+        collect_chunks(result), expected.reset_index(drop=True)
+    )
+    assert not list(tmp_path.iterdir())
+
+
+@pytest.mark.parametrize("ascending", [True, False])
+def test_top_k_matches_sorted_head(unsorted: pd.DataFrame, ascending: bool) -> None:
+    """top_k keeps the leading rows of the stable sort, ties included."""
+    expected = unsorted.sort_values("key", ascending=ascending, kind="stable").head(25)
+    chunks = (unsorted.iloc[start : start + 300] for start in range(0, 1_000, 300))
+
+    frame_top = sort_by_column(unsorted, "key", ascending, top_k=25)
+    stream_top = sort_by_column(chunks, "key", ascending, top_k=25)
+
+    assert isinstance(frame_top, pd.DataFrame) and isinstance(stream_top, pd.DataFrame)
+    assert frame_top["row"].tolist() == expected["row"].tolist()
+    assert stream_top["row"].tolist() == expected["row"].tolist()